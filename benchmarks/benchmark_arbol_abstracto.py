@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark del AST (bajar_arbol)
+===============================
+Compara el árbol sintáctico que construye `analizador_sintactico_generado`
+con el AST que `bajar_arbol` obtiene de él: número de nodos y tiempo de
+recorrerlos todos. Mide también lo que cuesta bajar el árbol y el tiempo
+de las fases que ahora recorren el AST (tabla de símbolos, verificación
+de variables, verificación de tipos y generación de assembly MIPS) sobre
+un programa generado con varias funciones, condicionales y llamadas.
+"""
+
+import io
+import os
+import sys
+import gc
+import time
+import argparse
+import contextlib
+
+DIRECTORIO_RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(DIRECTORIO_RAIZ, 'compilador'))
+
+import lexico
+import sintactico
+from assembly_mips import GeneradorAssemblyMIPS
+
+# Cada función aporta 67 tokens.
+FUNCION = """fn f{0} (a int, b int) int {{
+    x int = a + b * 2;
+    if (x > a) {{
+        x = x - 1;
+    }} else {{
+        x = (a + b) * 3;
+    }}
+    if (x < b) {{
+        x = x + f{0}(a, 2);
+    }}
+    return x;
+}}
+"""
+TOKENS_FUNCION = 67
+
+def generar_programa(numero_tokens):
+    """Genera funciones y un main hasta tener aproximadamente `numero_tokens` tokens"""
+    funciones = max(1, numero_tokens // TOKENS_FUNCION)
+    return "".join(FUNCION.format(i) for i in range(funciones)) + "fn main() int {\n    return 0;\n}\n"
+
+def recorrer(raiz):
+    """Visita todos los nodos de un árbol; retorna cuántos son"""
+    nodos = 0
+    pendientes = [raiz]
+    while pendientes:
+        nodo = pendientes.pop()
+        nodos += 1
+        pendientes.extend(nodo.hijos)
+    return nodos
+
+def cronometrar(funcion, *argumentos):
+    """Mejor de tres tiempos de una llamada, con el recolector desactivado; retorna (tiempo, resultado)"""
+    mejor = None
+    for _ in range(3):
+        gc.collect()
+        gc.disable()
+        inicio = time.perf_counter()
+        resultado = funcion(*argumentos)
+        tiempo = time.perf_counter() - inicio
+        gc.enable()
+        mejor = tiempo if mejor is None else min(mejor, tiempo)
+    return mejor, resultado
+
+def fases(arbol_abstracto):
+    """Ejecuta las fases que recorren el AST como lo hace compilar(); retorna sus tiempos"""
+    sintactico.errores_semanticos.clear()
+    tiempos = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        tiempos['Tabla de símbolos'], _ = cronometrar(lambda: sintactico.construir_tabla_simbolos(
+            arbol_abstracto, sintactico.TablaSimbolos()))
+        tabla_simbolos = sintactico.TablaSimbolos()
+        sintactico.construir_tabla_simbolos(arbol_abstracto, tabla_simbolos)
+        # verificar_variable consume los ámbitos de la tabla: cada repetición usa una copia.
+        copias = [sintactico.crear_copia_tabla_simbolos(tabla_simbolos) for _ in range(3)]
+        tiempos['Verificar variables'], _ = cronometrar(
+            lambda: sintactico.verificar_variable(arbol_abstracto, copias.pop()))
+        tiempos['Verificar tipos'], _ = cronometrar(lambda: sintactico.verificar_tipos_completo(
+            arbol_abstracto, tabla_simbolos, [], sintactico.VerificadorTipos()))
+        tiempos['Assembly MIPS'], _ = cronometrar(
+            lambda: GeneradorAssemblyMIPS().generar(arbol_abstracto, tabla_simbolos))
+    sintactico.errores_semanticos.clear()
+    return tiempos
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del AST frente al árbol sintáctico")
+    parser.add_argument('--tokens', type=int, default=100_000, help='Tokens del programa generado')
+    args = parser.parse_args()
+
+    tabla_ll1 = sintactico.cargar_tabla_ll1(sintactico.ruta_archivo_ll1)
+    lista_de_tokens, _ = lexico.analizar_lexico(generar_programa(args.tokens))
+    lista_de_tokens.append(lexico.Token("$", "$", None, None))
+    respuesta, arbol, _ = sintactico.analizador_sintactico_generado(lista_de_tokens, tabla_ll1)
+    if not respuesta:
+        print("❌ El programa generado no se analizó correctamente")
+        sys.exit(1)
+
+    tiempo_bajar, arbol_abstracto = cronometrar(sintactico.bajar_arbol, arbol)
+    tiempo_cst, nodos_cst = cronometrar(recorrer, arbol)
+    tiempo_ast, nodos_ast = cronometrar(recorrer, arbol_abstracto)
+
+    print(f"📄 {len(lista_de_tokens)} tokens")
+    print(f"{'Árbol':<22}{'Nodos':>10}{'Recorrer':>11}")
+    print(f"{'Sintáctico (CST)':<22}{nodos_cst:>10}{tiempo_cst:>10.3f}s")
+    print(f"{'AST':<22}{nodos_ast:>10}{tiempo_ast:>10.3f}s   "
+          f"({nodos_cst / nodos_ast:.1f}x menos nodos, {tiempo_cst / tiempo_ast:.1f}x más rápido)")
+    print(f"\n🔽 bajar_arbol: {tiempo_bajar:.3f}s")
+    for fase, tiempo in fases(arbol_abstracto).items():
+        print(f"   {fase:<20}{tiempo:>8.3f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark del Árbol Sintáctico en Arreglos (TreeArena)
+======================================================
+Compara el árbol de objetos Nodo que construyen `analizador_sintactico` y
+el parser generado con la TreeArena de `analizador_sintactico_arena`:
+memoria que ocupa el árbol, tiempo de construirlo, tiempo de una pasada
+completa del recolector de ciclos con el árbol vivo y tiempo de recorrerlo
+leyendo el tipo y el valor de cada nodo, como hacen las fases siguientes.
+"""
+
+import os
+import sys
+import gc
+import time
+import argparse
+import tracemalloc
+
+DIRECTORIO_RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(DIRECTORIO_RAIZ, 'compilador'))
+
+import lexico
+import sintactico
+from benchmark_sintactico import generar_programa
+
+def recorrer(raiz):
+    """Visita todos los nodos leyendo su tipo y su valor; retorna cuántos son"""
+    nodos = 0
+    pendientes = [raiz]
+    while pendientes:
+        nodo = pendientes.pop()
+        nodo.tipo
+        nodo.valor
+        nodos += 1
+        pendientes.extend(nodo.hijos)
+    return nodos
+
+def medir(analizador, lista_de_tokens, tabla_ll1):
+    """Memoria (MB) y tiempo de construcción, pasada del recolector y recorrido del árbol"""
+    gc.collect()
+    tracemalloc.start()
+    respuesta, arbol, _ = analizador(lista_de_tokens, tabla_ll1)
+    memoria = tracemalloc.get_traced_memory()[0] / (1024 * 1024)
+    tracemalloc.stop()
+    del arbol
+
+    # Mejor de tres construcciones, con el recolector desactivado como timeit.
+    construccion = None
+    for _ in range(3):
+        arbol = None
+        gc.collect()
+        gc.disable()
+        inicio = time.perf_counter()
+        respuesta, arbol, _ = analizador(lista_de_tokens, tabla_ll1)
+        tiempo = time.perf_counter() - inicio
+        gc.enable()
+        construccion = tiempo if construccion is None else min(construccion, tiempo)
+
+    inicio = time.perf_counter()
+    gc.collect()
+    recolector = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    nodos = recorrer(arbol)
+    recorrido = time.perf_counter() - inicio
+    if not respuesta:
+        print("❌ El programa generado no se analizó correctamente")
+        sys.exit(1)
+    return memoria, construccion, recolector, recorrido, nodos
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del árbol sintáctico en arreglos")
+    parser.add_argument('--tokens', type=int, default=100_000, help='Tokens del programa generado')
+    args = parser.parse_args()
+
+    tabla_ll1 = sintactico.cargar_tabla_ll1(sintactico.ruta_archivo_ll1)
+    sintactico.cargar_parser_generado(tabla_ll1, sintactico.ruta_gramatica)
+    lista_de_tokens, _ = lexico.analizar_lexico(generar_programa(args.tokens))
+    lista_de_tokens.append(lexico.Token("$", "$", None, None))
+
+    analizadores = {
+        'Nodo (pila)': sintactico.analizador_sintactico,
+        'Nodo (generado)': sintactico.analizador_sintactico_generado,
+        'TreeArena': sintactico.analizador_sintactico_arena,
+    }
+    print(f"{'Árbol':<18}{'Nodos':>9}{'Memoria':>11}{'B/nodo':>8}{'Construir':>11}{'GC':>9}{'Recorrer':>10}")
+    nodos_referencia = None
+    for nombre, analizador in analizadores.items():
+        memoria, construccion, recolector, recorrido, nodos = medir(analizador, lista_de_tokens, tabla_ll1)
+        if nodos_referencia not in (None, nodos):
+            print(f"❌ {nombre} construyó {nodos} nodos en lugar de {nodos_referencia}")
+            sys.exit(1)
+        nodos_referencia = nodos
+        print(f"{nombre:<18}{nodos:>9}{memoria:>9.1f}MB{memoria * 1024 * 1024 / nodos:>8.0f}"
+              f"{construccion:>10.3f}s{recolector:>8.3f}s{recorrido:>9.3f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark del Internado de Identificadores
+==========================================
+Genera un programa con muchas funciones que usan identificadores largos y
+repetidos, lo analiza con y sin la tabla de internado del Lexer y compara
+la memoria que retienen los valores de los tokens y el tiempo de buscar
+cada identificador en una TablaSimbolos con dos niveles de ámbito, como
+hacen buscar_simbolo y obtener_offset_variable.
+"""
+
+import os
+import sys
+import gc
+import time
+import argparse
+import tracemalloc
+
+DIRECTORIO_RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(DIRECTORIO_RAIZ, 'compilador'))
+
+import lexico
+from sintactico import TablaSimbolos
+
+def generar_programa(funciones, variables):
+    """Genera `funciones` funciones que declaran y combinan `variables` variables locales cada una"""
+    globales = [f"contador_global_de_iteraciones_{k}" for k in range(8)]
+    nombres = [f"variable_local_acumulada_numero_{k}" for k in range(variables)]
+    partes = []
+    for f in range(funciones):
+        partes.append(f"fn funcion_generada_{f} () int {{\n")
+        for nombre in nombres:
+            partes.append(f"    {nombre} int = {f};\n")
+        for k, nombre in enumerate(nombres):
+            otro = nombres[(k * 7 + 3) % variables]
+            partes.append(f"    {nombre} = {nombre} + {otro} * {globales[k % len(globales)]};\n")
+            partes.append(f'    print("{nombre}");\n')
+        partes.append("    return 0;\n}\n")
+    return ''.join(partes), globales
+
+def lexar(contenido, internar):
+    """Analiza el contenido con o sin tabla de internado y retorna el TokenBuffer"""
+    tokens = lexico.TokenBuffer(lexico.IndiceLineas(contenido))
+    tokens.extender(lexico._escanear(contenido, None, 0, [], tokens.indice_lineas,
+                                     internados={} if internar else None))
+    return tokens
+
+def memoria_valores(contenido, internar):
+    """Memoria (MB) que retienen los valores de los tokens"""
+    gc.collect()
+    tracemalloc.start()
+    tokens = lexar(contenido, internar)
+    valores = tokens.valores
+    tokens.tipos = tokens.inicios = tokens.indice_lineas = None
+    memoria = tracemalloc.get_traced_memory()[0] / (1024 * 1024)
+    tracemalloc.stop()
+    del valores
+    return memoria
+
+def tiempo_busquedas(tokens, globales, repeticiones):
+    """Mejor tiempo de buscar cada identificador como lo hacen las fases semánticas"""
+    identificadores = [valor for codigo, valor in zip(tokens.tipos, tokens.valores) if codigo == lexico.CODIGO_ID]
+    # Los símbolos se registran con la primera aparición de cada nombre, como
+    # agregar_simbolo con el valor del nodo de su declaración.
+    ambito_global = TablaSimbolos()
+    ambito_local = TablaSimbolos(padre=ambito_global)
+    for nombre in identificadores:
+        ambito = ambito_global if nombre in globales else ambito_local
+        ambito.simbolos.setdefault(nombre, {'tipo': 'int', 'categoria': 'variable'})
+    offsets = {nombre: -4 * k for k, nombre in enumerate(ambito_local.simbolos)}
+
+    mejor = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        for nombre in identificadores:
+            if ambito_local.buscar_simbolo(nombre) is not None and nombre in offsets:
+                offsets[nombre]
+        tiempo = time.perf_counter() - inicio
+        mejor = tiempo if mejor is None else min(mejor, tiempo)
+    return mejor, len(identificadores)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del internado de identificadores")
+    parser.add_argument('--funciones', type=int, default=100, help='Número de funciones generadas')
+    parser.add_argument('--variables', type=int, default=200, help='Variables locales por función')
+    parser.add_argument('--repeticiones', type=int, default=20, help='Repeticiones de las búsquedas')
+    args = parser.parse_args()
+
+    contenido, globales = generar_programa(args.funciones, args.variables)
+    globales = set(globales)
+
+    tokens_sin = lexar(contenido, False)
+    tokens_con = lexar(contenido, True)
+    assert list(tokens_sin.tipos) == list(tokens_con.tipos) and tokens_sin.valores == tokens_con.valores
+    distintos = len({id(v) for v in tokens_con.valores if isinstance(v, str)})
+
+    memoria_sin = memoria_valores(contenido, False)
+    memoria_con = memoria_valores(contenido, True)
+    tiempo_sin, busquedas = tiempo_busquedas(tokens_sin, globales, args.repeticiones)
+    tiempo_con, _ = tiempo_busquedas(tokens_con, globales, args.repeticiones)
+
+    print(f"📄 Fuente: {len(contenido) / (1024 * 1024):.1f} MB, {len(tokens_con)} tokens, "
+          f"{distintos} valores de texto distintos")
+    print(f"📦 Valores sin internar: {memoria_sin:8.1f} MB")
+    print(f"📦 Valores internados:   {memoria_con:8.1f} MB  ({memoria_sin / memoria_con:.1f}x menos)")
+    print(f"🔎 {busquedas} búsquedas sin internar: {tiempo_sin:.3f}s")
+    print(f"🔎 {busquedas} búsquedas internadas:   {tiempo_con:.3f}s  ({tiempo_sin / tiempo_con:.2f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark del Analizador Léxico
+===============================
+Compara el analizador léxico basado en la expresión regular maestra
+(`analizar_lexico`) con el recorrido carácter a carácter original
+(`analizar_lexico_clasico`) sobre un código fuente generado de varios
+megabytes, y verifica que ambos produzcan los mismos tokens y errores. Solo
+se comparan tipos, valores y mensajes: el recorrido clásico conserva sus
+contadores de línea y columna, y analizar_lexico da posiciones exactas.
+"""
+
+import os
+import sys
+import time
+import argparse
+
+DIRECTORIO_RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(DIRECTORIO_RAIZ, 'compilador'))
+
+import lexico
+
+def generar_fuente(megabytes):
+    """Genera un código fuente repitiendo los ejemplos de codigos-bocetos"""
+    directorio_ejemplos = os.path.join(DIRECTORIO_RAIZ, 'codigos-bocetos')
+    ejemplos = []
+    for nombre in sorted(os.listdir(directorio_ejemplos)):
+        if nombre.endswith('.txt'):
+            with open(os.path.join(directorio_ejemplos, nombre), 'r', encoding='utf-8') as f:
+                ejemplos.append(f.read())
+    bloque = '\n/* bloque\n de prueba */\n'.join(ejemplos) + '\n// fin de bloque\n'
+    repeticiones = max(1, int(megabytes * 1024 * 1024 / len(bloque.encode('utf-8'))))
+    return bloque * repeticiones
+
+def medir(funcion, contenido, repeticiones):
+    """Ejecuta la función de análisis y retorna el mejor tiempo y los resultados"""
+    mejor = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        lista_de_tokens, lista_errores = funcion(contenido)
+        tiempo = time.perf_counter() - inicio
+        mejor = tiempo if mejor is None else min(mejor, tiempo)
+    tokens = [(t.tipo, t.valor) for t in lista_de_tokens]
+    errores = [e.mensaje for e in lista_errores]
+    return mejor, tokens, errores
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del analizador léxico")
+    parser.add_argument('--megabytes', type=float, default=4.0, help='Tamaño del código generado')
+    parser.add_argument('--repeticiones', type=int, default=3, help='Repeticiones por implementación')
+    args = parser.parse_args()
+
+    contenido = generar_fuente(args.megabytes)
+    print(f"📄 Código generado: {len(contenido.encode('utf-8')) / (1024 * 1024):.2f} MB")
+
+    tiempo_clasico, tokens_clasico, errores_clasico = medir(lexico.analizar_lexico_clasico, contenido, args.repeticiones)
+    tiempo_regex, tokens_regex, errores_regex = medir(lexico.analizar_lexico, contenido, args.repeticiones)
+
+    print(f"🔤 Tokens: {len(tokens_regex)}  Errores léxicos: {len(errores_regex)}")
+    print(f"🐢 Carácter a carácter: {tiempo_clasico:.3f}s")
+    print(f"🚀 Expresión maestra:   {tiempo_regex:.3f}s")
+    print(f"📈 Aceleración: {tiempo_clasico / tiempo_regex:.2f}x")
+
+    if tokens_clasico != tokens_regex or errores_clasico != errores_regex:
+        print("❌ Las salidas de ambos analizadores difieren")
+        sys.exit(1)
+    print("✅ Ambos analizadores producen los mismos tokens y errores")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark del Análisis Léxico Vectorizado con NumPy
+===================================================
+Compara el recorrido carácter a carácter (`analizar_lexico_clasico`), la
+expresión regular maestra (`analizar_lexico`) y la pre-pasada vectorizada
+de clases de carácter (`analizar_lexico_numpy`) sobre varios tipos de
+código generado, para ver dónde gana cada uno, y verifica que
+analizar_lexico_numpy produzca los mismos tokens y errores que
+analizar_lexico.
+"""
+
+import os
+import sys
+import time
+import argparse
+
+DIRECTORIO_RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(DIRECTORIO_RAIZ, 'compilador'))
+
+import lexico
+from lexico_numpy import analizar_lexico_numpy
+from benchmark_lexico import generar_fuente
+
+def repetir(bloque, megabytes):
+    """Repite un bloque de código hasta el tamaño pedido"""
+    return bloque * max(1, int(megabytes * 1024 * 1024 / len(bloque)))
+
+def generar_casos(megabytes):
+    """Códigos de distinto perfil: ejemplos reales, identificadores largos, mucha indentación, cadenas y comentarios"""
+    return {
+        'codigos-bocetos': generar_fuente(megabytes),
+        'identificadores largos': repetir(
+            "    acumulador_total_de_la_suma = acumulador_total_de_la_suma + valor_leido_de_entrada * 2;\n", megabytes),
+        'indentación profunda': repetir(
+            "                                x = y;\n                                if (x <= 10) { show(x); }\n", megabytes),
+        'operadores densos': repetir("a=b+c*d-(e/f)%g;x==y!=z<=w>=v&&u||t;\n", megabytes),
+        'cadenas y comentarios': repetir(
+            '    show("un texto de salida bastante largo para el programa"); // comentario al final\n'
+            '    /* comentario de bloque\n       de varias líneas */\n', megabytes),
+    }
+
+def medir(funcion, contenido, repeticiones):
+    """Mejor tiempo de varias ejecuciones y el último resultado"""
+    mejor = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion(contenido)
+        tiempo = time.perf_counter() - inicio
+        mejor = tiempo if mejor is None else min(mejor, tiempo)
+    return mejor, resultado
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del análisis léxico vectorizado con NumPy")
+    parser.add_argument('--megabytes', type=float, default=1.0, help='Tamaño de cada código generado')
+    parser.add_argument('--repeticiones', type=int, default=3, help='Repeticiones por implementación')
+    parser.add_argument('--sin-clasico', action='store_true', help='No medir el recorrido carácter a carácter')
+    args = parser.parse_args()
+
+    iguales = True
+    print(f"{'Código':<24}{'Tokens':>10}{'Clásico':>10}{'Regex':>10}{'NumPy':>10}{'NumPy/Regex':>13}")
+    for nombre, contenido in generar_casos(args.megabytes).items():
+        tiempo_clasico = None
+        if not args.sin_clasico:
+            tiempo_clasico, _ = medir(lexico.analizar_lexico_clasico, contenido, 1)
+        tiempo_regex, (tokens_regex, errores_regex) = medir(lexico.analizar_lexico, contenido, args.repeticiones)
+        tiempo_numpy, (tokens_numpy, errores_numpy) = medir(analizar_lexico_numpy, contenido, args.repeticiones)
+
+        clasico = f"{tiempo_clasico:.3f}s" if tiempo_clasico is not None else '-'
+        print(f"{nombre:<24}{len(tokens_regex):>10}{clasico:>10}{tiempo_regex:>9.3f}s{tiempo_numpy:>9.3f}s"
+              f"{tiempo_regex / tiempo_numpy:>12.2f}x")
+
+        if (tokens_regex.tipos != tokens_numpy.tipos or tokens_regex.valores != tokens_numpy.valores
+                or tokens_regex.inicios != tokens_numpy.inicios
+                or [str(e) for e in errores_regex] != [str(e) for e in errores_numpy]):
+            print(f"❌ Los tokens de '{nombre}' difieren")
+            iguales = False
+
+    if not iguales:
+        sys.exit(1)
+    print("✅ analizar_lexico_numpy produce los mismos tokens y errores que analizar_lexico")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark del Análisis Léxico Paralelo
+======================================
+Mide `analizar_lexico_paralelo` con distinto número de procesos sobre un
+código fuente generado de varios megabytes, frente a `analizar_lexico`
+secuencial, y verifica que todas las ejecuciones produzcan los mismos
+tokens y errores.
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+DIRECTORIO_RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(DIRECTORIO_RAIZ, 'compilador'))
+
+import lexico
+import lexico_paralelo
+from benchmark_lexico import generar_fuente
+
+def resumen(tokens, errores):
+    """Tokens y errores como tuplas comparables"""
+    return ([(t.codigo, t.valor, t.inicio) for t in tokens],
+            [(e.mensaje, e.linea, e.columna, e.inicio) for e in errores])
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del análisis léxico paralelo")
+    parser.add_argument('--megabytes', type=float, default=8.0, help='Tamaño del código generado')
+    parser.add_argument('--procesos', type=int, nargs='+', help='Números de procesos a medir')
+    args = parser.parse_args()
+
+    nucleos = os.cpu_count() or 1
+    procesos = args.procesos or sorted({1, 2, 4, nucleos})
+    contenido = generar_fuente(args.megabytes)
+    print(f"📄 Código generado: {len(contenido.encode('utf-8')) / (1024 * 1024):.2f} MB  Núcleos: {nucleos}")
+
+    tiempo_secuencial = None
+    for _ in range(2):
+        inicio = time.perf_counter()
+        resultado = lexico.analizar_lexico(contenido)
+        tiempo = time.perf_counter() - inicio
+        tiempo_secuencial = tiempo if tiempo_secuencial is None else min(tiempo_secuencial, tiempo)
+    referencia = resumen(*resultado)
+    print(f"🐢 Secuencial:   {tiempo_secuencial:.3f}s")
+
+    distintos = False
+    for cantidad in procesos:
+        # El pool se crea antes de medir, como en un proceso que analiza muchos archivos.
+        with ProcessPoolExecutor(max_workers=cantidad) as ejecutor:
+            list(ejecutor.map(abs, range(cantidad)))
+            inicio = time.perf_counter()
+            resultado = lexico_paralelo.analizar_lexico_paralelo(contenido, cantidad, ejecutor)
+            tiempo = time.perf_counter() - inicio
+        distintos = distintos or resumen(*resultado) != referencia
+        print(f"🚀 {cantidad:2d} procesos: {tiempo:.3f}s  ({tiempo_secuencial / tiempo:.2f}x)")
+
+    if distintos:
+        print("❌ El análisis paralelo difiere del secuencial")
+        sys.exit(1)
+    print("✅ El análisis paralelo produce los mismos tokens y errores")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Memoria de los Tokens
+==================================
+Mide la memoria que ocupa una lista de objetos Token frente a un TokenBuffer
+con los mismos tokens, usando tracemalloc sobre un código generado con el
+número de tokens pedido (1M por defecto).
+"""
+
+import os
+import sys
+import gc
+import time
+import argparse
+import tracemalloc
+
+DIRECTORIO_RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(DIRECTORIO_RAIZ, 'compilador'))
+
+import lexico
+from benchmark_lexico import generar_fuente
+
+def generar_tuplas(numero_tokens):
+    """Obtiene al menos `numero_tokens` tuplas (codigo, valor, inicio) y el índice de líneas de su texto"""
+    contenido = generar_fuente(0.25)
+    indice_lineas = lexico.IndiceLineas(contenido)
+    tuplas = []
+    while len(tuplas) < numero_tokens:
+        tuplas.extend(lexico._escanear(contenido, None, 0, [], indice_lineas))
+    return tuplas[:numero_tokens], indice_lineas
+
+def medir(construir):
+    """Retorna la memoria retenida (MB) y el tiempo de construcción"""
+    gc.collect()
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultado = construir()
+    tiempo = time.perf_counter() - inicio
+    memoria = tracemalloc.get_traced_memory()[0] / (1024 * 1024)
+    tracemalloc.stop()
+    del resultado
+    return memoria, tiempo
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de memoria de los tokens")
+    parser.add_argument('--tokens', type=int, default=1_000_000, help='Número de tokens')
+    args = parser.parse_args()
+
+    # Los valores se copian para que cada estructura pague por sus propios objetos,
+    # como ocurre al analizar un archivo.
+    tuplas, indice_lineas = generar_tuplas(args.tokens)
+    # La lista de Token guarda la línea y la columna de cada token.
+    posiciones = [indice_lineas.posicion(i) for _, _, i in tuplas]
+
+    def construir_lista():
+        return [lexico.Token(lexico.nombres_tipos_token[t], v if not isinstance(v, str) else ''.join(v), l, c)
+                for (t, v, _), (l, c) in zip(tuplas, posiciones)]
+
+    def construir_buffer():
+        buffer = lexico.TokenBuffer(indice_lineas)
+        buffer.extender((t, v if not isinstance(v, str) else ''.join(v), i) for t, v, i in tuplas)
+        return buffer
+
+    memoria_lista, tiempo_lista = medir(construir_lista)
+    memoria_buffer, tiempo_buffer = medir(construir_buffer)
+
+    print(f"🔤 Tokens: {len(tuplas)}")
+    print(f"📦 Lista de Token: {memoria_lista:8.1f} MB  ({tiempo_lista:.3f}s)")
+    print(f"📦 TokenBuffer:    {memoria_buffer:8.1f} MB  ({tiempo_buffer:.3f}s)")
+    print(f"📉 Reducción: {memoria_lista / memoria_buffer:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark del Análisis Léxico sobre mmap
+========================================
+Compara `Lexer.lex_archivo` (lee y decodifica el archivo completo) con
+`Lexer.lex_mmap` (recorre los bytes proyectados en memoria) sobre un
+archivo generado de varios megabytes, midiendo tiempo y memoria, y
+verifica que ambos produzcan los mismos tokens y errores.
+"""
+
+import os
+import sys
+import time
+import tempfile
+import argparse
+import tracemalloc
+
+DIRECTORIO_RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(DIRECTORIO_RAIZ, 'compilador'))
+
+import lexico
+from benchmark_lexico import generar_fuente
+
+def medir(analizar, ruta):
+    """Retorna el tiempo, la memoria retenida (MB) y el analizador usado.
+
+    La memoria se mide en una segunda ejecución porque tracemalloc
+    ralentiza mucho el análisis.
+    """
+    lexer = lexico.Lexer()
+    inicio = time.perf_counter()
+    analizar(lexer, ruta)
+    tiempo = time.perf_counter() - inicio
+
+    tracemalloc.start()
+    otro = lexico.Lexer()
+    analizar(otro, ruta)
+    memoria = tracemalloc.get_traced_memory()[0] / (1024 * 1024)
+    tracemalloc.stop()
+    return tiempo, memoria, lexer
+
+def resumen(lexer):
+    """Tokens y errores de un analizador como tuplas comparables"""
+    tokens = [(t.tipo, t.valor, t.linea, t.columna) for t in lexer.tokens]
+    errores = [(e.mensaje, e.linea, e.columna) for e in lexer.errores]
+    return tokens, errores
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del análisis léxico sobre mmap")
+    parser.add_argument('--megabytes', type=float, default=4.0, help='Tamaño del código generado')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, 'fuente.txt')
+        with open(ruta, 'w', encoding='utf-8') as f:
+            f.write(generar_fuente(args.megabytes))
+        print(f"📄 Código generado: {os.path.getsize(ruta) / (1024 * 1024):.2f} MB")
+
+        tiempo_texto, memoria_texto, lexer_texto = medir(lexico.Lexer.lex_archivo, ruta)
+        tiempo_mmap, memoria_mmap, lexer_mmap = medir(lexico.Lexer.lex_mmap, ruta)
+
+        print(f"🔤 Tokens: {len(lexer_mmap.tokens)}")
+        print(f"📝 Texto decodificado: {tiempo_texto:.3f}s  {memoria_texto:8.1f} MB")
+        print(f"🗺️  mmap de bytes:      {tiempo_mmap:.3f}s  {memoria_mmap:8.1f} MB  "
+              f"({tiempo_texto / tiempo_mmap:.2f}x tiempo, {memoria_texto / memoria_mmap:.2f}x memoria)")
+
+        iguales = resumen(lexer_texto) == resumen(lexer_mmap)
+        lexer_mmap.fuente.close()
+
+    if not iguales:
+        print("❌ Los tokens del análisis sobre mmap difieren")
+        sys.exit(1)
+    print("✅ Ambos modos producen los mismos tokens y errores")
+
+if __name__ == "__main__":
+    main()
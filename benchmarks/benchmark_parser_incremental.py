@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark del Análisis Incremental por Funciones
+================================================
+Genera un programa con muchas funciones, edita una de ellas y compara el
+tiempo de volver a analizar todos los tokens con `analizador_sintactico_generado`
+frente a `ParserIncremental`, que solo analiza la función editada y reutiliza
+el subárbol de las demás. Se mide una edición que no cambia las líneas del
+archivo y otra que agrega una línea, con la que cambian las posiciones de
+todas las funciones siguientes.
+"""
+
+import io
+import os
+import sys
+import gc
+import time
+import argparse
+import contextlib
+
+DIRECTORIO_RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(DIRECTORIO_RAIZ, 'compilador'))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import sintactico
+from lexico import Lexer
+from parser_incremental import ParserIncremental
+
+FUNCION = """fn f{0} (a int, b int) int {{
+    x int = a + b * {1};
+    if (x > a) {{
+        x = x - 1;
+    }} else {{
+        x = (a + b) * 3;
+    }}
+    return x;
+}}
+"""
+
+def generar_programa(funciones, editada=None, edicion=None):
+    """Programa con `funciones` funciones y un main; `edicion` reemplaza el cuerpo de la función `editada`"""
+    partes = []
+    for i in range(funciones):
+        funcion = FUNCION.format(i, 2)
+        if i == editada:
+            funcion = edicion(funcion)
+        partes.append(funcion)
+    partes.append("fn main() int {\n    return 0;\n}\n")
+    return "".join(partes)
+
+def tokens_de(fuente):
+    tokens = Lexer().lex(fuente)
+    tokens.agregar('$', '$')
+    return tokens
+
+def cronometrar(funcion, *argumentos):
+    """Tiempo de una llamada con el recolector desactivado; retorna (tiempo, resultado)"""
+    gc.collect()
+    gc.disable()
+    inicio = time.perf_counter()
+    resultado = funcion(*argumentos)
+    tiempo = time.perf_counter() - inicio
+    gc.enable()
+    return tiempo, resultado
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del análisis incremental por funciones")
+    parser.add_argument('--funciones', type=int, default=500, help='Funciones del programa generado')
+    args = parser.parse_args()
+
+    tabla_ll1 = sintactico.cargar_tabla_ll1(sintactico.ruta_archivo_ll1)
+    incremental = ParserIncremental(tabla_ll1, sintactico.analizador_sintactico_generado, sintactico.Nodo)
+    editada = args.funciones // 2
+    ediciones = {
+        'Sin cambiar líneas': lambda funcion: funcion.replace('b * 2', 'b * 7'),
+        'Agregando una línea': lambda funcion: funcion.replace('return x;', 'x = x + 1;\n    return x;'),
+    }
+
+    tokens = tokens_de(generar_programa(args.funciones))
+    print(f"📄 {args.funciones} funciones, {len(tokens)} tokens")
+    tiempo, _ = cronometrar(incremental.analizar, tokens)
+    print(f"   {'Primer análisis (incremental)':<32}{tiempo:>8.3f}s  ({incremental.reanalizadas} funciones analizadas)")
+
+    for nombre, edicion in ediciones.items():
+        tokens = tokens_de(generar_programa(args.funciones, editada, edicion))
+        tiempo_completo, (exito, _, _) = cronometrar(sintactico.analizador_sintactico_generado, tokens, tabla_ll1)
+        tiempo_incremental, (exito_incremental, _, _) = cronometrar(incremental.analizar, tokens)
+        assert exito and exito_incremental
+        print(f"\n✏️  {nombre}")
+        print(f"   {'Análisis completo':<32}{tiempo_completo:>8.3f}s")
+        print(f"   {'Incremental':<32}{tiempo_incremental:>8.3f}s  "
+              f"({incremental.reanalizadas} reanalizadas, {incremental.reutilizadas} reutilizadas, "
+              f"{tiempo_completo / tiempo_incremental:.1f}x)")
+        # La siguiente edición parte otra vez del programa original.
+        incremental.analizar(tokens_de(generar_programa(args.funciones)))
+
+if __name__ == "__main__":
+    main()
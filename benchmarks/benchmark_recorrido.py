@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Recorridos sobre Árboles Profundos (Visitante)
+===========================================================
+Genera un main con miles de instrucciones y una expresión con miles de
+términos, cuyas cadenas masinstrucciones y masexpresiones dan un árbol
+sintáctico de miles de niveles. Compara un recorrido recursivo del árbol
+con el Visitante de pila explícita y mide cada fase del compilador sobre
+el programa, con el límite de recursión por defecto.
+"""
+
+import io
+import os
+import sys
+import gc
+import time
+import argparse
+import contextlib
+
+DIRECTORIO_RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(DIRECTORIO_RAIZ, 'compilador'))
+
+import lexico
+import sintactico
+from recorrido import SALIR
+from recorrido import Visitante
+from assembly import GeneradorAssembly
+from assembly_mips import GeneradorAssemblyMIPS
+
+def generar_programa(instrucciones, terminos):
+    """main con `instrucciones` condicionales y una asignación de `terminos` términos"""
+    return ("fn main() int {\n    x int = 0;\n" + "    if (x < 1) {\n        x = x + 1;\n    }\n" * instrucciones +
+            "    x = " + " + ".join(["x"] * terminos) + ";\n    return x;\n}\n")
+
+def recorrer_recursivo(nodo):
+    """Cuenta los nodos con una función recursiva, como los recorridos anteriores"""
+    return 1 + sum(recorrer_recursivo(hijo) for hijo in nodo.hijos)
+
+class Contador(Visitante):
+    """Cuenta los nodos y la profundidad máxima con el Visitante"""
+
+    def __init__(self):
+        self.nodos = 0
+        self.profundidad = 0
+        self.nivel = 0
+
+    def entrar(self, nodo, padre):
+        self.nodos += 1
+        self.nivel += 1
+        self.profundidad = max(self.profundidad, self.nivel)
+        return SALIR
+
+    def salir(self, nodo, padre):
+        self.nivel -= 1
+
+def cronometrar(funcion):
+    """Tiempo de una llamada con el recolector desactivado; retorna (tiempo, resultado)"""
+    gc.collect()
+    gc.disable()
+    inicio = time.perf_counter()
+    resultado = funcion()
+    tiempo = time.perf_counter() - inicio
+    gc.enable()
+    return tiempo, resultado
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de recorridos sin recursión sobre árboles profundos")
+    parser.add_argument('--instrucciones', type=int, default=5000, help='Condicionales del main generado')
+    parser.add_argument('--terminos', type=int, default=5000, help='Términos de la expresión generada')
+    args = parser.parse_args()
+
+    tabla_ll1 = sintactico.cargar_tabla_ll1(sintactico.ruta_archivo_ll1)
+    lista_de_tokens, _ = lexico.analizar_lexico(generar_programa(args.instrucciones, args.terminos))
+    lista_de_tokens.append(lexico.Token("$", "$", None, None))
+    respuesta, arbol, _ = sintactico.analizador_sintactico_generado(lista_de_tokens, tabla_ll1)
+    if not respuesta:
+        print("❌ El programa generado no se analizó correctamente")
+        sys.exit(1)
+
+    print(f"📄 {len(lista_de_tokens)} tokens, límite de recursión {sys.getrecursionlimit()}")
+    contador = Contador()
+    tiempo, _ = cronometrar(lambda: contador.recorrer(arbol))
+    print(f"🌳 Árbol sintáctico: {contador.nodos} nodos, {contador.profundidad} niveles")
+    print(f"   {'Visitante':<20}{tiempo:>8.3f}s")
+    try:
+        tiempo, _ = cronometrar(lambda: recorrer_recursivo(arbol))
+        print(f"   {'Recursivo':<20}{tiempo:>8.3f}s")
+    except RecursionError:
+        print(f"   {'Recursivo':<20}  RecursionError")
+
+    print("\n⏱️ Fases:")
+    sintactico.errores_semanticos.clear()
+    with contextlib.redirect_stdout(io.StringIO()):
+        tiempos = {}
+        tiempos['Árbol .dot'], _ = cronometrar(lambda: sintactico.arbolSintactico(arbol, True))
+        tiempos['bajar_arbol'], arbol_abstracto = cronometrar(lambda: sintactico.bajar_arbol(arbol))
+        tabla_simbolos = sintactico.TablaSimbolos()
+        tiempos['Tabla de símbolos'], _ = cronometrar(
+            lambda: sintactico.construir_tabla_simbolos(arbol_abstracto, tabla_simbolos))
+        # verificar_variable consume los ámbitos de la tabla: los tipos y el assembly usan una copia.
+        copia = sintactico.crear_copia_tabla_simbolos(tabla_simbolos)
+        tiempos['Verificar variables'], _ = cronometrar(
+            lambda: sintactico.verificar_variable(arbol_abstracto, tabla_simbolos))
+        tiempos['Verificar tipos'], _ = cronometrar(lambda: sintactico.verificar_tipos_completo(
+            arbol_abstracto, copia, [], sintactico.VerificadorTipos()))
+        tiempos['Assembly MIPS'], _ = cronometrar(lambda: GeneradorAssemblyMIPS().generar(arbol_abstracto, copia))
+        tiempos['Assembly x86'], _ = cronometrar(lambda: GeneradorAssembly().generar(arbol_abstracto, copia))
+    sintactico.errores_semanticos.clear()
+    for fase, tiempo in tiempos.items():
+        print(f"   {fase:<20}{tiempo:>8.3f}s")
+
+if __name__ == "__main__":
+    main()
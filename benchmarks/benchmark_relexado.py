@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark del Reanálisis Léxico Incremental
+===========================================
+Simula la escritura de un carácter en distintos puntos de un código fuente
+grande y compara el tiempo de `Lexer.editar` con el de volver a analizar
+el archivo completo con `Lexer.lex`, verificando que ambos produzcan los
+mismos tokens.
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+DIRECTORIO_RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(DIRECTORIO_RAIZ, 'compilador'))
+
+import lexico
+from benchmark_lexico import generar_fuente
+
+def resumen(lexer):
+    """Tokens y errores de un analizador como tuplas comparables"""
+    tokens = [(t.tipo, t.valor, t.linea, t.columna, t.inicio) for t in lexer.tokens]
+    errores = [(e.mensaje, e.linea, e.columna, e.inicio) for e in lexer.errores]
+    return tokens, errores
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del reanálisis léxico incremental")
+    parser.add_argument('--megabytes', type=float, default=4.0, help='Tamaño del código generado')
+    parser.add_argument('--ediciones', type=int, default=50, help='Número de pulsaciones simuladas')
+    args = parser.parse_args()
+
+    random.seed(0)
+    lexer = lexico.Lexer()
+    lexer.lex(generar_fuente(args.megabytes))
+    print(f"📄 Código generado: {len(lexer.fuente.encode('utf-8')) / (1024 * 1024):.2f} MB, {len(lexer.tokens)} tokens")
+
+    tiempos = []
+    for _ in range(args.ediciones):
+        desplazamiento = random.randrange(len(lexer.fuente))
+        inicio = time.perf_counter()
+        lexer.editar(desplazamiento, 0, random.choice('x1 ;'))
+        tiempos.append(time.perf_counter() - inicio)
+
+    completo = lexico.Lexer()
+    inicio = time.perf_counter()
+    completo.lex(lexer.fuente)
+    tiempo_completo = time.perf_counter() - inicio
+
+    tiempos.sort()
+    print(f"🐢 Análisis completo:        {tiempo_completo * 1000:9.2f} ms")
+    print(f"🚀 Edición (mediana):        {tiempos[len(tiempos) // 2] * 1000:9.2f} ms")
+    print(f"🚀 Edición (peor caso):      {tiempos[-1] * 1000:9.2f} ms")
+
+    if resumen(lexer) != resumen(completo):
+        print("❌ El análisis incremental difiere del análisis completo")
+        sys.exit(1)
+    print("✅ El análisis incremental produce los mismos tokens y errores")
+
+if __name__ == "__main__":
+    main()
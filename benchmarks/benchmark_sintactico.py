@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Escalabilidad del Analizador Sintáctico
+====================================================
+Mide el tiempo de `analizador_sintactico` sobre programas generados de
+1K a 1M tokens y muestra el tiempo por token de cada tamaño: si el
+análisis es lineal, el tiempo por token se mantiene constante al
+multiplicar la entrada por diez. Mide también el parser descendente
+recursivo generado (`analizador_sintactico_generado`) y comprueba que
+construya el mismo número de nodos.
+"""
+
+import os
+import sys
+import gc
+import time
+import argparse
+
+DIRECTORIO_RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(DIRECTORIO_RAIZ, 'compilador'))
+
+import lexico
+import sintactico
+
+# Cada repetición del cuerpo aporta 14 tokens.
+CUERPO = "    x int = 5;\n    z float = x + y * 3;\n"
+TOKENS_CUERPO = 14
+
+def generar_programa(numero_tokens):
+    """Genera una función main válida con aproximadamente `numero_tokens` tokens"""
+    repeticiones = max(1, (numero_tokens - 13) // TOKENS_CUERPO)
+    return "fn main() int {\n" + CUERPO * repeticiones + "    return 0;\n}\n"
+
+def medir(analizador, lista_de_tokens, tabla_ll1):
+    """Tiempo de un análisis, el resultado y el número de nodos del árbol"""
+    # Como timeit, se mide con el recolector de ciclos desactivado: sus
+    # pasadas completas recorren todo el árbol ya construido.
+    gc.collect()
+    gc.disable()
+    inicio = time.perf_counter()
+    respuesta, arbol, _ = analizador(lista_de_tokens, tabla_ll1)
+    tiempo = time.perf_counter() - inicio
+    gc.enable()
+    nodos = 0
+    pendientes = [arbol] if arbol else []
+    while pendientes:
+        nodo = pendientes.pop()
+        nodos += 1
+        pendientes.extend(nodo.hijos)
+    return tiempo, respuesta, nodos
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de escalabilidad del analizador sintáctico")
+    parser.add_argument('--tokens', type=int, nargs='+', default=[1_000, 10_000, 100_000, 1_000_000],
+                        help='Tamaños de entrada en tokens')
+    args = parser.parse_args()
+
+    tabla_ll1 = sintactico.cargar_tabla_ll1(sintactico.ruta_archivo_ll1)
+    # La primera llamada genera o carga el módulo del parser; no se mide.
+    sintactico.cargar_parser_generado(tabla_ll1, sintactico.ruta_gramatica)
+    print(f"{'Tokens':>10}{'Pila':>12}{'µs/token':>12}{'Generado':>12}{'µs/token':>12}{'Aceleración':>13}")
+    for numero_tokens in args.tokens:
+        lista_de_tokens, errores = lexico.analizar_lexico(generar_programa(numero_tokens))
+        lista_de_tokens.append(lexico.Token("$", "$", None, None))
+
+        tiempo, respuesta, nodos = medir(sintactico.analizador_sintactico, lista_de_tokens, tabla_ll1)
+        tiempo_generado, respuesta_generado, nodos_generado = medir(
+            sintactico.analizador_sintactico_generado, lista_de_tokens, tabla_ll1)
+        if not respuesta or not respuesta_generado or errores:
+            print(f"❌ El programa de {len(lista_de_tokens)} tokens no se analizó correctamente")
+            sys.exit(1)
+        if nodos != nodos_generado:
+            print(f"❌ Los árboles difieren: {nodos} nodos con la pila, {nodos_generado} con el parser generado")
+            sys.exit(1)
+
+        por_token = tiempo / len(lista_de_tokens) * 1e6
+        por_token_generado = tiempo_generado / len(lista_de_tokens) * 1e6
+        print(f"{len(lista_de_tokens):>10}{tiempo:>11.3f}s{por_token:>12.2f}{tiempo_generado:>11.3f}s"
+              f"{por_token_generado:>12.2f}{tiempo / tiempo_generado:>12.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark del Análisis Sintáctico en Flujo
+==========================================
+Compara el pico de memoria y el tiempo de dos formas de analizar un
+archivo generado: leerlo completo, obtener su TokenBuffer y pasarlo a
+`analizador_sintactico`, o encadenar `iter_tokens` sobre el archivo
+abierto con `analizador_sintactico_flujo`, que pide cada token cuando lo
+necesita. El pico del análisis en flujo lo marca el árbol; se muestra
+también el pico sin árbol (solo los tokens) para ver cuánto aporta cada
+parte. Verifica que ambos construyan el mismo número de nodos.
+"""
+
+import os
+import sys
+import gc
+import time
+import argparse
+import tempfile
+import tracemalloc
+
+DIRECTORIO_RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(DIRECTORIO_RAIZ, 'compilador'))
+
+import lexico
+import sintactico
+from benchmark_sintactico import generar_programa
+
+def contar_nodos(arbol):
+    """Número de nodos del árbol"""
+    nodos = 0
+    pendientes = [arbol]
+    while pendientes:
+        nodo = pendientes.pop()
+        nodos += 1
+        pendientes.extend(nodo.hijos)
+    return nodos
+
+def analizar_completo(ruta, tabla_ll1):
+    """Lee el archivo completo, lo tokeniza y luego lo analiza"""
+    with open(ruta, 'r', encoding='utf-8') as f:
+        lista_de_tokens, _ = lexico.analizar_lexico(f.read())
+    lista_de_tokens.append(lexico.Token("$", "$", None, None))
+    return sintactico.analizador_sintactico(lista_de_tokens, tabla_ll1)
+
+def analizar_flujo(ruta, tabla_ll1):
+    """Tokeniza el archivo por fragmentos a medida que el analizador pide tokens"""
+    with open(ruta, 'r', encoding='utf-8') as f:
+        return sintactico.analizador_sintactico_flujo(lexico.iter_tokens(f), tabla_ll1)
+
+def solo_tokens(ruta):
+    """Pico de memoria de obtener todos los tokens, sin árbol"""
+    with open(ruta, 'r', encoding='utf-8') as f:
+        lista_de_tokens, _ = lexico.analizar_lexico(f.read())
+    return len(lista_de_tokens)
+
+def medir(funcion, *argumentos):
+    """Tiempo, pico de memoria (MB) y resultado de una llamada
+
+    tracemalloc hace mucho más lento el código medido, así que el tiempo se
+    toma en una segunda ejecución sin él.
+    """
+    gc.collect()
+    tracemalloc.start()
+    resultado = funcion(*argumentos)
+    pico = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    tracemalloc.stop()
+    del resultado
+    gc.collect()
+    inicio = time.perf_counter()
+    resultado = funcion(*argumentos)
+    tiempo = time.perf_counter() - inicio
+    return tiempo, pico, resultado
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del análisis sintáctico en flujo")
+    parser.add_argument('--tokens', type=int, default=100_000, help='Tokens del programa generado')
+    args = parser.parse_args()
+
+    tabla_ll1 = sintactico.cargar_tabla_ll1(sintactico.ruta_archivo_ll1)
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, 'programa.txt')
+        with open(ruta, 'w', encoding='utf-8') as f:
+            f.write(generar_programa(args.tokens))
+        tamano = os.path.getsize(ruta) / (1024 * 1024)
+
+        tiempo_tokens, pico_tokens, _ = medir(solo_tokens, ruta)
+        tiempo_completo, pico_completo, (respuesta, arbol, _) = medir(analizar_completo, ruta, tabla_ll1)
+        nodos = contar_nodos(arbol) if respuesta else 0
+        del arbol
+        tiempo_flujo, pico_flujo, (respuesta_flujo, arbol, _) = medir(analizar_flujo, ruta, tabla_ll1)
+        nodos_flujo = contar_nodos(arbol) if respuesta_flujo else 0
+        del arbol
+
+    if not respuesta or not respuesta_flujo or nodos != nodos_flujo:
+        print(f"❌ Los análisis no coinciden: {nodos} nodos completo, {nodos_flujo} en flujo")
+        sys.exit(1)
+
+    print(f"📄 Fuente: {tamano:.1f} MB, {args.tokens} tokens, {nodos} nodos en el árbol")
+    print(f"🔤 Solo tokens (texto + TokenBuffer): {tiempo_tokens:7.3f}s  pico {pico_tokens:8.1f} MB")
+    print(f"📦 Completo (tokens + árbol):          {tiempo_completo:7.3f}s  pico {pico_completo:8.1f} MB")
+    print(f"🌊 En flujo (árbol):                   {tiempo_flujo:7.3f}s  pico {pico_flujo:8.1f} MB  "
+          f"({pico_completo - pico_flujo:.1f} MB menos)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark del Análisis Sintáctico Paralelo
+==========================================
+Genera un programa con muchas funciones y mide `analizador_sintactico_paralelo`
+con distinto número de procesos frente a `analizador_sintactico_arena` en un
+solo proceso, y verifica que todas las ejecuciones produzcan la misma
+TreeArena.
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+DIRECTORIO_RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(DIRECTORIO_RAIZ, 'compilador'))
+
+import sintactico
+import sintactico_paralelo
+from lexico import Lexer
+from benchmark_parser_incremental import generar_programa
+
+def resumen(raiz):
+    """Arreglos de la TreeArena como tuplas comparables"""
+    arena = raiz.arena
+    return (arena.codigos.tobytes(), arena.terminales.tobytes(), arena.tokens.tobytes(),
+            arena.padres.tobytes(), arena.primeros_hijos.tobytes(), arena.siguientes_hermanos.tobytes())
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del análisis sintáctico paralelo")
+    parser.add_argument('--funciones', type=int, default=5000, help='Funciones del programa generado')
+    parser.add_argument('--procesos', type=int, nargs='+', help='Números de procesos a medir')
+    args = parser.parse_args()
+
+    nucleos = os.cpu_count() or 1
+    procesos = args.procesos or sorted({1, 2, 4, nucleos})
+    tabla_ll1 = sintactico.cargar_tabla_ll1(sintactico.ruta_archivo_ll1)
+    tokens = Lexer().lex(generar_programa(args.funciones))
+    tokens.agregar('$', '$')
+    print(f"📄 {args.funciones} funciones, {len(tokens)} tokens  Núcleos: {nucleos}")
+
+    tiempo_secuencial = None
+    for _ in range(2):
+        inicio = time.perf_counter()
+        exito, raiz, _ = sintactico.analizador_sintactico_arena(tokens, tabla_ll1)
+        tiempo = time.perf_counter() - inicio
+        tiempo_secuencial = tiempo if tiempo_secuencial is None else min(tiempo_secuencial, tiempo)
+    if not exito:
+        print("❌ El programa generado no se analizó correctamente")
+        sys.exit(1)
+    referencia = resumen(raiz)
+    print(f"🐢 Secuencial:   {tiempo_secuencial:.3f}s")
+
+    distintos = False
+    for cantidad in procesos:
+        # El pool se crea antes de medir, como en un proceso que analiza muchos archivos.
+        with ProcessPoolExecutor(max_workers=cantidad) as ejecutor:
+            list(ejecutor.map(abs, range(cantidad)))
+            inicio = time.perf_counter()
+            exito, raiz, _ = sintactico_paralelo.analizador_sintactico_paralelo(tokens, tabla_ll1, cantidad, ejecutor)
+            tiempo = time.perf_counter() - inicio
+        distintos = distintos or not exito or resumen(raiz) != referencia
+        print(f"🚀 {cantidad:2d} procesos: {tiempo:.3f}s  ({tiempo_secuencial / tiempo:.2f}x)")
+
+    if distintos:
+        print("❌ El análisis paralelo difiere del secuencial")
+        sys.exit(1)
+    print("✅ El análisis paralelo produce la misma TreeArena")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark del Formato Binario de Árboles
+========================================
+Genera un programa con muchas funciones y compara reconstruir sus árboles
+analizando el código (léxico, sintáctico y bajar_arbol) con cargarlos del
+formato binario de `volcado_arbol`, tanto el árbol sintáctico de objetos
+Nodo como el AST. Muestra también el tamaño de cada archivo frente al .dot,
+la única forma en que se guardaba el árbol.
+"""
+
+import io
+import os
+import sys
+import gc
+import time
+import argparse
+import contextlib
+
+DIRECTORIO_RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(DIRECTORIO_RAIZ, 'compilador'))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import sintactico
+from lexico import Lexer
+from arbol_abstracto import bajar_arbol
+from volcado_arbol import arbol_a_bytes
+from volcado_arbol import arbol_desde_bytes
+from benchmark_parser_incremental import generar_programa
+from benchmark_parser_incremental import cronometrar
+
+def analizar(fuente, tabla_ll1):
+    """Árbol sintáctico de `fuente` con el parser generado"""
+    tokens = Lexer().lex(fuente)
+    tokens.agregar('$', '$')
+    exito, arbol, _ = sintactico.analizador_sintactico_generado(tokens, tabla_ll1)
+    assert exito
+    return arbol
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del formato binario de árboles")
+    parser.add_argument('--funciones', type=int, default=1000, help='Funciones del programa generado')
+    args = parser.parse_args()
+
+    tabla_ll1 = sintactico.cargar_tabla_ll1(sintactico.ruta_archivo_ll1)
+    fuente = generar_programa(args.funciones)
+    tiempo_analisis, arbol = cronometrar(analizar, fuente, tabla_ll1)
+    tiempo_bajada, programa = cronometrar(bajar_arbol, arbol)
+    with contextlib.redirect_stdout(io.StringIO()):
+        dot = sintactico.arbolSintactico(arbol, True).source.encode('utf-8')
+    print(f"📄 {args.funciones} funciones, {len(fuente.encode('utf-8')) / 1024:.0f} KB de código, "
+          f".dot de {len(dot) / 1024:.0f} KB")
+    print(f"   {'Léxico + sintáctico':<28}{tiempo_analisis:>8.3f}s")
+    print(f"   {'  + bajar_arbol':<28}{tiempo_analisis + tiempo_bajada:>8.3f}s")
+
+    for nombre, original, Nodo in (('Árbol sintáctico (Nodo)', arbol, sintactico.Nodo), ('AST', programa, None)):
+        tiempo_volcado, datos = cronometrar(arbol_a_bytes, original)
+        tiempo_carga, cargado = cronometrar(arbol_desde_bytes, datos, Nodo)
+        print(f"\n🌳 {nombre}: {len(datos) / 1024:.0f} KB")
+        print(f"   {'Volcado':<28}{tiempo_volcado:>8.3f}s")
+        print(f"   {'Carga':<28}{tiempo_carga:>8.3f}s")
+    if cargado != programa:
+        print("❌ El AST cargado difiere del original")
+        sys.exit(1)
+    print("\n✅ El AST cargado es igual al original")
+
+if __name__ == "__main__":
+    main()
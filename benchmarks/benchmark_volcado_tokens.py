@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Benchmark del Volcado de Tokens
+===============================
+Compara el tiempo de escribir los tokens de un código generado como tabla
+de tabulate (`crear_tabla_tokens`) y en flujo con `EscritorTokens` en
+formato JSONL y binario, y verifica que `leer_tokens` recupere los mismos
+tokens de ambos volcados.
+"""
+
+import os
+import sys
+import time
+import tempfile
+import argparse
+
+DIRECTORIO_RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(DIRECTORIO_RAIZ, 'compilador'))
+
+import lexico
+from benchmark_lexico import generar_fuente
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del volcado de tokens")
+    parser.add_argument('--megabytes', type=float, default=0.5, help='Tamaño del código generado')
+    parser.add_argument('--sin-tabla', action='store_true', help='No medir la tabla de tabulate')
+    args = parser.parse_args()
+
+    tokens, _ = lexico.analizar_lexico(generar_fuente(args.megabytes))
+    tokens.append(lexico.Token("$", "$", None, None))
+    referencia = [(t.tipo, t.valor, t.linea, t.columna) for t in tokens]
+    print(f"🔤 Tokens: {len(tokens)}")
+
+    with tempfile.TemporaryDirectory() as directorio:
+        if not args.sin_tabla:
+            inicio = time.perf_counter()
+            with open(os.path.join(directorio, 'tokens.txt'), 'w', encoding='utf-8') as f:
+                f.write(lexico.crear_tabla_tokens(tokens))
+            print(f"🐢 Tabla (tabulate): {time.perf_counter() - inicio:8.3f}s")
+
+        iguales = True
+        for formato in ('jsonl', 'binario'):
+            ruta = os.path.join(directorio, 'tokens' + lexico.extensiones_formato_tokens[formato])
+            inicio = time.perf_counter()
+            with lexico.EscritorTokens(ruta, formato) as escritor:
+                escritor.escribir_tokens(tokens)
+            tiempo = time.perf_counter() - inicio
+            print(f"🚀 {formato.upper():<16} {tiempo:8.3f}s  {os.path.getsize(ruta) / (1024 * 1024):7.1f} MB")
+            iguales &= [(t.tipo, t.valor, t.linea, t.columna) for t in lexico.leer_tokens(ruta)] == referencia
+
+    if not iguales:
+        print("❌ Los tokens leídos del volcado difieren")
+        sys.exit(1)
+    print("✅ leer_tokens recupera los mismos tokens de ambos volcados")
+
+if __name__ == "__main__":
+    main()
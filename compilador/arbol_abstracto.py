@@ -0,0 +1,413 @@
+class NodoAST:
+    """Base de los nodos del árbol de sintaxis abstracta (AST).
+
+    Cada clase declara sus atributos en `__slots__` y, en `campos_hijos`,
+    los que guardan nodos o listas de nodos, en el orden en que aparecen
+    en el código fuente; `hijos` recorre los hijos en ese orden. Las
+    posiciones (`linea`, `columna`) son las del token identificador del
+    nodo cuando lo tiene.
+    """
+    __slots__ = ()
+    campos_hijos = ()
+
+    @property
+    def hijos(self):
+        """Nodos AST hijos, en el orden del código fuente."""
+        if not self.campos_hijos:
+            return []
+        hijos = []
+        for atributo in self.campos_hijos:
+            valor = getattr(self, atributo)
+            if isinstance(valor, list):
+                hijos.extend(valor)
+            elif valor is not None:
+                hijos.append(valor)
+        return hijos
+
+    def __eq__(self, otro):
+        """Compara dos árboles campo a campo, con una pila en lugar de recursión."""
+        pendientes = [(self, otro)]
+        while pendientes:
+            nodo, otro = pendientes.pop()
+            if type(otro) is not type(nodo):
+                return False
+            for atributo in nodo.__slots__:
+                valor = getattr(nodo, atributo)
+                valor_otro = getattr(otro, atributo)
+                if atributo not in nodo.campos_hijos or valor is None or valor_otro is None:
+                    if valor != valor_otro:
+                        return False
+                elif isinstance(valor, list):
+                    if not isinstance(valor_otro, list) or len(valor) != len(valor_otro):
+                        return False
+                    pendientes.extend(zip(valor, valor_otro))
+                else:
+                    pendientes.append((valor, valor_otro))
+        return True
+
+    __hash__ = None
+
+    def __repr__(self):
+        valores = ', '.join(repr(getattr(self, atributo)) for atributo in self.__slots__)
+        return f"{type(self).__name__}({valores})"
+
+# --- Programa y funciones ---
+
+class Program(NodoAST):
+    __slots__ = ('funciones',)
+    campos_hijos = ('funciones',)
+
+    def __init__(self, funciones):
+        self.funciones = funciones
+
+class FunctionDef(NodoAST):
+    """Función; `principal` indica la función main (restomain), que no tiene token id."""
+    __slots__ = ('nombre', 'parametros', 'retorno', 'cuerpo', 'principal', 'linea', 'columna')
+    campos_hijos = ('parametros', 'cuerpo')
+
+    def __init__(self, nombre, parametros, retorno, cuerpo, principal, linea, columna):
+        self.nombre = nombre
+        self.parametros = parametros
+        self.retorno = retorno
+        self.cuerpo = cuerpo
+        self.principal = principal
+        self.linea = linea
+        self.columna = columna
+
+class Param(NodoAST):
+    __slots__ = ('nombre', 'tipo', 'linea', 'columna')
+
+    def __init__(self, nombre, tipo, linea, columna):
+        self.nombre = nombre
+        self.tipo = tipo
+        self.linea = linea
+        self.columna = columna
+
+class Block(NodoAST):
+    __slots__ = ('instrucciones',)
+    campos_hijos = ('instrucciones',)
+
+    def __init__(self, instrucciones):
+        self.instrucciones = instrucciones
+
+# --- Instrucciones ---
+
+class VarDecl(NodoAST):
+    """Declaración `id tipodato [= expresion]`; `valor` es None si no se inicializa."""
+    __slots__ = ('nombre', 'tipo', 'valor', 'linea', 'columna')
+    campos_hijos = ('valor',)
+
+    def __init__(self, nombre, tipo, valor, linea, columna):
+        self.nombre = nombre
+        self.tipo = tipo
+        self.valor = valor
+        self.linea = linea
+        self.columna = columna
+
+class Assign(NodoAST):
+    __slots__ = ('nombre', 'valor', 'linea', 'columna')
+    campos_hijos = ('valor',)
+
+    def __init__(self, nombre, valor, linea, columna):
+        self.nombre = nombre
+        self.valor = valor
+        self.linea = linea
+        self.columna = columna
+
+class CallStmt(NodoAST):
+    """Llamada usada como instrucción (`id ( parametros ) ;`)."""
+    __slots__ = ('nombre', 'argumentos', 'linea', 'columna')
+    campos_hijos = ('argumentos',)
+
+    def __init__(self, nombre, argumentos, linea, columna):
+        self.nombre = nombre
+        self.argumentos = argumentos
+        self.linea = linea
+        self.columna = columna
+
+class Print(NodoAST):
+    __slots__ = ('argumentos',)
+    campos_hijos = ('argumentos',)
+
+    def __init__(self, argumentos):
+        self.argumentos = argumentos
+
+class Read(NodoAST):
+    __slots__ = ('nombre', 'linea', 'columna')
+
+    def __init__(self, nombre, linea, columna):
+        self.nombre = nombre
+        self.linea = linea
+        self.columna = columna
+
+class Break(NodoAST):
+    __slots__ = ()
+
+class Return(NodoAST):
+    __slots__ = ('valor',)
+    campos_hijos = ('valor',)
+
+    def __init__(self, valor):
+        self.valor = valor
+
+class If(NodoAST):
+    """Condicional; `sino` es el Block del else o None."""
+    __slots__ = ('condicion', 'cuerpo', 'sino')
+    campos_hijos = ('condicion', 'cuerpo', 'sino')
+
+    def __init__(self, condicion, cuerpo, sino):
+        self.condicion = condicion
+        self.cuerpo = cuerpo
+        self.sino = sino
+
+class While(NodoAST):
+    __slots__ = ('condicion', 'cuerpo')
+    campos_hijos = ('condicion', 'cuerpo')
+
+    def __init__(self, condicion, cuerpo):
+        self.condicion = condicion
+        self.cuerpo = cuerpo
+
+class For(NodoAST):
+    """Bucle para; `inicio` y `paso` son instrucciones VarDecl, Assign o CallStmt."""
+    __slots__ = ('inicio', 'condicion', 'paso', 'cuerpo')
+    campos_hijos = ('inicio', 'condicion', 'paso', 'cuerpo')
+
+    def __init__(self, inicio, condicion, paso, cuerpo):
+        self.inicio = inicio
+        self.condicion = condicion
+        self.paso = paso
+        self.cuerpo = cuerpo
+
+# --- Expresiones ---
+
+class BinOp(NodoAST):
+    """Operación binaria; `operador` es el tipo del token (suma, menorque, ...).
+
+    La gramática no tiene precedencia: `a op b op c` es `a op (b op c)`,
+    así que `izquierda` nunca es un BinOp y `derecha` es una expresión
+    completa.
+    """
+    __slots__ = ('operador', 'izquierda', 'derecha')
+    campos_hijos = ('izquierda', 'derecha')
+
+    def __init__(self, operador, izquierda, derecha):
+        self.operador = operador
+        self.izquierda = izquierda
+        self.derecha = derecha
+
+class Call(NodoAST):
+    __slots__ = ('nombre', 'argumentos', 'linea', 'columna')
+    campos_hijos = ('argumentos',)
+
+    def __init__(self, nombre, argumentos, linea, columna):
+        self.nombre = nombre
+        self.argumentos = argumentos
+        self.linea = linea
+        self.columna = columna
+
+class Name(NodoAST):
+    __slots__ = ('nombre', 'linea', 'columna')
+
+    def __init__(self, nombre, linea, columna):
+        self.nombre = nombre
+        self.linea = linea
+        self.columna = columna
+
+class Literal(NodoAST):
+    """Valor literal; `tipo` es el del token (nentero, nflotante, ncadena, nbooleano)."""
+    __slots__ = ('tipo', 'valor', 'linea', 'columna')
+
+    def __init__(self, tipo, valor, linea, columna):
+        self.tipo = tipo
+        self.valor = valor
+        self.linea = linea
+        self.columna = columna
+
+class Paren(NodoAST):
+    __slots__ = ('expresion',)
+    campos_hijos = ('expresion',)
+
+    def __init__(self, expresion):
+        self.expresion = expresion
+
+# Instrucciones que provienen de un nodo 'asignaciones' del árbol sintáctico.
+ASIGNACIONES = (VarDecl, Assign, CallStmt)
+
+# Nodos de expresión.
+EXPRESIONES = (BinOp, Call, Name, Literal, Paren)
+
+# ===========================
+# BAJADA DEL ÁRBOL SINTÁCTICO AL AST
+# ===========================
+
+def bajar_arbol(raiz):
+    """Construye el AST (Program) a partir del árbol sintáctico de `programaprincipal`.
+
+    Descarta las hojas 'e', los signos de puntuación y los nodos que solo
+    encadenan o envuelven a otros (instruccion, ext, opcionesasig,
+    posibilidad...), y aplana las cadenas recursivas por la derecha
+    (masfuncn, masinstrucciones, masparametrosf, restoparametros) en
+    listas. Acepta cualquier árbol con la interfaz de lectura de Nodo,
+    como los cursores NodoArena.
+
+    Los bloques, los paréntesis y los argumentos de las llamadas no se
+    bajan con llamadas anidadas: el nodo del AST se crea con ese campo
+    vacío y el subárbol queda en `pendientes` junto con el campo que debe
+    llenar, así que un anidamiento de miles de niveles no agota la pila de
+    Python.
+    """
+    pendientes = []
+    funciones = []
+    nodo = raiz
+    while nodo is not None:
+        _, opcionprincipal, masfuncn = nodo.hijos
+        funciones.append(_bajar_funcion(opcionprincipal.hijos[0], pendientes))
+        siguiente = masfuncn.hijos[0]
+        nodo = siguiente if siguiente.tipo == 'programaprincipal' else None
+    # Cada pendiente es (función que lo baja, nodo sintáctico, nodo del AST, campo).
+    while pendientes:
+        bajar, nodo, destino, campo = pendientes.pop()
+        setattr(destino, campo, bajar(nodo, pendientes))
+    return Program(funciones)
+
+def _bajar_funcion(nodo, pendientes):
+    """restomain o restofuncn -> FunctionDef"""
+    hijos = nodo.hijos
+    if nodo.tipo == 'restomain':
+        principal = hijos[0]
+        funcion = FunctionDef('main', [], 'tentero', None, True, principal.linea, principal.columna)
+        pendientes.append((_bajar_bloque, hijos[5], funcion, 'cuerpo'))
+        return funcion
+    nodo_id, _, parametrosf, _, opciondato, _, masinstrucciones, _ = hijos
+    parametros = []
+    while True:
+        hijos_parametro = parametrosf.hijos
+        if len(hijos_parametro) == 1:
+            break
+        id_parametro, tipodato, masparametrosf = hijos_parametro
+        parametros.append(Param(id_parametro.valor, tipodato.hijos[0].tipo,
+                                id_parametro.linea, id_parametro.columna))
+        hijos_mas = masparametrosf.hijos
+        if len(hijos_mas) == 1:
+            break
+        parametrosf = hijos_mas[1]
+    opcion = opciondato.hijos[0]
+    retorno = opcion.hijos[0].tipo if opcion.tipo == 'tipodato' else 'tvacio'
+    funcion = FunctionDef(nodo_id.valor, parametros, retorno, None, False, nodo_id.linea, nodo_id.columna)
+    pendientes.append((_bajar_bloque, masinstrucciones, funcion, 'cuerpo'))
+    return funcion
+
+def _bajar_bloque(nodo, pendientes):
+    """Cadena de masinstrucciones -> Block con la lista plana de instrucciones"""
+    instrucciones = []
+    hijos = nodo.hijos
+    while len(hijos) == 2:
+        instrucciones.append(_bajar_instruccion(hijos[0], pendientes))
+        hijos = hijos[1].hijos
+    return Block(instrucciones)
+
+def _bajar_instruccion(nodo, pendientes):
+    """instruccion -> nodo de instrucción del AST; los bloques que contiene quedan en `pendientes`"""
+    hijos = nodo.hijos
+    primero = hijos[0]
+    tipo = primero.tipo
+    if tipo == 'asignaciones':
+        return _bajar_asignaciones(primero, pendientes)
+    if tipo == 'mostrar':
+        comandos = primero.hijos[2].hijos
+        return Print([_bajar_expresion(comandos[0], pendientes)] if len(comandos) == 2 else [])
+    if tipo == 'condicional':
+        _, _, expresion, _, _, masinstrucciones, _, posibilidad = primero.hijos
+        instruccion = If(_bajar_expresion(expresion, pendientes), None, None)
+        pendientes.append((_bajar_bloque, masinstrucciones, instruccion, 'cuerpo'))
+        hijos_posibilidad = posibilidad.hijos
+        if len(hijos_posibilidad) == 4:
+            pendientes.append((_bajar_bloque, hijos_posibilidad[2], instruccion, 'sino'))
+        return instruccion
+    if tipo == 'buclemientras':
+        _, _, expresion, _, _, masinstrucciones, _ = primero.hijos
+        instruccion = While(_bajar_expresion(expresion, pendientes), None)
+        pendientes.append((_bajar_bloque, masinstrucciones, instruccion, 'cuerpo'))
+        return instruccion
+    if tipo == 'buclepara':
+        _, _, inicio, _, expresion, _, paso, _, _, masinstrucciones, _ = primero.hijos
+        instruccion = For(_bajar_asignaciones(inicio, pendientes), _bajar_expresion(expresion, pendientes),
+                          _bajar_asignaciones(paso, pendientes), None)
+        pendientes.append((_bajar_bloque, masinstrucciones, instruccion, 'cuerpo'))
+        return instruccion
+    if tipo == 'devolver':
+        return Return(_bajar_expresion(hijos[1], pendientes))
+    if tipo == 'leer':
+        nodo_id = hijos[2]
+        return Read(nodo_id.valor, nodo_id.linea, nodo_id.columna)
+    return Break()
+
+def _bajar_asignaciones(nodo, pendientes):
+    """asignaciones -> VarDecl, Assign o CallStmt"""
+    nodo_id, ext = nodo.hijos
+    hijos_ext = ext.hijos
+    if len(hijos_ext) == 2:
+        # ext -> tipodato opcionesasig
+        tipodato, opcionesasig = hijos_ext
+        hijos_opciones = opcionesasig.hijos
+        valor = _bajar_expresion(hijos_opciones[1], pendientes) if len(hijos_opciones) == 2 else None
+        return VarDecl(nodo_id.valor, tipodato.hijos[0].tipo, valor, nodo_id.linea, nodo_id.columna)
+    hijos_extension = hijos_ext[0].hijos
+    if len(hijos_extension) == 2:
+        # extension -> igual expresion
+        return Assign(nodo_id.valor, _bajar_expresion(hijos_extension[1], pendientes),
+                      nodo_id.linea, nodo_id.columna)
+    # extension -> pabierto parametros pcerrado
+    llamada = CallStmt(nodo_id.valor, None, nodo_id.linea, nodo_id.columna)
+    pendientes.append((_bajar_parametros, hijos_extension[1], llamada, 'argumentos'))
+    return llamada
+
+def _bajar_parametros(nodo, pendientes):
+    """parametros -> lista de expresiones de los argumentos"""
+    argumentos = []
+    hijos = nodo.hijos
+    while len(hijos) > 1:
+        # parametros -> expresion restoparametros / restoparametros -> coma expresion restoparametros
+        argumentos.append(_bajar_expresion(hijos[-2], pendientes))
+        hijos = hijos[-1].hijos
+    return argumentos
+
+def _bajar_expresion(nodo, pendientes):
+    """expresion -> BinOp o el operando (Name, Call, Literal, Paren) si no hay operación
+
+    La cadena de masexpresiones se recorre con un bucle y los BinOp se
+    arman al final, de derecha a izquierda, así que una expresión larga no
+    agota la pila de llamadas; el interior de los paréntesis y los
+    argumentos de las llamadas quedan en `pendientes`.
+    """
+    operandos = []
+    operadores = []
+    while True:
+        hijos = nodo.hijos
+        primero = hijos[0]
+        tipo = primero.tipo
+        if tipo == 'id':
+            opciones = hijos[1].hijos
+            if len(opciones) == 3:
+                operando = Call(primero.valor, None, primero.linea, primero.columna)
+                pendientes.append((_bajar_parametros, opciones[1], operando, 'argumentos'))
+            else:
+                operando = Name(primero.valor, primero.linea, primero.columna)
+        elif tipo == 'valordato':
+            literal = primero.hijos[0]
+            operando = Literal(literal.tipo, literal.valor, literal.linea, literal.columna)
+        else:
+            # pabierto expresion pcerrado masexpresiones
+            operando = Paren(None)
+            pendientes.append((_bajar_expresion, hijos[1], operando, 'expresion'))
+        operandos.append(operando)
+        masexpresiones = hijos[-1].hijos
+        if len(masexpresiones) == 1:
+            break
+        operacion, nodo = masexpresiones
+        operadores.append(operacion.hijos[0].tipo)
+    expresion = operandos.pop()
+    while operadores:
+        expresion = BinOp(operadores.pop(), operandos.pop(), expresion)
+    return expresion
@@ -0,0 +1,159 @@
+from array import array
+from itertools import repeat
+
+from lexico import codigo_tipo_token
+from lexico import nombres_tipos_token
+
+# Índice que marca la ausencia de hijo, hermano, padre o token.
+SIN_NODO = -1
+
+# Código de la producción vacía 'e'; sus nodos tienen como valor "e".
+CODIGO_VACIO = codigo_tipo_token('e')
+
+class TreeArena:
+    """Árbol sintáctico guardado en arreglos paralelos indexados por id de nodo.
+
+    Cada nodo ocupa una posición en `codigos` (tipo), `terminales`, `tokens`
+    (índice en el TokenBuffer del token que consumió, o SIN_NODO), `padres`,
+    `primeros_hijos` y `siguientes_hermanos`. El valor, la línea y la
+    columna de un nodo terminal se leen del TokenBuffer al pedirlos, así que
+    el árbol no guarda ningún objeto por nodo ni referencias cruzadas que el
+    recolector de ciclos tenga que recorrer.
+
+    Los ids son los mismos que asigna analizador_sintactico: el 0 es el $
+    del fondo de la pila y el 1 la raíz. NodoArena da acceso a un nodo con
+    los mismos atributos de lectura que Nodo.
+    """
+
+    def __init__(self, lista_de_tokens):
+        self.lista_de_tokens = lista_de_tokens
+        self.codigos = array('B')
+        self.terminales = array('B')
+        self.tokens = array('i')
+        self.padres = array('i')
+        self.primeros_hijos = array('i')
+        self.siguientes_hermanos = array('i')
+        # Arreglos ya preparados de cada producción, por id de la tupla (que se conserva).
+        self._producciones = {}
+
+    def __len__(self):
+        return len(self.codigos)
+
+    def agregar(self, codigo, terminal, padre=SIN_NODO):
+        """Agrega un nodo sin hijos y retorna su id; no lo enlaza con sus hermanos."""
+        self.codigos.append(codigo)
+        self.terminales.append(terminal)
+        self.tokens.append(SIN_NODO)
+        self.padres.append(padre)
+        self.primeros_hijos.append(SIN_NODO)
+        self.siguientes_hermanos.append(SIN_NODO)
+        return len(self.codigos) - 1
+
+    def agregar_hijos(self, padre, produccion):
+        """Agrega los símbolos de una producción como hijos de `padre`; retorna el id del primero.
+
+        `produccion` es una tupla de pares (codigo, es_terminal), como las
+        celdas de TablaLL1.matriz. Los hijos reciben ids consecutivos.
+        """
+        preparada = self._producciones.get(id(produccion))
+        if preparada is None:
+            preparada = (produccion,
+                         bytes(simbolo for simbolo, _ in produccion),
+                         bytes(es_terminal for _, es_terminal in produccion),
+                         array('i', [SIN_NODO] * len(produccion)))
+            self._producciones[id(produccion)] = preparada
+        _, codigos, terminales, sin_nodo = preparada
+        primero = len(self.codigos)
+        cantidad = len(codigos)
+        self.codigos.frombytes(codigos)
+        self.terminales.frombytes(terminales)
+        self.tokens.extend(sin_nodo)
+        self.padres.extend(repeat(padre, cantidad))
+        self.primeros_hijos.extend(sin_nodo)
+        self.siguientes_hermanos.extend(range(primero + 1, primero + cantidad))
+        self.siguientes_hermanos.append(SIN_NODO)
+        self.primeros_hijos[padre] = primero
+        return primero
+
+    def nodo(self, id):
+        """Retorna el NodoArena del nodo `id`."""
+        return NodoArena(self, id)
+
+    def raiz(self):
+        """Retorna el NodoArena de la raíz del árbol."""
+        return NodoArena(self, 1)
+
+    def memoria(self):
+        """Bytes que ocupan los arreglos del árbol (sin el TokenBuffer)."""
+        return sum(arreglo.buffer_info()[1] * arreglo.itemsize
+                   for arreglo in (self.codigos, self.terminales, self.tokens, self.padres,
+                                   self.primeros_hijos, self.siguientes_hermanos))
+
+class NodoArena:
+    """Cursor de solo lectura sobre un nodo de una TreeArena, con la interfaz de Nodo.
+
+    Ofrece `id`, `tipo`, `codigo`, `valor`, `linea`, `columna`, `terminal`,
+    `hijos` y `padre`, así que arbolSintactico y bajar_arbol lo recorren
+    igual que a un Nodo. Los cursores se crean al pedirlos; dos cursores
+    del mismo nodo son iguales.
+    """
+    __slots__ = ('arena', 'id')
+
+    def __init__(self, arena, id):
+        self.arena = arena
+        self.id = id
+
+    @property
+    def codigo(self):
+        return self.arena.codigos[self.id]
+
+    @property
+    def tipo(self):
+        return nombres_tipos_token[self.arena.codigos[self.id]]
+
+    @property
+    def terminal(self):
+        return bool(self.arena.terminales[self.id])
+
+    @property
+    def valor(self):
+        arena = self.arena
+        token = arena.tokens[self.id]
+        if token != SIN_NODO:
+            return arena.lista_de_tokens.valores[token]
+        return "e" if arena.codigos[self.id] == CODIGO_VACIO and arena.terminales[self.id] else None
+
+    @property
+    def linea(self):
+        token = self.arena.tokens[self.id]
+        return None if token == SIN_NODO else self.arena.lista_de_tokens.posicion(token)[0]
+
+    @property
+    def columna(self):
+        token = self.arena.tokens[self.id]
+        return None if token == SIN_NODO else self.arena.lista_de_tokens.posicion(token)[1]
+
+    @property
+    def hijos(self):
+        arena = self.arena
+        siguientes = arena.siguientes_hermanos
+        hijos = []
+        hijo = arena.primeros_hijos[self.id]
+        while hijo != SIN_NODO:
+            hijos.append(NodoArena(arena, hijo))
+            hijo = siguientes[hijo]
+        return hijos
+
+    @property
+    def padre(self):
+        padre = self.arena.padres[self.id]
+        return None if padre == SIN_NODO else NodoArena(self.arena, padre)
+
+    def __eq__(self, otro):
+        return isinstance(otro, NodoArena) and otro.arena is self.arena and otro.id == self.id
+
+    def __hash__(self):
+        return hash((id(self.arena), self.id))
+
+    def __repr__(self):
+        return f"NodoArena({self.id}, {self.tipo!r}, {self.valor!r})"
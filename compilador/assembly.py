@@ -1,14 +1,20 @@
 import os
+from arbol_abstracto import ASIGNACIONES
+from arbol_abstracto import BinOp
+from arbol_abstracto import Block
+from arbol_abstracto import Call
+from arbol_abstracto import CallStmt
+from arbol_abstracto import If
+from arbol_abstracto import Literal
+from arbol_abstracto import Name
+from arbol_abstracto import Paren
+from arbol_abstracto import Print
+from arbol_abstracto import Return
+from arbol_abstracto import While
+from recorrido import SALIR
+from recorrido import Visitante
 
-# Función helper que necesita assembly.py
-def buscar_hijo(nodo, tipo):
-    """Encuentra un hijo con el tipo especificado."""
-    for hijo in nodo.hijos:
-        if hijo.tipo == tipo:
-            return hijo
-    return None
-
-class GeneradorAssembly:
+class GeneradorAssembly(Visitante):
     def __init__(self):
         self.codigo = []
         self.contador_etiquetas = 0
@@ -18,6 +24,9 @@ class GeneradorAssembly:
         self.funciones_declaradas = set()
         self.en_funcion = False
         self.nombre_funcion_actual = ""
+        # Ámbito de las instrucciones que se recorren y etiquetas de los if/while abiertos
+        self.ambito_actual = None
+        self.etiquetas_abiertas = []
         
             
     def nueva_etiqueta(self, prefijo="L"):
@@ -85,48 +94,53 @@ class GeneradorAssembly:
         return self.variables_locales[nombre_var]
     
     def generar_expresion(self, nodo_expresion, ambito):
-        """Genera código para una expresión y retorna el registro donde está el resultado"""
-        if not nodo_expresion:
-            return None
-            
-        if nodo_expresion.tipo == 'expresion':
-            primer_hijo = nodo_expresion.hijos[0] if nodo_expresion.hijos else None
+        """Genera código para una expresión del AST y retorna el registro donde está el resultado.
+
+        Solo se sigue la cadena de operaciones hacia la derecha (un paréntesis
+        la termina), así que se recorre con un bucle: cada BinOp cuyo operando
+        izquierdo se cargó queda pendiente hasta generar su lado derecho.
+        """
+        pendientes = []
+        registro = None
+        while nodo_expresion:
+            # Una expresión es un operando o un BinOp con el operando a la izquierda
+            operando = nodo_expresion.izquierda if isinstance(nodo_expresion, BinOp) else nodo_expresion
             
-            if primer_hijo and primer_hijo.tipo == 'valordato':
-                return self.generar_valor_dato(primer_hijo)
+            if isinstance(operando, Literal):
+                registro = self.generar_valor_dato(operando)
             
-            elif primer_hijo and primer_hijo.tipo == 'id':
-                nombre_var = primer_hijo.valor
+            elif isinstance(operando, (Name, Call)):
+                nombre_var = operando.nombre
                 offset = self.obtener_offset_variable(nombre_var, ambito)
                 
                 if offset is not None:
                     self.agregar_codigo(f"mov {offset}(%rbp), %rax", f"cargar variable {nombre_var}")
                     
                     # Verificar si hay operaciones adicionales
-                    masexpresiones = buscar_hijo(nodo_expresion, 'masexpresiones')
-                    if masexpresiones and masexpresiones.hijos and masexpresiones.hijos[0].tipo != 'e':
-                        return self.generar_operacion_binaria(nodo_expresion, ambito, 'rax')
+                    if isinstance(nodo_expresion, BinOp):
+                        # Guardar el valor izquierdo y seguir con el operando derecho
+                        self.agregar_codigo("push %rax", "guardar operando izquierdo")
+                        pendientes.append(nodo_expresion)
+                        nodo_expresion = nodo_expresion.derecha
+                        continue
                     
-                    return 'rax'
+                    registro = 'rax'
                 
-            elif primer_hijo and primer_hijo.tipo == 'pabierto':
+            elif isinstance(operando, Paren):
                 # Expresión entre paréntesis
-                expr_interna = buscar_hijo(nodo_expresion, 'expresion')
-                if expr_interna:
-                    return self.generar_expresion(expr_interna, ambito)
-                    
-        elif nodo_expresion.tipo == 'valordato':
-            return self.generar_valor_dato(nodo_expresion)
-            
-        return None
+                nodo_expresion = operando.expresion
+                continue
+            break
+        
+        # Cerrar las operaciones pendientes, de la más interna a la más externa
+        for nodo_binop in reversed(pendientes):
+            registro = self.generar_operacion_binaria(nodo_binop, registro, 'rax')
+        return registro
     
-    def generar_valor_dato(self, nodo_valordato):
+    def generar_valor_dato(self, nodo_literal):
         """Genera código para un valor literal"""
-        if not nodo_valordato.hijos:
-            return None
-            
-        tipo_valor = nodo_valordato.hijos[0].tipo
-        valor = nodo_valordato.hijos[0].valor
+        tipo_valor = nodo_literal.tipo
+        valor = nodo_literal.valor
         
         if tipo_valor == 'nentero':
             self.agregar_codigo(f"mov ${valor}, %rax", f"cargar entero {valor}")
@@ -144,30 +158,14 @@ class GeneradorAssembly:
             
         return None
     
-    def generar_operacion_binaria(self, nodo_expresion, ambito, registro_izq):
-        """Genera código para operaciones binarias"""
-        masexpresiones = buscar_hijo(nodo_expresion, 'masexpresiones')
-        if not masexpresiones or not masexpresiones.hijos:
-            return registro_izq
-            
-        nodo_operacion = buscar_hijo(masexpresiones, 'operacion')
-        nodo_expr_der = buscar_hijo(masexpresiones, 'expresion')
-        
-        if not nodo_operacion or not nodo_expr_der:
-            return registro_izq
-            
-        # Guardar el valor izquierdo
-        self.agregar_codigo(f"push %{registro_izq}", "guardar operando izquierdo")
-        
-        # Generar el operando derecho
-        registro_der = self.generar_expresion(nodo_expr_der, ambito)
-        
+    def generar_operacion_binaria(self, nodo_binop, registro_der, registro_izq):
+        """Genera código para operaciones binarias, con el operando izquierdo en la pila"""
         if registro_der:
             # Recuperar operando izquierdo
             self.agregar_codigo("pop %rbx", "recuperar operando izquierdo")
             
             # Generar la operación
-            tipo_op = nodo_operacion.hijos[0].tipo
+            tipo_op = nodo_binop.operador
             
             if tipo_op == 'suma':
                 self.agregar_codigo(f"add %{registro_der}, %rbx", "suma")
@@ -197,29 +195,13 @@ class GeneradorAssembly:
             
         return registro_izq
     
-    def generar_asignacion(self, nodo_asignaciones, ambito):
-        """Genera código para asignaciones"""
-        nodo_id = buscar_hijo(nodo_asignaciones, 'id')
-        nodo_ext = buscar_hijo(nodo_asignaciones, 'ext')
-        
-        if not nodo_id or not nodo_ext:
+    def generar_asignacion(self, nodo_asignacion, ambito):
+        """Genera código para asignaciones (VarDecl o Assign; una CallStmt no asigna nada)"""
+        if isinstance(nodo_asignacion, CallStmt):
             return
             
-        nombre_var = nodo_id.valor
-        
-        # Buscar la expresión a asignar
-        nodo_expresion = None
-        
-        # Caso 1: declaración con tipo
-        if nodo_ext.hijos and nodo_ext.hijos[0].tipo == 'tipodato':
-            nodo_opcionesasig = buscar_hijo(nodo_ext, 'opcionesasig')
-            if nodo_opcionesasig and nodo_opcionesasig.hijos:
-                nodo_expresion = buscar_hijo(nodo_opcionesasig, 'expresion')
-        
-        # Caso 2: asignación directa
-        elif nodo_ext.hijos and nodo_ext.hijos[0].tipo == 'extension':
-            nodo_extension = nodo_ext.hijos[0]
-            nodo_expresion = buscar_hijo(nodo_extension, 'expresion')
+        nombre_var = nodo_asignacion.nombre
+        nodo_expresion = nodo_asignacion.valor
         
         if nodo_expresion:
             # Generar código para la expresión
@@ -233,14 +215,9 @@ class GeneradorAssembly:
     
     def generar_show(self, nodo_mostrar, ambito):
         """Genera código para la función show/imprimir"""
-        nodo_comandos = buscar_hijo(nodo_mostrar, 'comandos')
-        if not nodo_comandos:
-            return
-            
         # Buscar la expresión a mostrar
-        nodo_expresion = buscar_hijo(nodo_comandos, 'expresion')
-        if nodo_expresion:
-            registro = self.generar_expresion(nodo_expresion, ambito)
+        if nodo_mostrar.argumentos:
+            registro = self.generar_expresion(nodo_mostrar.argumentos[0], ambito)
             
             if registro:
                 # Preparar llamada a printf
@@ -250,72 +227,38 @@ class GeneradorAssembly:
                 self.agregar_codigo("call printf", "llamar printf")
     
     def generar_condicional(self, nodo_condicional, ambito):
-        """Genera código para estructuras if-else"""
-        # Buscar la expresión condicional
-        nodo_expresion = buscar_hijo(nodo_condicional, 'expresion')
-        
+        """Genera código para la condición de un if-else; los bloques los cierra salir()"""
         etiqueta_false = self.nueva_etiqueta("else")
         etiqueta_end = self.nueva_etiqueta("endif")
+        self.etiquetas_abiertas.append((etiqueta_false, etiqueta_end))
         
-        if nodo_expresion:
-            registro = self.generar_expresion(nodo_expresion, ambito)
-            
-            if registro:
-                self.agregar_codigo(f"cmp $0, %{registro}", "evaluar condición")
-                self.agregar_codigo(f"je {etiqueta_false}", "saltar si falso")
-        
-        # Generar código del bloque if
-        nodo_instrucciones = buscar_hijo(nodo_condicional, 'masinstrucciones')
-        if nodo_instrucciones:
-            self.generar_instrucciones(nodo_instrucciones, ambito)
-        
-        self.agregar_codigo(f"jmp {etiqueta_end}", "saltar al final")
-        self.agregar_etiqueta(etiqueta_false)
+        registro = self.generar_expresion(nodo_condicional.condicion, ambito)
         
-        # Buscar posible bloque else
-        nodo_posibilidad = buscar_hijo(nodo_condicional, 'posibilidad')
-        if nodo_posibilidad and nodo_posibilidad.hijos:
-            primer_hijo = nodo_posibilidad.hijos[0]
-            if primer_hijo.tipo == 'sino':
-                # Hay bloque else
-                nodo_instrucciones_else = buscar_hijo(nodo_posibilidad, 'masinstrucciones')
-                if nodo_instrucciones_else:
-                    self.generar_instrucciones(nodo_instrucciones_else, ambito)
-        
-        self.agregar_etiqueta(etiqueta_end)
+        if registro:
+            self.agregar_codigo(f"cmp $0, %{registro}", "evaluar condición")
+            self.agregar_codigo(f"je {etiqueta_false}", "saltar si falso")
     
     def generar_while(self, nodo_while, ambito):
-        """Genera código para bucles while"""
+        """Genera código para el inicio de un bucle while; el cuerpo lo cierra salir()"""
         etiqueta_inicio = self.nueva_etiqueta("while_start")
         etiqueta_fin = self.nueva_etiqueta("while_end")
+        self.etiquetas_abiertas.append((etiqueta_inicio, etiqueta_fin))
         
         self.agregar_etiqueta(etiqueta_inicio)
         
         # Evaluar condición
-        nodo_expresion = buscar_hijo(nodo_while, 'expresion')
-        if nodo_expresion:
-            registro = self.generar_expresion(nodo_expresion, ambito)
-            
-            if registro:
-                self.agregar_codigo(f"cmp $0, %{registro}", "evaluar condición while")
-                self.agregar_codigo(f"je {etiqueta_fin}", "salir si falso")
+        registro = self.generar_expresion(nodo_while.condicion, ambito)
         
-        # Generar código del cuerpo
-        nodo_instrucciones = buscar_hijo(nodo_while, 'masinstrucciones')
-        if nodo_instrucciones:
-            self.generar_instrucciones(nodo_instrucciones, ambito)
-        
-        self.agregar_codigo(f"jmp {etiqueta_inicio}", "volver al inicio del bucle")
-        self.agregar_etiqueta(etiqueta_fin)
+        if registro:
+            self.agregar_codigo(f"cmp $0, %{registro}", "evaluar condición while")
+            self.agregar_codigo(f"je {etiqueta_fin}", "salir si falso")
     
     def generar_return(self, nodo_return, ambito):
         """Genera código para return"""
-        nodo_expresion = buscar_hijo(nodo_return, 'expresion')
-        if nodo_expresion:
-            registro = self.generar_expresion(nodo_expresion, ambito)
-            
-            if registro and registro != 'rax':
-                self.agregar_codigo(f"mov %{registro}, %rax", "mover valor de retorno a rax")
+        registro = self.generar_expresion(nodo_return.valor, ambito)
+        
+        if registro and registro != 'rax':
+            self.agregar_codigo(f"mov %{registro}, %rax", "mover valor de retorno a rax")
         
         # Restaurar stack y retornar
         self.agregar_codigo("mov %rbp, %rsp", "restaurar stack pointer")
@@ -323,33 +266,52 @@ class GeneradorAssembly:
         self.agregar_codigo("ret", "retornar")
     
     def generar_instruccion(self, nodo_instruccion, ambito):
-        """Genera código para una instrucción individual"""
-        if not nodo_instruccion.hijos:
-            return
-            
-        tipo_instruccion = nodo_instruccion.hijos[0]
-        
-        if tipo_instruccion.tipo == 'asignaciones':
-            self.generar_asignacion(tipo_instruccion, ambito)
-        elif tipo_instruccion.tipo == 'mostrar':
-            self.generar_show(tipo_instruccion, ambito)
-        elif tipo_instruccion.tipo == 'condicional':
-            self.generar_condicional(tipo_instruccion, ambito)
-        elif tipo_instruccion.tipo == 'buclemientras':
-            self.generar_while(tipo_instruccion, ambito)
-        elif tipo_instruccion.tipo == 'devolver':
+        """Genera código para una instrucción individual; retorna True si hay que recorrer sus bloques"""
+        if isinstance(nodo_instruccion, ASIGNACIONES):
+            self.generar_asignacion(nodo_instruccion, ambito)
+        elif isinstance(nodo_instruccion, Print):
+            self.generar_show(nodo_instruccion, ambito)
+        elif isinstance(nodo_instruccion, If):
+            self.generar_condicional(nodo_instruccion, ambito)
+            return True
+        elif isinstance(nodo_instruccion, While):
+            self.generar_while(nodo_instruccion, ambito)
+            return True
+        elif isinstance(nodo_instruccion, Return):
             self.generar_return(nodo_instruccion, ambito)
+        return False
     
-    def generar_instrucciones(self, nodo_masinstrucciones, ambito):
-        """Genera código para múltiples instrucciones"""
-        if not nodo_masinstrucciones or not nodo_masinstrucciones.hijos:
-            return
-            
-        for hijo in nodo_masinstrucciones.hijos:
-            if hijo.tipo == 'instruccion':
-                self.generar_instruccion(hijo, ambito)
-            elif hijo.tipo == 'masinstrucciones':
-                self.generar_instrucciones(hijo, ambito)
+    def generar_instrucciones(self, bloque, ambito):
+        """Genera código para las instrucciones de un Block, recorriéndolo sin recursión"""
+        self.ambito_actual = ambito
+        self.recorrer(bloque)
+    
+    def hijos(self, nodo):
+        """Bloques a recorrer: las instrucciones de un Block o los cuerpos de un if/while"""
+        if isinstance(nodo, If):
+            return [nodo.cuerpo, nodo.sino] if nodo.sino else [nodo.cuerpo]
+        if isinstance(nodo, While):
+            return [nodo.cuerpo]
+        return nodo.instrucciones
+    
+    def entrar(self, nodo, padre):
+        if isinstance(nodo, Block):
+            return SALIR if isinstance(padre, If) and nodo is padre.cuerpo else True
+        return SALIR if self.generar_instruccion(nodo, self.ambito_actual) else False
+    
+    def salir(self, nodo, padre):
+        if isinstance(nodo, Block):
+            # Bloque del if: se salta el else
+            etiqueta_false, etiqueta_end = self.etiquetas_abiertas[-1]
+            self.agregar_codigo(f"jmp {etiqueta_end}", "saltar al final")
+            self.agregar_etiqueta(etiqueta_false)
+        elif isinstance(nodo, If):
+            _, etiqueta_end = self.etiquetas_abiertas.pop()
+            self.agregar_etiqueta(etiqueta_end)
+        elif isinstance(nodo, While):
+            etiqueta_inicio, etiqueta_fin = self.etiquetas_abiertas.pop()
+            self.agregar_codigo(f"jmp {etiqueta_inicio}", "volver al inicio del bucle")
+            self.agregar_etiqueta(etiqueta_fin)
     
     def generar_funcion(self, nodo_funcion, ambito, nombre_funcion):
         """Genera código para una función"""
@@ -370,12 +332,10 @@ class GeneradorAssembly:
         self.agregar_codigo("", "# RESERVAR_ESPACIO_PLACEHOLDER")
         
         # Generar código para el cuerpo de la función
-        nodo_instrucciones = buscar_hijo(nodo_funcion, 'masinstrucciones')
-        if nodo_instrucciones:
-            # Usar el ámbito de la función
-            if ambito.hijos:
-                ambito_funcion = ambito.hijos[0]
-                self.generar_instrucciones(nodo_instrucciones, ambito_funcion)
+        # Usar el ámbito de la función
+        if ambito.hijos:
+            ambito_funcion = ambito.hijos[0]
+            self.generar_instrucciones(nodo_funcion.cuerpo, ambito_funcion)
         
         # Actualizar la reserva de espacio
         if self.stack_offset > 0:
@@ -394,54 +354,15 @@ class GeneradorAssembly:
         
         self.en_funcion = False
     
-    def generar_programa(self, nodo_programa, ambito):
-        """Genera código para todo el programa"""
-        if nodo_programa.tipo != 'programaprincipal':
-            return
-        
-        # Procesar funciones en el programa
-        nodo_actual = nodo_programa
-        indice_ambito = 0
-        
-        while nodo_actual and nodo_actual.tipo == 'programaprincipal':
-            # Buscar función definida
-            nodo_funcion = buscar_hijo(nodo_actual, 'funcion')
-            nodo_opcionprincipal = buscar_hijo(nodo_actual, 'opcionprincipal')
-            
-            if nodo_funcion and nodo_funcion.hijos:
-                # Función regular
-                nodo_func = nodo_funcion.hijos[0]  # restofuncn
-                nodo_id = buscar_hijo(nodo_func, 'id')
-                if nodo_id and nodo_id.valor:
-                    nombre_func = nodo_id.valor
-                    ambito_func = ambito if indice_ambito >= len(ambito.simbolos) else ambito
-                    self.generar_funcion(nodo_func, ambito_func, nombre_func)
-                    indice_ambito += 1
-                    
-            elif nodo_opcionprincipal and nodo_opcionprincipal.hijos:
-                # Función main o función regular
-                nodo_func = nodo_opcionprincipal.hijos[0]
-                if nodo_func.tipo == 'restomain':
-                    self.generar_funcion(nodo_func, ambito, 'main')
-                elif nodo_func.tipo == 'restofuncn':
-                    nodo_id = buscar_hijo(nodo_func, 'id')
-                    if nodo_id and nodo_id.valor:
-                        nombre_func = nodo_id.valor
-                        ambito_func = ambito if indice_ambito >= len(ambito.simbolos) else ambito
-                        self.generar_funcion(nodo_func, ambito_func, nombre_func)
-                        indice_ambito += 1
-            
-            # Continuar con más funciones
-            nodo_masfuncn = buscar_hijo(nodo_actual, 'masfuncn')
-            if nodo_masfuncn and nodo_masfuncn.hijos:
-                nodo_actual = nodo_masfuncn.hijos[0]
-            else:
-                break
+    def generar_programa(self, programa, ambito):
+        """Genera código para todo el programa (Program)"""
+        for funcion in programa.funciones:
+            self.generar_funcion(funcion, ambito, funcion.nombre)
     
-    def generar(self, arbol_sintactico, tabla_simbolos):
-        """Función principal que genera todo el código assembly"""
+    def generar(self, arbol_abstracto, tabla_simbolos):
+        """Función principal que genera todo el código assembly a partir del AST"""
         self.generar_preambulo()
-        self.generar_programa(arbol_sintactico, tabla_simbolos)
+        self.generar_programa(arbol_abstracto, tabla_simbolos)
         self.generar_epilogo()
         
         return '\n'.join(self.codigo)
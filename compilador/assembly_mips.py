@@ -1,13 +1,19 @@
 import os
+from arbol_abstracto import ASIGNACIONES
+from arbol_abstracto import BinOp
+from arbol_abstracto import Block
+from arbol_abstracto import Call
+from arbol_abstracto import CallStmt
+from arbol_abstracto import If
+from arbol_abstracto import Literal
+from arbol_abstracto import Name
+from arbol_abstracto import Paren
+from arbol_abstracto import Return
+from arbol_abstracto import While
+from recorrido import SALIR
+from recorrido import Visitante
 
-def buscar_hijo(nodo, tipo):
-    """Encuentra un hijo con el tipo especificado."""
-    for hijo in nodo.hijos:
-        if hijo.tipo == tipo:
-            return hijo
-    return None
-
-class GeneradorAssemblyMIPS:
+class GeneradorAssemblyMIPS(Visitante):
     def __init__(self):
         self.codigo = []
         self.contador_etiquetas = 0
@@ -16,6 +22,9 @@ class GeneradorAssemblyMIPS:
         self.offset_actual = 0
         self.en_funcion = False
         self.funciones_declaradas = set()
+        # Ámbito de las instrucciones que se recorren y etiquetas de los if/while abiertos
+        self.ambito_actual = None
+        self.etiquetas_abiertas = []
         
     def nueva_etiqueta(self, prefijo="L"):
         """Genera una nueva etiqueta única"""
@@ -67,48 +76,54 @@ class GeneradorAssemblyMIPS:
         return self.offset_variables[nombre_var]
     
     def generar_expresion(self, nodo_expresion, ambito, registro_destino="$t0"):
-        """Genera código para una expresión y retorna el registro resultado"""
-        if not nodo_expresion:
-            return None
-            
-        if nodo_expresion.tipo == 'expresion':
-            primer_hijo = nodo_expresion.hijos[0] if nodo_expresion.hijos else None
+        """Genera código para una expresión del AST y retorna el registro resultado.
+
+        Solo se sigue la cadena de operaciones hacia la derecha (un paréntesis
+        la termina), así que se recorre con un bucle: cada BinOp cuyo operando
+        izquierdo se cargó queda pendiente hasta generar su lado derecho.
+        """
+        pendientes = []
+        registro = None
+        while nodo_expresion:
+            # Una expresión es un operando o un BinOp con el operando a la izquierda
+            operando = nodo_expresion.izquierda if isinstance(nodo_expresion, BinOp) else nodo_expresion
             
-            if primer_hijo and primer_hijo.tipo == 'valordato':
-                return self.generar_valor_dato(primer_hijo, registro_destino)
+            if isinstance(operando, Literal):
+                registro = self.generar_valor_dato(operando, registro_destino)
             
-            elif primer_hijo and primer_hijo.tipo == 'id':
-                nombre_var = primer_hijo.valor
+            elif isinstance(operando, (Name, Call)):
+                nombre_var = operando.nombre
                 offset = self.obtener_offset_variable(nombre_var, ambito)
                 
                 if offset is not None:
                     self.agregar_codigo(f"lw {registro_destino}, -{offset}($fp)", f"cargar variable {nombre_var}")
                     
                     # Verificar si hay operaciones adicionales
-                    masexpresiones = buscar_hijo(nodo_expresion, 'masexpresiones')
-                    if masexpresiones and masexpresiones.hijos and masexpresiones.hijos[0].tipo != 'e':
-                        return self.generar_operacion_binaria(registro_destino, masexpresiones, ambito)
+                    if isinstance(nodo_expresion, BinOp):
+                        # El operando derecho se genera en un temporal nuevo
+                        registro_der = self.nuevo_temporal()
+                        pendientes.append((registro_destino, nodo_expresion, registro_der))
+                        nodo_expresion = nodo_expresion.derecha
+                        registro_destino = registro_der
+                        continue
                     
-                    return registro_destino
+                    registro = registro_destino
                 
-            elif primer_hijo and primer_hijo.tipo == 'pabierto':
+            elif isinstance(operando, Paren):
                 # Expresión entre paréntesis
-                expr_interna = buscar_hijo(nodo_expresion, 'expresion')
-                if expr_interna:
-                    return self.generar_expresion(expr_interna, ambito, registro_destino)
-                    
-        elif nodo_expresion.tipo == 'valordato':
-            return self.generar_valor_dato(nodo_expresion, registro_destino)
-            
-        return None
+                nodo_expresion = operando.expresion
+                continue
+            break
+        
+        # Cerrar las operaciones pendientes, de la más interna a la más externa
+        for registro_izq, nodo_binop, registro_der in reversed(pendientes):
+            registro = self.generar_operacion_binaria(registro_izq, nodo_binop, registro_der)
+        return registro
     
-    def generar_valor_dato(self, nodo_valordato, registro_destino="$t0"):
+    def generar_valor_dato(self, nodo_literal, registro_destino="$t0"):
         """Genera código para un valor literal"""
-        if not nodo_valordato.hijos:
-            return None
-            
-        tipo_valor = nodo_valordato.hijos[0].tipo
-        valor = nodo_valordato.hijos[0].valor
+        tipo_valor = nodo_literal.tipo
+        valor = nodo_literal.valor
         
         if tipo_valor == 'nentero':
             self.agregar_codigo(f"li {registro_destino}, {valor}", f"cargar entero {valor}")
@@ -128,23 +143,10 @@ class GeneradorAssemblyMIPS:
             
         return None
     
-    def generar_operacion_binaria(self, registro_izq, nodo_masexpresiones, ambito):
-        """Genera código para operaciones binarias"""
-        if not nodo_masexpresiones or not nodo_masexpresiones.hijos:
-            return registro_izq
-            
-        nodo_operacion = buscar_hijo(nodo_masexpresiones, 'operacion')
-        nodo_expr_der = buscar_hijo(nodo_masexpresiones, 'expresion')
-        
-        if not nodo_operacion or not nodo_expr_der:
-            return registro_izq
-        
-        # Generar el operando derecho
-        registro_der = self.nuevo_temporal()
-        self.generar_expresion(nodo_expr_der, ambito, registro_der)
-        
+    def generar_operacion_binaria(self, registro_izq, nodo_binop, registro_der):
+        """Genera código para operaciones binarias, con el operando derecho ya generado"""
         # Generar la operación
-        tipo_op = nodo_operacion.hijos[0].tipo
+        tipo_op = nodo_binop.operador
         registro_resultado = self.nuevo_temporal()
         
         if tipo_op == 'suma':
@@ -167,29 +169,13 @@ class GeneradorAssemblyMIPS:
         
         return registro_resultado
     
-    def generar_asignacion(self, nodo_asignaciones, ambito):
-        """Genera código para asignaciones"""
-        nodo_id = buscar_hijo(nodo_asignaciones, 'id')
-        nodo_ext = buscar_hijo(nodo_asignaciones, 'ext')
-        
-        if not nodo_id or not nodo_ext:
+    def generar_asignacion(self, nodo_asignacion, ambito):
+        """Genera código para asignaciones (VarDecl o Assign; una CallStmt no asigna nada)"""
+        if isinstance(nodo_asignacion, CallStmt):
             return
             
-        nombre_var = nodo_id.valor
-        
-        # Buscar la expresión a asignar
-        nodo_expresion = None
-        
-        # Caso 1: declaración con tipo
-        if nodo_ext.hijos and nodo_ext.hijos[0].tipo == 'tipodato':
-            nodo_opcionesasig = buscar_hijo(nodo_ext, 'opcionesasig')
-            if nodo_opcionesasig and nodo_opcionesasig.hijos:
-                nodo_expresion = buscar_hijo(nodo_opcionesasig, 'expresion')
-        
-        # Caso 2: asignación directa
-        elif nodo_ext.hijos and nodo_ext.hijos[0].tipo == 'extension':
-            nodo_extension = nodo_ext.hijos[0]
-            nodo_expresion = buscar_hijo(nodo_extension, 'expresion')
+        nombre_var = nodo_asignacion.nombre
+        nodo_expresion = nodo_asignacion.valor
         
         if nodo_expresion:
             # Generar código para la expresión
@@ -202,83 +188,37 @@ class GeneradorAssemblyMIPS:
                     self.agregar_codigo(f"sw {registro}, -{offset}($fp)", f"asignar a {nombre_var}")
     
     def generar_condicional(self, nodo_condicional, ambito):
-        """Genera código para estructuras if-else"""
-        # Buscar la expresión condicional
-        nodo_expresion = buscar_hijo(nodo_condicional, 'expresion')
-        
+        """Genera código para la condición de un if-else; los bloques los cierra salir()"""
         etiqueta_else = self.nueva_etiqueta("else")
         etiqueta_endif = self.nueva_etiqueta("endif")
+        self.etiquetas_abiertas.append((etiqueta_else, etiqueta_endif))
         
-        if nodo_expresion:
-            registro_condicion = self.generar_expresion(nodo_expresion, ambito)
-            
-            if registro_condicion:
-                # Si la condición es falsa (0), saltar al else
-                self.agregar_codigo(f"beq {registro_condicion}, $zero, {etiqueta_else}", "saltar si falso")
-        
-        # Generar código del bloque if
-        nodo_instrucciones = buscar_hijo(nodo_condicional, 'masinstrucciones')
-        if nodo_instrucciones:
-            self.generar_instrucciones(nodo_instrucciones, ambito)
-        
-        # Saltar al final (evitar ejecutar el else)
-        self.agregar_codigo(f"j {etiqueta_endif}", "saltar al final")
-        
-        # Etiqueta del else
-        self.agregar_etiqueta(etiqueta_else)
-        
-        # Buscar posible bloque else
-        nodo_posibilidad = buscar_hijo(nodo_condicional, 'posibilidad')
-        if nodo_posibilidad and nodo_posibilidad.hijos:
-            primer_hijo = nodo_posibilidad.hijos[0]
-            if primer_hijo.tipo == 'sino':
-                # Hay bloque else
-                nodo_instrucciones_else = buscar_hijo(nodo_posibilidad, 'masinstrucciones')
-                if nodo_instrucciones_else:
-                    self.generar_instrucciones(nodo_instrucciones_else, ambito)
-            elif primer_hijo.tipo == 'entonces':
-                # Hay bloque entonces (else-if)
-                nodo_instrucciones_entonces = buscar_hijo(nodo_posibilidad, 'masinstrucciones')
-                if nodo_instrucciones_entonces:
-                    self.generar_instrucciones(nodo_instrucciones_entonces, ambito)
+        registro_condicion = self.generar_expresion(nodo_condicional.condicion, ambito)
         
-        # Etiqueta del final
-        self.agregar_etiqueta(etiqueta_endif)
+        if registro_condicion:
+            # Si la condición es falsa (0), saltar al else
+            self.agregar_codigo(f"beq {registro_condicion}, $zero, {etiqueta_else}", "saltar si falso")
     
     def generar_while(self, nodo_while, ambito):
-        """Genera código para bucles while"""
+        """Genera código para el inicio de un bucle while; el cuerpo lo cierra salir()"""
         etiqueta_inicio = self.nueva_etiqueta("while_start")
         etiqueta_fin = self.nueva_etiqueta("while_end")
+        self.etiquetas_abiertas.append((etiqueta_inicio, etiqueta_fin))
         
         # Etiqueta del inicio del bucle
         self.agregar_etiqueta(etiqueta_inicio)
         
         # Evaluar condición
-        nodo_expresion = buscar_hijo(nodo_while, 'expresion')
-        if nodo_expresion:
-            registro_condicion = self.generar_expresion(nodo_expresion, ambito)
-            
-            if registro_condicion:
-                # Si la condición es falsa, salir del bucle
-                self.agregar_codigo(f"beq {registro_condicion}, $zero, {etiqueta_fin}", "salir si falso")
-        
-        # Generar código del cuerpo
-        nodo_instrucciones = buscar_hijo(nodo_while, 'masinstrucciones')
-        if nodo_instrucciones:
-            self.generar_instrucciones(nodo_instrucciones, ambito)
+        registro_condicion = self.generar_expresion(nodo_while.condicion, ambito)
         
-        # Volver al inicio del bucle
-        self.agregar_codigo(f"j {etiqueta_inicio}", "volver al inicio del bucle")
-        
-        # Etiqueta del final
-        self.agregar_etiqueta(etiqueta_fin)
+        if registro_condicion:
+            # Si la condición es falsa, salir del bucle
+            self.agregar_codigo(f"beq {registro_condicion}, $zero, {etiqueta_fin}", "salir si falso")
     
     def generar_return(self, nodo_return, ambito):
         """Genera código para return"""
-        nodo_expresion = buscar_hijo(nodo_return, 'expresion')
-        if nodo_expresion:
-            # El valor de retorno va en $v0
-            self.generar_expresion(nodo_expresion, ambito, "$v0")
+        # El valor de retorno va en $v0
+        self.generar_expresion(nodo_return.valor, ambito, "$v0")
         
         if self.en_funcion and self.en_funcion != 'main':
             # Restaurar frame pointer y retornar
@@ -293,31 +233,50 @@ class GeneradorAssemblyMIPS:
             self.agregar_codigo("syscall", "terminar programa")
     
     def generar_instruccion(self, nodo_instruccion, ambito):
-        """Genera código para una instrucción individual"""
-        if not nodo_instruccion.hijos:
-            return
-            
-        tipo_instruccion = nodo_instruccion.hijos[0]
-        
-        if tipo_instruccion.tipo == 'asignaciones':
-            self.generar_asignacion(tipo_instruccion, ambito)
-        elif tipo_instruccion.tipo == 'condicional':
-            self.generar_condicional(tipo_instruccion, ambito)
-        elif tipo_instruccion.tipo == 'buclemientras':
-            self.generar_while(tipo_instruccion, ambito)
-        elif tipo_instruccion.tipo == 'devolver':
+        """Genera código para una instrucción individual; retorna True si hay que recorrer sus bloques"""
+        if isinstance(nodo_instruccion, ASIGNACIONES):
+            self.generar_asignacion(nodo_instruccion, ambito)
+        elif isinstance(nodo_instruccion, If):
+            self.generar_condicional(nodo_instruccion, ambito)
+            return True
+        elif isinstance(nodo_instruccion, While):
+            self.generar_while(nodo_instruccion, ambito)
+            return True
+        elif isinstance(nodo_instruccion, Return):
             self.generar_return(nodo_instruccion, ambito)
+        return False
     
-    def generar_instrucciones(self, nodo_masinstrucciones, ambito):
-        """Genera código para múltiples instrucciones"""
-        if not nodo_masinstrucciones or not nodo_masinstrucciones.hijos:
-            return
-            
-        for hijo in nodo_masinstrucciones.hijos:
-            if hijo.tipo == 'instruccion':
-                self.generar_instruccion(hijo, ambito)
-            elif hijo.tipo == 'masinstrucciones':
-                self.generar_instrucciones(hijo, ambito)
+    def generar_instrucciones(self, bloque, ambito):
+        """Genera código para las instrucciones de un Block, recorriéndolo sin recursión"""
+        self.ambito_actual = ambito
+        self.recorrer(bloque)
+    
+    def hijos(self, nodo):
+        """Bloques a recorrer: las instrucciones de un Block o los cuerpos de un if/while"""
+        if isinstance(nodo, If):
+            return [nodo.cuerpo, nodo.sino] if nodo.sino else [nodo.cuerpo]
+        if isinstance(nodo, While):
+            return [nodo.cuerpo]
+        return nodo.instrucciones
+    
+    def entrar(self, nodo, padre):
+        if isinstance(nodo, Block):
+            return SALIR if isinstance(padre, If) and nodo is padre.cuerpo else True
+        return SALIR if self.generar_instruccion(nodo, self.ambito_actual) else False
+    
+    def salir(self, nodo, padre):
+        if isinstance(nodo, Block):
+            # Bloque del if: se salta el else
+            etiqueta_else, etiqueta_endif = self.etiquetas_abiertas[-1]
+            self.agregar_codigo(f"j {etiqueta_endif}", "saltar al final")
+            self.agregar_etiqueta(etiqueta_else)
+        elif isinstance(nodo, If):
+            _, etiqueta_endif = self.etiquetas_abiertas.pop()
+            self.agregar_etiqueta(etiqueta_endif)
+        elif isinstance(nodo, While):
+            etiqueta_inicio, etiqueta_fin = self.etiquetas_abiertas.pop()
+            self.agregar_codigo(f"j {etiqueta_inicio}", "volver al inicio del bucle")
+            self.agregar_etiqueta(etiqueta_fin)
     
     def generar_funcion(self, nodo_funcion, ambito, nombre_funcion):
         """Genera código para una función con soporte para recursividad"""
@@ -342,18 +301,16 @@ class GeneradorAssemblyMIPS:
             # (se calculará dinámicamente)
         
         # Generar código para el cuerpo de la función
-        nodo_instrucciones = buscar_hijo(nodo_funcion, 'masinstrucciones')
-        if nodo_instrucciones:
-            # Usar el ámbito de la función
-            if ambito.hijos:
-                ambito_funcion = ambito.hijos[0]
-                
-                # Reservar espacio para variables locales
-                if self.offset_variables:
-                    max_offset = max(self.offset_variables.values())
-                    self.agregar_codigo(f"addiu $sp, $sp, -{max_offset}", "reservar espacio para variables locales")
-                
-                self.generar_instrucciones(nodo_instrucciones, ambito_funcion)
+        # Usar el ámbito de la función
+        if ambito.hijos:
+            ambito_funcion = ambito.hijos[0]
+            
+            # Reservar espacio para variables locales
+            if self.offset_variables:
+                max_offset = max(self.offset_variables.values())
+                self.agregar_codigo(f"addiu $sp, $sp, -{max_offset}", "reservar espacio para variables locales")
+            
+            self.generar_instrucciones(nodo_funcion.cuerpo, ambito_funcion)
         
         # Epílogo por defecto (si no hay return explícito)
         if nombre_funcion == 'main':
@@ -371,49 +328,15 @@ class GeneradorAssemblyMIPS:
         self.agregar_codigo("", "")
         self.en_funcion = False
     
-    def generar_programa(self, nodo_programa, ambito):
-        """Genera código para todo el programa"""
-        if nodo_programa.tipo != 'programaprincipal':
-            return
-        
-        # Procesar funciones en el programa
-        nodo_actual = nodo_programa
-        
-        while nodo_actual and nodo_actual.tipo == 'programaprincipal':
-            # Buscar función definida
-            nodo_funcion = buscar_hijo(nodo_actual, 'funcion')
-            nodo_opcionprincipal = buscar_hijo(nodo_actual, 'opcionprincipal')
-            
-            if nodo_funcion and nodo_funcion.hijos:
-                # Función regular
-                nodo_func = nodo_funcion.hijos[0]  # restofuncn
-                nodo_id = buscar_hijo(nodo_func, 'id')
-                if nodo_id and nodo_id.valor:
-                    nombre_func = nodo_id.valor
-                    self.generar_funcion(nodo_func, ambito, nombre_func)
-                    
-            elif nodo_opcionprincipal and nodo_opcionprincipal.hijos:
-                # Función main o función regular
-                nodo_func = nodo_opcionprincipal.hijos[0]
-                if nodo_func.tipo == 'restomain':
-                    self.generar_funcion(nodo_func, ambito, 'main')
-                elif nodo_func.tipo == 'restofuncn':
-                    nodo_id = buscar_hijo(nodo_func, 'id')
-                    if nodo_id and nodo_id.valor:
-                        nombre_func = nodo_id.valor
-                        self.generar_funcion(nodo_func, ambito, nombre_func)
-            
-            # Continuar con más funciones
-            nodo_masfuncn = buscar_hijo(nodo_actual, 'masfuncn')
-            if nodo_masfuncn and nodo_masfuncn.hijos:
-                nodo_actual = nodo_masfuncn.hijos[0]
-            else:
-                break
+    def generar_programa(self, programa, ambito):
+        """Genera código para todo el programa (Program)"""
+        for funcion in programa.funciones:
+            self.generar_funcion(funcion, ambito, funcion.nombre)
     
-    def generar(self, arbol_sintactico, tabla_simbolos):
-        """Función principal que genera todo el código MIPS"""
+    def generar(self, arbol_abstracto, tabla_simbolos):
+        """Función principal que genera todo el código MIPS a partir del AST"""
         self.generar_preambulo()
-        self.generar_programa(arbol_sintactico, tabla_simbolos)
+        self.generar_programa(arbol_abstracto, tabla_simbolos)
         
         return '\n'.join(self.codigo)
 
@@ -0,0 +1,125 @@
+import os
+import sys
+import marshal
+import hashlib
+from array import array
+
+import lexico
+from lexico import Error
+from lexico import IndiceLineas
+from lexico import TokenBuffer
+
+# Carpeta de la caché, junto a las tablas de tokens que genera el compilador.
+DIRECTORIO_CACHE = os.path.join('salida-tokens', '.cache')
+
+# Tamaño máximo de la caché; al superarlo se borran las entradas usadas hace más tiempo.
+TAMANO_MAXIMO_CACHE = 64 * 1024 * 1024
+
+# Versión del formato de las entradas; cambiarla invalida toda la caché.
+FORMATO_CACHE = 1
+
+EXTENSION_ENTRADA = '.tok'
+
+def _calcular_version_lexico():
+    """Huella del analizador léxico: cambia con cualquier modificación de lexico.py."""
+    huella = hashlib.sha256()
+    with open(lexico.__file__, 'rb') as f:
+        huella.update(f.read())
+    huella.update(f"{FORMATO_CACHE}:{marshal.version}:{sys.version_info[:2]}".encode('ascii'))
+    return huella.hexdigest()
+
+version_lexico = _calcular_version_lexico()
+
+class CacheTokens:
+    """Caché en disco de los tokens de cada archivo fuente.
+
+    Cada entrada se identifica por el hash de los bytes del archivo y de la
+    versión del analizador léxico, así que nunca devuelve tokens de un
+    contenido distinto ni de otra versión del analizador. Se guardan los
+    arreglos de tipos y posiciones, los valores y los errores léxicos en un
+    único bloque marshal; la tabla de líneas se reconstruye con el texto.
+    Las entradas se ordenan por fecha de último uso y, al superar
+    `tamano_maximo` bytes, se borran las menos usadas recientemente (LRU).
+    """
+
+    def __init__(self, directorio=DIRECTORIO_CACHE, tamano_maximo=TAMANO_MAXIMO_CACHE):
+        self.directorio = directorio
+        self.tamano_maximo = tamano_maximo
+        self.aciertos = 0
+        self.fallos = 0
+
+    def clave(self, datos):
+        """Clave de la entrada para los bytes `datos` de un archivo fuente."""
+        huella = hashlib.sha256(version_lexico.encode('ascii'))
+        huella.update(datos)
+        return huella.hexdigest()
+
+    def _ruta(self, clave):
+        return os.path.join(self.directorio, clave + EXTENSION_ENTRADA)
+
+    def obtener(self, datos, contenido):
+        """Retorna (tokens, errores) guardados para `datos`, o None si no están en la caché.
+
+        `contenido` es el texto ya decodificado de `datos`, con el que se
+        construye el índice de líneas de los tokens.
+        """
+        ruta = self._ruta(self.clave(datos))
+        try:
+            with open(ruta, 'rb') as f:
+                tipos, inicios, valores, errores_guardados = marshal.loads(f.read())
+            os.utime(ruta)
+        except (OSError, EOFError, ValueError, TypeError):
+            self.fallos += 1
+            return None
+
+        indice_lineas = IndiceLineas(contenido)
+        tokens = TokenBuffer(indice_lineas)
+        tokens.tipos = array('B', tipos)
+        tokens.inicios = array('I', inicios)
+        tokens.valores = valores
+        errores = []
+        for mensaje, inicio in errores_guardados:
+            linea, columna = indice_lineas.posicion(inicio)
+            errores.append(Error(mensaje, linea, columna, inicio))
+        self.aciertos += 1
+        return tokens, errores
+
+    def guardar(self, datos, tokens, errores):
+        """Guarda los tokens y errores de `datos` y aplica el límite de tamaño."""
+        os.makedirs(self.directorio, exist_ok=True)
+        ruta = self._ruta(self.clave(datos))
+        entrada = marshal.dumps((tokens.tipos.tobytes(), tokens.inicios.tobytes(), list(tokens.valores),
+                                 [(error.mensaje, error.inicio) for error in errores]))
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        with open(temporal, 'wb') as f:
+            f.write(entrada)
+        os.replace(temporal, ruta)
+        self.recortar()
+
+    def recortar(self):
+        """Borra las entradas usadas hace más tiempo hasta respetar el tamaño máximo."""
+        entradas = []
+        total = 0
+        with os.scandir(self.directorio) as elementos:
+            for elemento in elementos:
+                if elemento.name.endswith(EXTENSION_ENTRADA):
+                    informacion = elemento.stat()
+                    entradas.append((informacion.st_mtime, informacion.st_size, elemento.path))
+                    total += informacion.st_size
+        entradas.sort()
+        for _, tamano, ruta in entradas:
+            if total <= self.tamano_maximo:
+                break
+            try:
+                os.remove(ruta)
+            except OSError:
+                pass
+            total -= tamano
+
+    def limpiar(self):
+        """Borra todas las entradas de la caché."""
+        if not os.path.isdir(self.directorio):
+            return
+        for nombre in os.listdir(self.directorio):
+            if nombre.endswith(EXTENSION_ENTRADA):
+                os.remove(os.path.join(self.directorio, nombre))
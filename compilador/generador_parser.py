@@ -0,0 +1,315 @@
+import os
+import types
+import keyword
+import marshal
+import hashlib
+import argparse
+
+from lexico import CODIGO_FIN
+from lexico import codigo_tipo_token
+from lexico import nombres_tipos_token
+
+# Módulo generado; no se versiona porque se regenera cuando cambia su huella.
+RUTA_PARSER_GENERADO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'parser_generado.py')
+
+# Nombres locales de `analizar` que no pueden usar las funciones de los no terminales.
+NOMBRES_RESERVADOS = {
+    'lista_de_tokens', 'Nodo', 'ErrorSintactico', 'tipos', 'valores', 'siguiente_posicion', 'errores',
+    'indice', 'contador', 'nodo', 'siguiente', 'codigo', 'produccion', 'arbol', 'nodo_dolar', 'fallar',
+}
+
+# Producción vacía 'e', como en sintactico.produccion_vacia.
+produccion_vacia = ((codigo_tipo_token('e'), True),)
+
+# Parsers ya compilados en este proceso: ruta -> (tabla, huella, función analizar).
+_parsers_cargados = {}
+
+def _calcular_version_generador():
+    """Huella de este generador: cambia con cualquier modificación de generador_parser.py."""
+    with open(os.path.abspath(__file__), 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+version_generador = _calcular_version_generador()
+
+def huella_parser(tabla, ruta_gramatica):
+    """Hash de la tabla compilada, la gramática y el generador con el que se valida el parser generado.
+
+    Incluye los nombres de los códigos, porque el módulo generado compara
+    códigos enteros y estos dependen del orden en que se registran. Se usa la
+    versión 2 de marshal: desde la 3 los objetos con más de una referencia se
+    escriben como referencias, y los bytes cambiarían con el resto del proceso.
+    """
+    nombres = nombres_tipos_token[:max(max(tabla.no_terminales), max(tabla.terminales)) + 1]
+    huella = hashlib.sha256(version_generador.encode('ascii'))
+    huella.update(marshal.dumps((nombres, tabla.no_terminales, tabla.terminales, tabla.matriz), 2))
+    if os.path.exists(ruta_gramatica):
+        with open(ruta_gramatica, 'rb') as f:
+            huella.update(f.read())
+    return huella.hexdigest()
+
+def leer_gramatica(ruta):
+    """Lee gramatica.txt y retorna {no terminal: [reglas]} para documentar el módulo generado."""
+    reglas = {}
+    if not os.path.exists(ruta):
+        return reglas
+    with open(ruta, 'r', encoding='utf-8') as f:
+        for linea in f:
+            if '->' not in linea:
+                continue
+            izquierda, derecha = linea.split('->', 1)
+            reglas.setdefault(izquierda.strip(), []).append(f"{izquierda.strip()} -> {derecha.strip()}")
+    return reglas
+
+def _nombre_funcion(codigo):
+    """Nombre de la función de un no terminal; se añade un prefijo si no es un identificador libre."""
+    nombre = nombres_tipos_token[codigo]
+    if not nombre.isidentifier():
+        return f"nt_{codigo}"
+    if keyword.iskeyword(nombre) or nombre in NOMBRES_RESERVADOS:
+        return f"nt_{nombre}"
+    return nombre
+
+class GeneradorParser:
+    """Genera un analizador descendente recursivo a partir de una TablaLL1.
+
+    Cada no terminal se convierte en una función que elige la producción con
+    un diccionario (terminal -> número de producción) construido con las
+    celdas de su fila, es decir, con los conjuntos PRIMERO y SIGUIENTE ya
+    resueltos en la tabla, y crea los hijos de la producción con los mismos
+    ids y en el mismo orden que `analizador_sintactico`: el árbol y los
+    errores resultantes son idénticos.
+
+    Para que la profundidad de Python no crezca con la longitud del programa,
+    el último símbolo de una producción no se llama recursivamente: si es el
+    mismo no terminal se repite el bucle de la función y si es otro se
+    retorna (función, nodo) para que quien llamó continúe con él. Solo el
+    anidamiento de bloques y paréntesis usa la pila de Python.
+    """
+
+    def __init__(self, tabla, gramatica=None):
+        self.tabla = tabla
+        self.gramatica = gramatica or {}
+        self.nombres = {nt: _nombre_funcion(nt) for nt in tabla.no_terminales}
+        self.producciones = {}
+        self.despachos = {}
+        for no_terminal in tabla.no_terminales:
+            producciones = []
+            despacho = {}
+            for terminal in tabla.terminales:
+                produccion = tabla.matriz[no_terminal][terminal]
+                if not produccion:
+                    despacho[terminal] = -1
+                    continue
+                if produccion not in producciones:
+                    producciones.append(produccion)
+                despacho[terminal] = producciones.index(produccion)
+            self.producciones[no_terminal] = producciones
+            self.despachos[no_terminal] = despacho
+        # Una función retorna (función, nodo) si alguna producción termina en otro no terminal.
+        self.retorna_continuacion = {
+            no_terminal: any(not p[-1][1] and p[-1][0] != no_terminal for p in producciones)
+            for no_terminal, producciones in self.producciones.items()
+        }
+        # Código que ningún terminal espera: marca el final de los tokens sin comprobar índices.
+        esperados = {simbolo for producciones in self.producciones.values()
+                     for produccion in producciones for simbolo, es_terminal in produccion if es_terminal}
+        esperados.add(CODIGO_FIN)
+        self.centinela = next(codigo for codigo in range(256) if codigo not in esperados)
+
+    def generar(self, huella):
+        """Retorna el código fuente del módulo generado."""
+        lineas = [
+            '"""Analizador sintáctico descendente recursivo generado por generador_parser.py.',
+            '',
+            'No editar: se regenera a partir de la tabla LL(1) y de gramatica.txt cuando',
+            'cambia su huella.',
+            '"""',
+            '',
+            f"HUELLA = {huella!r}",
+            '',
+            'class _Fallo(Exception):',
+            '    """Detiene el análisis en el primer error, como analizador_sintactico."""',
+            '',
+        ]
+        for no_terminal in self.tabla.no_terminales:
+            despacho = ', '.join(f"{terminal}: {produccion}"
+                                 for terminal, produccion in sorted(self.despachos[no_terminal].items()))
+            lineas.append(f"_DESPACHO_{self.nombres[no_terminal]} = {{{despacho}}}")
+        lineas += [
+            '',
+            'def analizar(lista_de_tokens, Nodo, ErrorSintactico):',
+            '    """Analiza un TokenBuffer terminado en $; retorna (exito, arbol, errores)."""',
+            f"    tipos = bytes(lista_de_tokens.tipos) + bytes(({self.centinela},))",
+            '    valores = lista_de_tokens.valores',
+            '    # Los terminales se consumen en orden, uno por token.',
+            '    siguiente_posicion = lista_de_tokens.posiciones().__next__',
+            '    errores = []',
+            '    indice = 0',
+            '    contador = 2',
+            '',
+            '    def fallar(esperado, encontrado):',
+            '        token_error = lista_de_tokens[indice]',
+            '        errores.append(ErrorSintactico(esperado, encontrado, token_error.linea, token_error.columna))',
+            '        raise _Fallo',
+        ]
+        for no_terminal in self.tabla.no_terminales:
+            lineas.append('')
+            lineas += self._generar_funcion(no_terminal)
+
+        inicial = self.tabla.inicial
+        lineas += [
+            '',
+            f"    nodo_dolar = Nodo(0, '$', None, None, None, True, {CODIGO_FIN})",
+            f"    arbol = Nodo(1, {nombres_tipos_token[inicial]!r}, None, None, None, False, {inicial})",
+            '    try:',
+            f"        siguiente = {self.nombres[inicial]}(arbol)",
+            '        while siguiente is not None:',
+            '            siguiente = siguiente[0](siguiente[1])',
+        ]
+        lineas += self._generar_terminal('nodo_dolar', CODIGO_FIN, '        ')
+        lineas += [
+            '    except _Fallo:',
+            '        return False, None, errores',
+            '    return indice == len(lista_de_tokens.tipos), arbol, errores',
+            '',
+        ]
+        return '\n'.join(lineas)
+
+    def _generar_funcion(self, no_terminal):
+        nombre = nombres_tipos_token[no_terminal]
+        funcion = self.nombres[no_terminal]
+        producciones = self.producciones[no_terminal]
+        bucle = any(not p[-1][1] and p[-1][0] == no_terminal for p in producciones)
+        lineas = [f"    def {funcion}(nodo):"]
+        reglas = self.gramatica.get(nombre)
+        if reglas:
+            lineas.append('        """' + '\n           '.join(reglas) + '"""')
+        lineas.append('        nonlocal indice, contador')
+        sangria = '        '
+        if bucle:
+            lineas.append('        while True:')
+            sangria += '    '
+        lineas.append(f"{sangria}produccion = _DESPACHO_{funcion}.get(tipos[indice])")
+        for numero, produccion in enumerate(producciones):
+            condicion = 'if' if numero == 0 else 'elif'
+            lineas.append(f"{sangria}{condicion} produccion == {numero}:")
+            lineas += self._generar_produccion(no_terminal, produccion, sangria + '    ')
+        if producciones:
+            lineas.append(f"{sangria}else:")
+            lineas.append(f"{sangria}    fallar({nombre!r}, '' if produccion is None else 'e')")
+        else:
+            lineas.append(f"{sangria}fallar({nombre!r}, '' if produccion is None else 'e')")
+        return lineas
+
+    def _generar_produccion(self, no_terminal, produccion, sangria):
+        lineas = []
+        if produccion == produccion_vacia:
+            lineas += [
+                f"{sangria}hijo = Nodo(contador, 'e', 'e', None, None, True, {produccion[0][0]})",
+                f"{sangria}contador += 1",
+                f"{sangria}hijo.padre = nodo",
+                f"{sangria}nodo.hijos.append(hijo)",
+                f"{sangria}return",
+            ]
+            return lineas
+
+        hijos = [f"h{posicion}" for posicion in range(len(produccion))]
+        for posicion, (simbolo, es_terminal) in enumerate(produccion):
+            desplazamiento = f" + {posicion}" if posicion else ''
+            lineas.append(f"{sangria}{hijos[posicion]} = Nodo(contador{desplazamiento}, "
+                          f"{nombres_tipos_token[simbolo]!r}, None, None, None, {es_terminal}, {simbolo})")
+        lineas.append(f"{sangria}contador += {len(produccion)}")
+        lineas.append(f"{sangria}{' = '.join(h + '.padre' for h in hijos)} = nodo")
+        lineas.append(f"{sangria}nodo.hijos.extend([{', '.join(hijos)}])")
+
+        for posicion, (simbolo, es_terminal) in enumerate(produccion):
+            hijo = hijos[posicion]
+            ultimo = posicion == len(produccion) - 1
+            if es_terminal:
+                lineas += self._generar_terminal(hijo, simbolo, sangria)
+                if ultimo:
+                    lineas.append(f"{sangria}return")
+            elif ultimo and simbolo == no_terminal:
+                lineas.append(f"{sangria}nodo = {hijo}")
+                lineas.append(f"{sangria}continue")
+            elif ultimo:
+                lineas.append(f"{sangria}return {self.nombres[simbolo]}, {hijo}")
+            elif self.retorna_continuacion[simbolo]:
+                lineas.append(f"{sangria}siguiente = {self.nombres[simbolo]}({hijo})")
+                lineas.append(f"{sangria}while siguiente is not None:")
+                lineas.append(f"{sangria}    siguiente = siguiente[0](siguiente[1])")
+            else:
+                lineas.append(f"{sangria}{self.nombres[simbolo]}({hijo})")
+        return lineas
+
+    def _generar_terminal(self, hijo, simbolo, sangria):
+        return [
+            f"{sangria}if tipos[indice] != {simbolo}:",
+            f"{sangria}    raise _Fallo",
+            f"{sangria}{hijo}.valor = valores[indice]",
+            f"{sangria}{hijo}.linea, {hijo}.columna = siguiente_posicion()",
+            f"{sangria}indice += 1",
+        ]
+
+def generar_parser(tabla, ruta_gramatica, ruta=RUTA_PARSER_GENERADO):
+    """Genera el módulo del parser para `tabla` y lo escribe en `ruta`; retorna su código fuente."""
+    fuente = GeneradorParser(tabla, leer_gramatica(ruta_gramatica)).generar(huella_parser(tabla, ruta_gramatica))
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    with open(temporal, 'w', encoding='utf-8') as f:
+        f.write(fuente)
+    os.replace(temporal, ruta)
+    return fuente
+
+def _huella_guardada(fuente):
+    for linea in fuente.splitlines():
+        if linea.startswith('HUELLA = '):
+            return linea[len('HUELLA = '):].strip("'\"")
+    return None
+
+def cargar_parser_generado(tabla, ruta_gramatica, ruta=RUTA_PARSER_GENERADO):
+    """Retorna la función `analizar` del parser generado para `tabla`.
+
+    Si el módulo no existe o su huella no coincide con la de la tabla y la
+    gramática actuales, se vuelve a generar. El código se compila
+    directamente, sin pasar por los .pyc de __pycache__, para que una
+    regeneración nunca reutilice el código de la versión anterior. Con la
+    misma tabla que en la llamada anterior no se vuelve a calcular la huella.
+    """
+    cargado = _parsers_cargados.get(ruta)
+    if cargado is not None and cargado[0] is tabla:
+        return cargado[2]
+    huella = huella_parser(tabla, ruta_gramatica)
+    if cargado is not None and cargado[1] == huella:
+        _parsers_cargados[ruta] = (tabla, huella, cargado[2])
+        return cargado[2]
+
+    try:
+        with open(ruta, 'r', encoding='utf-8') as f:
+            fuente = f.read()
+    except OSError:
+        fuente = None
+    if fuente is None or _huella_guardada(fuente) != huella:
+        try:
+            fuente = generar_parser(tabla, ruta_gramatica, ruta)
+        except OSError:
+            fuente = GeneradorParser(tabla, leer_gramatica(ruta_gramatica)).generar(huella)
+
+    modulo = types.ModuleType('parser_generado')
+    modulo.__file__ = ruta
+    exec(compile(fuente, ruta, 'exec'), modulo.__dict__)
+    _parsers_cargados[ruta] = (tabla, huella, modulo.analizar)
+    return modulo.analizar
+
+def main():
+    parser = argparse.ArgumentParser(description="Genera el analizador descendente recursivo a partir de la tabla LL(1)")
+    parser.add_argument('--salida', default=RUTA_PARSER_GENERADO, help='Ruta del módulo generado')
+    args = parser.parse_args()
+
+    import sintactico
+    tabla = sintactico.cargar_tabla_ll1(sintactico.ruta_archivo_ll1)
+    fuente = generar_parser(tabla, sintactico.ruta_gramatica, args.salida)
+    print(f"✅ Parser generado en {args.salida} ({len(fuente.splitlines())} líneas, "
+          f"{len(tabla.no_terminales)} no terminales)")
+
+if __name__ == "__main__":
+    main()
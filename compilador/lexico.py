@@ -1,13 +1,11 @@
 import os
 import re
-from tabulate import tabulate
-
-# Configuración del archivo a compilar
-archivo = 'recursion-test.txt'
-
-# Obtener la ruta completa del archivo
-directorio_actual = os.path.dirname(__file__)
-ruta_archivo = os.path.join(directorio_actual, '..', 'codigos-bocetos', archivo)
+import json
+import mmap
+import struct
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
 
 # LISTA DE TOKENS PARA EL GENERADOR LL(1) - ESTO FALTABA
 tokens = [
@@ -32,10 +30,11 @@ class Token:
 
 # Clase Error
 class Error:
-    def __init__(self, mensaje, linea, columna):
+    def __init__(self, mensaje, linea, columna, inicio=None):
         self.mensaje = mensaje
         self.linea = linea
         self.columna = columna
+        self.inicio = inicio
 
     def __str__(self):
         return f"Error en línea {self.linea}, columna {self.columna}: {self.mensaje}"
@@ -96,9 +95,239 @@ operadores_simbolos = {
     '.': 'punto'
 }
 
-# Listas para almacenar tokens y errores
-lista_de_tokens = []
-lista_errores_lexicos = []
+# Tipos de token conocidos por el analizador; su posición es el código
+# entero con el que el analizador léxico, la tabla LL(1) y el analizador
+# sintáctico identifican cada tipo. Los nombres solo se usan al mostrar
+# resultados. Los no terminales de la gramática se registran al cargar la
+# tabla LL(1) con codigo_tipo_token, en el mismo espacio de códigos.
+nombres_tipos_token = list(dict.fromkeys(
+    tokens + list(palabras_reservadas.values()) + list(operadores_simbolos.values()) + ['$']
+))
+codigos_tipos_token = {nombre: codigo for codigo, nombre in enumerate(nombres_tipos_token)}
+
+CODIGO_ID = codigos_tipos_token['id']
+CODIGO_NENTERO = codigos_tipos_token['nentero']
+CODIGO_NFLOTANTE = codigos_tipos_token['nflotante']
+CODIGO_NCADENA = codigos_tipos_token['ncadena']
+CODIGO_FIN = codigos_tipos_token['$']
+
+# Lexema -> código de tipo, para que el analizador no pase por los nombres.
+codigos_palabras_reservadas = {lexema: codigos_tipos_token[tipo] for lexema, tipo in palabras_reservadas.items()}
+codigos_operadores_simbolos = {lexema: codigos_tipos_token[tipo] for lexema, tipo in operadores_simbolos.items()}
+
+# Posición de los tokens que no provienen del texto (como el '$' final);
+# al ser la mayor posible, esos tokens quedan ordenados al final de `inicios`.
+SIN_POSICION = 0xFFFFFFFF
+
+_SALTO = re.compile('\n')
+_SALTO_BYTES = re.compile(b'\n')
+
+class IndiceLineas:
+    """Tabla con la posición de inicio de cada línea de un texto.
+
+    Se construye una vez por archivo y da la línea y la columna (ambas desde
+    1) de cualquier posición con una búsqueda binaria, así que el análisis
+    léxico no necesita llevar contadores de línea y columna. Si el texto son
+    bytes UTF-8 (por ejemplo un mmap), las posiciones están en bytes y las
+    columnas se cuentan en caracteres.
+    """
+    __slots__ = ('inicios', '_bytes')
+
+    def __init__(self, fuente=''):
+        self.inicios = array('I', [0])
+        self._bytes = None if isinstance(fuente, str) else fuente
+        self.agregar_texto(fuente, 0)
+
+    def agregar_texto(self, texto, desplazamiento):
+        """Registra las líneas que empiezan dentro de `texto`, ubicado en `desplazamiento`."""
+        salto = _SALTO if isinstance(texto, str) else _SALTO_BYTES
+        self.inicios.extend(desplazamiento + m.end() for m in salto.finditer(texto))
+
+    def posicion(self, inicio):
+        """Retorna (linea, columna) de una posición, o (None, None) para SIN_POSICION."""
+        if inicio == SIN_POSICION:
+            return None, None
+        linea = bisect_right(self.inicios, inicio)
+        inicio_linea = self.inicios[linea - 1]
+        if self._bytes is None:
+            return linea, inicio - inicio_linea + 1
+        return linea, _longitud_caracteres(self._bytes[inicio_linea:inicio]) + 1
+
+    def posiciones(self, inicios):
+        """Itera (linea, columna) de cada posición de `inicios`, como posicion().
+
+        Mientras las posiciones crecen, avanza por la tabla de líneas en lugar
+        de hacer una búsqueda binaria por cada una; la primera se busca, así
+        que `inicios` puede empezar en cualquier parte del texto.
+        """
+        if self._bytes is not None:
+            yield from map(self.posicion, inicios)
+            return
+        lineas = self.inicios
+        total = len(lineas)
+        linea = 0
+        for inicio in inicios:
+            if inicio == SIN_POSICION:
+                yield None, None
+                continue
+            if not linea or inicio < lineas[linea - 1]:
+                linea = bisect_right(lineas, inicio)
+            else:
+                while linea < total and lineas[linea] <= inicio:
+                    linea += 1
+            yield linea, inicio - lineas[linea - 1] + 1
+
+    def editar(self, desplazamiento, longitud_borrada, texto_insertado):
+        """Actualiza la tabla tras reemplazar un tramo del texto (ver relexar)."""
+        desde = bisect_right(self.inicios, desplazamiento)
+        hasta = bisect_right(self.inicios, desplazamiento + longitud_borrada)
+        delta = len(texto_insertado) - longitud_borrada
+        nuevos = array('I', (desplazamiento + m.end() for m in _SALTO.finditer(texto_insertado)))
+        cola = self.inicios[hasta:]
+        if delta:
+            cola = array('I', [inicio + delta for inicio in cola])
+        self.inicios[desde:] = nuevos + cola
+
+class TokenVista:
+    """Vista de solo lectura de un token guardado en un TokenBuffer.
+
+    Expone los mismos atributos que Token (`tipo`, `valor`, `linea`,
+    `columna`) sin copiar los datos del buffer.
+    """
+    __slots__ = ('_buffer', '_indice')
+
+    def __init__(self, buffer, indice):
+        self._buffer = buffer
+        self._indice = indice
+
+    @property
+    def tipo(self):
+        return nombres_tipos_token[self._buffer.tipos[self._indice]]
+
+    @property
+    def codigo(self):
+        return self._buffer.tipos[self._indice]
+
+    @property
+    def valor(self):
+        return self._buffer.valores[self._indice]
+
+    @property
+    def linea(self):
+        return self._buffer.posicion(self._indice)[0]
+
+    @property
+    def columna(self):
+        return self._buffer.posicion(self._indice)[1]
+
+    @property
+    def inicio(self):
+        return self._buffer.inicios[self._indice]
+
+    def __str__(self):
+        return f"Token({self.tipo}, {self.valor}, {self.linea}, {self.columna})"
+
+class TokenBuffer:
+    """Lista compacta de tokens guardada como estructura de arreglos.
+
+    Cada token ocupa un byte para el tipo (código en `nombres_tipos_token`),
+    cuatro bytes para su posición de inicio en el texto y una referencia en la
+    tabla de valores, en lugar de un objeto Token con su propio __dict__. La
+    línea y la columna no se guardan: se obtienen al pedirlas a partir del
+    IndiceLineas del texto analizado. Los tokens agregados sin posición (como
+    el '$' final) se guardan con SIN_POSICION y su línea y columna son None.
+
+    Con 1M de tokens (benchmarks/benchmark_memoria_tokens.py) la lista de
+    objetos Token ocupa ~125 MB y el TokenBuffer ~30 MB, casi todos ellos
+    los propios valores de identificadores y literales.
+
+    Se comporta como la lista de tokens que usan crear_tabla_tokens y
+    analizador_sintactico: admite len(), índices, iteración, append() y clear(),
+    y devuelve objetos TokenVista con los mismos atributos que Token.
+    """
+
+    def __init__(self, indice_lineas=None):
+        self.tipos = array('B')
+        self.inicios = array('I')
+        self.valores = []
+        self.indice_lineas = IndiceLineas() if indice_lineas is None else indice_lineas
+
+    def posicion(self, indice):
+        """Retorna (linea, columna) del token en `indice`."""
+        return self.indice_lineas.posicion(self.inicios[indice])
+
+    def posiciones(self):
+        """Itera (linea, columna) de todos los tokens en orden."""
+        return self.indice_lineas.posiciones(self.inicios)
+
+    def agregar(self, tipo, valor, inicio=None):
+        """Agrega un token a partir de su tipo, su valor y su posición en el texto."""
+        self.tipos.append(codigo_tipo_token(tipo))
+        self.valores.append(valor)
+        self.inicios.append(SIN_POSICION if inicio is None else inicio)
+
+    def append(self, token):
+        """Agrega un objeto con los atributos de Token.
+
+        Solo se conserva su atributo `inicio`, si lo tiene; la línea y la
+        columna siempre se calculan desde el texto analizado.
+        """
+        self.agregar(token.tipo, token.valor, getattr(token, 'inicio', None))
+
+    def extender(self, tuplas):
+        """Agrega tokens dados como tuplas (codigo, valor, inicio)."""
+        agregar_tipo = self.tipos.append
+        agregar_valor = self.valores.append
+        agregar_inicio = self.inicios.append
+        for codigo, valor, inicio in tuplas:
+            agregar_tipo(codigo)
+            agregar_valor(valor)
+            agregar_inicio(inicio)
+
+    def reemplazar(self, desde, hasta, otro):
+        """Reemplaza los tokens [desde, hasta) por los de otro TokenBuffer."""
+        self.tipos[desde:hasta] = otro.tipos
+        self.valores[desde:hasta] = otro.valores
+        self.inicios[desde:hasta] = otro.inicios
+
+    def clear(self):
+        del self.tipos[:]
+        del self.inicios[:]
+        self.valores.clear()
+
+    def __len__(self):
+        return len(self.tipos)
+
+    def __getitem__(self, indice):
+        if indice < 0:
+            indice += len(self.tipos)
+        if not 0 <= indice < len(self.tipos):
+            raise IndexError("índice de token fuera de rango")
+        return TokenVista(self, indice)
+
+    def __iter__(self):
+        for indice in range(len(self.tipos)):
+            yield TokenVista(self, indice)
+
+_bloqueo_tipos_token = threading.Lock()
+
+def registrar_tipo_token(tipo):
+    """Asigna un código a un tipo de token que no estaba en las tablas."""
+    with _bloqueo_tipos_token:
+        if tipo in codigos_tipos_token:
+            return codigos_tipos_token[tipo]
+        if len(nombres_tipos_token) > 255:
+            raise ValueError(f"Demasiados tipos de token para registrar '{tipo}'")
+        codigos_tipos_token[tipo] = len(nombres_tipos_token)
+        nombres_tipos_token.append(tipo)
+        return codigos_tipos_token[tipo]
+
+def codigo_tipo_token(tipo):
+    """Retorna el código de un tipo de token, registrándolo si hace falta."""
+    codigo = codigos_tipos_token.get(tipo)
+    if codigo is None:
+        codigo = registrar_tipo_token(tipo)
+    return codigo
 
 def es_palabra_reservada(palabra):
     """Verifica si una palabra es reservada"""
@@ -124,8 +353,548 @@ def es_cadena_texto(cadena):
     patron = r'^".*"$'
     return re.match(patron, cadena) is not None
 
+def _construir_patron_lexico():
+    """Construye la expresión regular maestra que clasifica cada lexema en un solo match.
+
+    Las alternativas son excluyentes entre sí (cada una empieza por una clase de
+    carácter distinta, y los operadores de dos caracteres y los comentarios se
+    prueban antes que el operador de un carácter), así que pueden ordenarse por
+    frecuencia sin cambiar el resultado del recorrido carácter a carácter.
+    """
+    dobles = [op for op in operadores_simbolos if len(op) == 2]
+    simples = [op for op in operadores_simbolos if len(op) == 1]
+    alternativas = [
+        r'(?P<espacio>\s+)',
+        # Una palabra es la racha completa de [\w.]; los lookahead garantizan
+        # que solo se clasifica como identificador o número si ocupa toda la racha.
+        r'(?P<id>[a-zA-Z_][a-zA-Z0-9_]*(?![\w.]))',
+        '(?P<doble>' + '|'.join(re.escape(op) for op in dobles) + ')',
+        r'(?P<comentario>//[^\n]*)',
+        r'(?P<bloque>/\*.*?\*/)',
+        # Un comentario de bloque sin cerrar consume todo menos el último carácter.
+        r'(?P<bloque_abierto>/\*(?:.*(?=.\Z)|.*))',
+        '(?P<simple>[' + ''.join(re.escape(op) for op in simples) + '])',
+        r'(?P<nentero>\d+(?![\w.]))',
+        r'(?P<nflotante>\d+\.\d+(?![\w.]))',
+        r'(?P<cadena>"[^"]*")',
+        r'(?P<cadena_abierta>")',
+        r'(?P<palabra>\w[\w.]*)',
+        r'(?P<otro>.)',
+    ]
+    return re.compile('|'.join(alternativas), re.DOTALL)
+
+patron_lexico = _construir_patron_lexico()
+
+# Clases de lexema que solo pueden confirmarse al llegar al final de la entrada.
+clases_hasta_fin_entrada = {'bloque_abierto', 'cadena_abierta'}
+
+# Tamaño por defecto de los fragmentos leídos por iter_tokens.
+TAMANO_FRAGMENTO = 64 * 1024
+
+def _error_lexico(mensaje, inicio, indice_lineas):
+    """Crea un error léxico con la línea y columna de la posición `inicio`."""
+    linea, columna = indice_lineas.posicion(inicio)
+    return Error(mensaje, linea, columna, inicio)
+
+def _escanear(buffer, leer, tamano_fragmento, errores, indice_lineas, pos=0, internados=None):
+    """Generador central del análisis léxico.
+
+    Recorre `buffer` lexema a lexema con `patron_lexico` y produce los tokens
+    reconocidos como tuplas (codigo, valor, inicio), donde `codigo` es el
+    código entero del tipo en `nombres_tipos_token` e `inicio` la posición del
+    lexema en la entrada; los errores se agregan a `errores` con la línea y
+    columna que da `indice_lineas`. El recorrido puede empezar en cualquier
+    límite de lexema `pos`. Si `leer` no es None, el buffer se completa con
+    fragmentos de `leer(n)` hasta que devuelva '' (registrando cada uno en
+    `indice_lineas`): un lexema que llega al final del buffer (o que solo se
+    confirma al final de la entrada) se vuelve a intentar con más texto, por
+    lo que cadenas, comentarios y operadores de dos caracteres pueden cruzar
+    fragmentos.
+
+    Si se indica el diccionario `internados`, los valores de identificadores
+    y cadenas se internan en él: cada lexema repetido es el mismo objeto str
+    (ver Lexer.internados).
+    """
+    fin_entrada = leer is None
+    internar = internados.setdefault if internados is not None else None
+    descartado = 0
+    match_lexico = patron_lexico.match
+    codigos_palabras = codigos_palabras_reservadas
+    codigos_operadores = codigos_operadores_simbolos
+
+    while True:
+        m = match_lexico(buffer, pos)
+        if not fin_entrada and (m is None or m.end() == len(buffer) or m.lastgroup in clases_hasta_fin_entrada):
+            # Se descarta lo ya consumido y se lee al menos tanto como queda pendiente,
+            # para que un lexema muy largo no se vuelva a escanear demasiadas veces.
+            fragmento = leer(max(tamano_fragmento, len(buffer) - pos))
+            fin_entrada = not fragmento
+            indice_lineas.agregar_texto(fragmento, descartado + len(buffer))
+            buffer = buffer[pos:] + fragmento
+            descartado += pos
+            pos = 0
+            continue
+        if m is None:
+            return
+
+        clase = m.lastgroup
+        pos = m.end()
+
+        if clase == 'espacio':
+            continue
+        if clase == 'id':
+            lexema = m.group()
+            if internar is not None:
+                lexema = internar(lexema, lexema)
+            yield codigos_palabras.get(lexema, CODIGO_ID), lexema, descartado + m.start()
+        elif clase == 'simple' or clase == 'doble':
+            lexema = m.group()
+            yield codigos_operadores[lexema], lexema, descartado + m.start()
+        elif clase == 'nentero':
+            yield CODIGO_NENTERO, int(m.group()), descartado + m.start()
+        elif clase == 'nflotante':
+            yield CODIGO_NFLOTANTE, float(m.group()), descartado + m.start()
+        elif clase == 'cadena':
+            inicio = m.start()
+            lexema = buffer[inicio + 1:pos - 1]
+            if internar is not None:
+                lexema = internar(lexema, lexema)
+            yield CODIGO_NCADENA, lexema, descartado + inicio
+        elif clase in ('comentario', 'bloque', 'bloque_abierto'):
+            pass
+        elif clase == 'cadena_abierta':
+            errores.append(_error_lexico("Cadena de texto no cerrada", descartado + m.start(), indice_lineas))
+            return
+        elif clase == 'palabra':
+            errores.append(_error_lexico(f"Token no reconocido: {m.group()}", descartado + m.start(), indice_lineas))
+        else:
+            errores.append(_error_lexico(f"Caracter no reconocido: {m.group()}", descartado + m.start(), indice_lineas))
+
+def relexar(tokens, errores, fuente, desplazamiento, longitud_borrada, texto_insertado, internados=None):
+    """Actualiza `tokens` y `errores` tras una edición de `fuente` sin reanalizarla completa.
+
+    La edición reemplaza `longitud_borrada` caracteres desde `desplazamiento`
+    por `texto_insertado`. El análisis se retoma en el último token que
+    empieza antes de la edición (ningún lexema anterior puede cambiar, porque
+    el patrón solo mira un carácter más allá del lexema) y se detiene en el
+    primer token posterior a la edición que empieza donde empezaba un token
+    del análisis anterior: desde ese punto el texto es el mismo, así que el
+    resto de tokens y errores se conservan desplazando su posición. Las
+    líneas y columnas salen del IndiceLineas del buffer, que se actualiza con
+    la edición.
+
+    `tokens` (un TokenBuffer) y `errores` se modifican en el lugar; retorna
+    el texto nuevo. Los valores nuevos se internan en `internados` si se indica.
+    Los tokens de lex_mmap (TokenBufferBytes) tienen posiciones en bytes y
+    no se pueden editar: lanza ValueError.
+    """
+    if isinstance(tokens, TokenBufferBytes):
+        raise ValueError("Los tokens de lex_mmap no admiten reanálisis incremental; use lex() sobre el texto")
+    nueva = fuente[:desplazamiento] + texto_insertado + fuente[desplazamiento + longitud_borrada:]
+    delta = len(texto_insertado) - longitud_borrada
+    fin_edicion = desplazamiento + len(texto_insertado)
+    inicios = tokens.inicios
+    indice_lineas = tokens.indice_lineas
+    indice_lineas.editar(desplazamiento, longitud_borrada, texto_insertado)
+
+    # Punto de reinicio: último token que empieza antes de la edición. Si es
+    # el último carácter del texto puede ser lo que dejó un comentario de
+    # bloque sin cerrar, cuya extensión depende del final de la entrada, así
+    # que se retrocede un token más.
+    desde = bisect_left(inicios, desplazamiento) - 1
+    if desde >= 0 and inicios[desde] == len(fuente) - 1:
+        desde -= 1
+    if desde >= 0:
+        pos = inicios[desde]
+    else:
+        desde, pos = 0, 0
+    desde_error = bisect_left(errores, pos, key=lambda error: error.inicio)
+
+    nuevos = TokenBuffer(indice_lineas)
+    nuevos_errores = []
+    # Los tokens sin posición (el '$' final) quedan fuera del reanálisis.
+    hasta = bisect_left(inicios, SIN_POSICION, desde)
+    sincronizado = False
+    for token in _escanear(nueva, None, 0, nuevos_errores, indice_lineas, pos, internados):
+        inicio = token[2]
+        if inicio >= fin_edicion:
+            anterior = bisect_left(inicios, inicio - delta, desde, hasta)
+            if anterior < hasta and inicios[anterior] == inicio - delta:
+                hasta = anterior
+                sincronizado = True
+                break
+        nuevos.extender((token,))
+
+    cola_errores = []
+    if sincronizado:
+        cola_errores = errores[bisect_left(errores, inicio - delta, key=lambda error: error.inicio):]
+        for error in cola_errores:
+            error.inicio += delta
+            error.linea, error.columna = indice_lineas.posicion(error.inicio)
+
+    tokens.reemplazar(desde, hasta, nuevos)
+    errores[desde_error:] = nuevos_errores + cola_errores
+
+    if sincronizado and delta:
+        primero = desde + len(nuevos)
+        ultimo = bisect_left(inicios, SIN_POSICION, primero)
+        inicios[primero:ultimo] = array('I', [inicio + delta for inicio in inicios[primero:ultimo]])
+    return nueva
+
+# ===========================
+# ANÁLISIS SOBRE BYTES (MMAP)
+# ===========================
+
+codigos_palabras_reservadas_bytes = {lexema.encode('ascii'): codigo for lexema, codigo in codigos_palabras_reservadas.items()}
+codigos_operadores_simbolos_bytes = {lexema.encode('ascii'): codigo for lexema, codigo in codigos_operadores_simbolos.items()}
+
+# Bytes de continuación de UTF-8; cada uno de los demás bytes empieza un carácter.
+_BYTES_CONTINUACION = bytes(range(0x80, 0xC0))
+
+def _longitud_caracteres(segmento):
+    """Número de caracteres de un segmento de bytes UTF-8."""
+    if segmento.isascii():
+        return len(segmento)
+    return len(segmento.translate(None, _BYTES_CONTINUACION))
+
+def _construir_patron_bytes():
+    """Versión sobre bytes de `patron_lexico` con solo las ramas ASCII.
+
+    En texto, \\s y \\w también aceptan caracteres no ASCII, así que todo
+    lexema que empieza en un byte no ASCII, o al que le sigue uno, cae en la
+    alternativa `unicode` y se resuelve decodificando solo ese tramo
+    (_lexema_unicode). Cadenas y comentarios empiezan por un carácter ASCII y
+    su contenido se recorre sin decodificar.
+    """
+    dobles = [op.encode('ascii') for op in operadores_simbolos if len(op) == 2]
+    simples = [op.encode('ascii') for op in operadores_simbolos if len(op) == 1]
+    fin_palabra = rb'(?![\w.\x80-\xff])'
+    alternativas = [
+        rb'(?P<espacio>[ \t\n\r\x0b\x0c\x1c-\x1f]+)',
+        rb'(?P<id>[a-zA-Z_][a-zA-Z0-9_]*' + fin_palabra + rb')',
+        b'(?P<doble>' + b'|'.join(re.escape(op) for op in dobles) + b')',
+        rb'(?P<comentario>//[^\n]*)',
+        rb'(?P<bloque>/\*.*?\*/)',
+        # El último carácter se descuenta en _escanear_bytes, que sabe cuántos bytes ocupa.
+        rb'(?P<bloque_abierto>/\*.*)',
+        b'(?P<simple>[' + b''.join(re.escape(op) for op in simples) + b'])',
+        rb'(?P<nentero>\d+' + fin_palabra + rb')',
+        rb'(?P<nflotante>\d+\.\d+' + fin_palabra + rb')',
+        rb'(?P<cadena>"[^"]*")',
+        rb'(?P<cadena_abierta>")',
+        rb'(?P<palabra>\w[\w.]*' + fin_palabra + rb')',
+        rb'(?P<unicode>[\w.]*[\x80-\xff])',
+        rb'(?P<otro>.)',
+    ]
+    return re.compile(b'|'.join(alternativas), re.DOTALL)
+
+patron_lexico_bytes = _construir_patron_bytes()
+
+def _lexema_unicode(buffer, pos):
+    """Reconoce con `patron_lexico` el lexema que empieza en el byte `pos`.
+
+    Decodifica una ventana que crece hasta contener el lexema completo y el
+    carácter que le sigue (los lookahead del patrón lo necesitan).
+    """
+    tamano = 64
+    while True:
+        fin = min(len(buffer), pos + tamano)
+        while fin < len(buffer) and 0x80 <= buffer[fin] < 0xC0:
+            fin += 1
+        texto = buffer[pos:fin].decode('utf-8')
+        m = patron_lexico.match(texto)
+        if m.end() < len(texto) or fin == len(buffer):
+            return m
+        tamano *= 2
+
+def _escanear_bytes(buffer, errores, indice_lineas):
+    """Versión de _escanear que recorre bytes UTF-8 (por ejemplo un mmap) sin decodificarlos.
+
+    Produce tuplas (codigo, fin, inicio) con las posiciones del lexema en
+    bytes; TokenBufferBytes obtiene los valores a partir de ellas cuando se
+    piden. Los tokens y errores son los mismos que los de _escanear sobre el
+    texto decodificado.
+    """
+    pos = 0
+    total = len(buffer)
+    match_lexico = patron_lexico_bytes.match
+    codigos_palabras = codigos_palabras_reservadas_bytes
+    codigos_operadores = codigos_operadores_simbolos_bytes
+
+    while pos < total:
+        m = match_lexico(buffer, pos)
+        clase = m.lastgroup
+        inicio, pos = m.span()
+
+        if clase == 'espacio':
+            continue
+        if clase == 'id':
+            yield codigos_palabras.get(buffer[inicio:pos], CODIGO_ID), pos, inicio
+        elif clase == 'simple' or clase == 'doble':
+            yield codigos_operadores[buffer[inicio:pos]], pos, inicio
+        elif clase == 'nentero':
+            yield CODIGO_NENTERO, pos, inicio
+        elif clase == 'nflotante':
+            yield CODIGO_NFLOTANTE, pos, inicio
+        elif clase == 'cadena':
+            yield CODIGO_NCADENA, pos, inicio
+        elif clase == 'comentario' or clase == 'bloque':
+            pass
+        elif clase == 'bloque_abierto':
+            # Como en patron_lexico, el comentario sin cerrar deja fuera el último carácter.
+            fin_cuerpo = pos - 1
+            while fin_cuerpo > inicio + 2 and 0x80 <= buffer[fin_cuerpo] < 0xC0:
+                fin_cuerpo -= 1
+            if fin_cuerpo >= inicio + 2:
+                pos = fin_cuerpo
+        elif clase == 'unicode':
+            m = _lexema_unicode(buffer, inicio)
+            texto = m.group()
+            clase = m.lastgroup
+            pos = inicio + len(texto.encode('utf-8'))
+            if clase == 'id':
+                yield codigos_palabras_reservadas.get(texto, CODIGO_ID), pos, inicio
+            elif clase == 'nentero':
+                yield CODIGO_NENTERO, pos, inicio
+            elif clase == 'nflotante':
+                yield CODIGO_NFLOTANTE, pos, inicio
+            elif clase == 'palabra':
+                errores.append(_error_lexico(f"Token no reconocido: {texto}", inicio, indice_lineas))
+            elif clase == 'otro':
+                errores.append(_error_lexico(f"Caracter no reconocido: {texto}", inicio, indice_lineas))
+        elif clase == 'cadena_abierta':
+            errores.append(_error_lexico("Cadena de texto no cerrada", inicio, indice_lineas))
+            return
+        elif clase == 'palabra':
+            errores.append(_error_lexico(f"Token no reconocido: {buffer[inicio:pos].decode('ascii')}", inicio, indice_lineas))
+        else:
+            errores.append(_error_lexico(f"Caracter no reconocido: {buffer[inicio:pos].decode('ascii')}", inicio, indice_lineas))
+
+class ValoresBytes:
+    """Secuencia de valores de un TokenBufferBytes.
+
+    Cada valor se construye al pedirlo a partir de los bytes de la entrada
+    (solo las cadenas con caracteres no ASCII pagan una decodificación real),
+    así que el buffer no guarda ningún objeto por token.
+    """
+    __slots__ = ('_buffer',)
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+
+    def __len__(self):
+        return len(self._buffer.tipos)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        buffer = self._buffer
+        if indice < 0:
+            indice += len(buffer.tipos)
+        if indice in buffer.valores_explicitos:
+            return buffer.valores_explicitos[indice]
+        codigo = buffer.tipos[indice]
+        inicio = buffer.inicios[indice]
+        fin = buffer.finales[indice]
+        if codigo == CODIGO_NCADENA:
+            return buffer.fuente[inicio + 1:fin - 1].decode('utf-8')
+        lexema = buffer.fuente[inicio:fin].decode('utf-8')
+        if codigo == CODIGO_NENTERO:
+            return int(lexema)
+        if codigo == CODIGO_NFLOTANTE:
+            return float(lexema)
+        return lexema
+
+    def __iter__(self):
+        for indice in range(len(self)):
+            yield self[indice]
+
+class TokenBufferBytes(TokenBuffer):
+    """TokenBuffer cuyos valores se leen de los bytes de la entrada al pedirlos.
+
+    Guarda para cada token la posición final en bytes en lugar del valor;
+    `fuente` puede ser un mmap del archivo, que se mantiene abierto mientras
+    exista el buffer. Las posiciones de `inicios` están en bytes.
+    """
+
+    def __init__(self, fuente, indice_lineas=None):
+        super().__init__(IndiceLineas(fuente) if indice_lineas is None else indice_lineas)
+        self.fuente = fuente
+        self.finales = array('I')
+        self.valores_explicitos = {}
+        self.valores = ValoresBytes(self)
+
+    def agregar(self, tipo, valor, inicio=None):
+        """Agrega un token con su valor ya construido (por ejemplo '$')."""
+        self.valores_explicitos[len(self.tipos)] = valor
+        self.tipos.append(codigo_tipo_token(tipo))
+        self.inicios.append(SIN_POSICION if inicio is None else inicio)
+        self.finales.append(self.inicios[-1])
+
+    def extender(self, tuplas):
+        """Agrega tokens dados como tuplas (codigo, fin, inicio)."""
+        agregar_tipo = self.tipos.append
+        agregar_fin = self.finales.append
+        agregar_inicio = self.inicios.append
+        for codigo, fin, inicio in tuplas:
+            agregar_tipo(codigo)
+            agregar_fin(fin)
+            agregar_inicio(inicio)
+
+    def clear(self):
+        super().clear()
+        del self.finales[:]
+        self.valores_explicitos.clear()
+        self.valores = ValoresBytes(self)
+
+def abrir_mmap(ruta):
+    """Proyecta un archivo en memoria para leerlo como bytes (b'' si está vacío)."""
+    with open(ruta, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+class Lexer:
+    """Analizador léxico reentrante.
+
+    Cada instancia es dueña de su lista de tokens y de su lista de errores,
+    así que varios analizadores pueden trabajar a la vez en distintos hilos o
+    reutilizarse dentro de un mismo proceso.
+
+    `internados` es la tabla de internado de la compilación: cada
+    identificador o cadena que se repite en el texto comparte un único
+    objeto str, con su hash ya calculado, así que las fases siguientes
+    buscan esos nombres en sus diccionarios comparando por identidad.
+    """
+
+    def __init__(self):
+        self.tokens = TokenBuffer()
+        self.errores = []
+        self.archivo = None
+        self.fuente = ''
+        self.internados = {}
+
+    def lex(self, source, filename=None):
+        """Analiza el texto `source` y retorna el TokenBuffer resultante.
+
+        Los tokens y errores de un análisis anterior se descartan.
+        """
+        self.tokens = TokenBuffer(IndiceLineas(source))
+        self.errores = []
+        self.archivo = filename
+        self.fuente = source
+        self.internados = {}
+        self.tokens.extender(_escanear(source, None, 0, self.errores, self.tokens.indice_lineas,
+                                       internados=self.internados))
+        return self.tokens
+
+    def editar(self, desplazamiento, longitud_borrada, texto_insertado):
+        """Aplica una edición al último texto analizado y reanaliza solo la zona afectada.
+
+        Produce los mismos tokens y errores que lex() sobre el texto editado;
+        ver relexar(). Después de lex_mmap lanza ValueError.
+        """
+        self.fuente = relexar(self.tokens, self.errores, self.fuente,
+                              desplazamiento, longitud_borrada, texto_insertado, self.internados)
+        return self.tokens
+
+    def lex_archivo(self, ruta, cache=None):
+        """Lee y analiza el archivo indicado.
+
+        Si se pasa una `cache` (ver cache_tokens.CacheTokens) y ya tiene los
+        tokens de este contenido, se usan sin volver a analizarlo; si no, el
+        resultado del análisis se guarda en ella.
+        """
+        if cache is None:
+            with open(ruta, 'r', encoding='utf-8') as f:
+                contenido = f.read()
+            return self.lex(contenido, os.path.basename(ruta))
+
+        with open(ruta, 'rb') as f:
+            datos = f.read()
+        # Mismo texto que produce la lectura en modo texto (saltos de línea universales).
+        contenido = datos.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        guardado = cache.obtener(datos, contenido)
+        if guardado is not None:
+            self.tokens, self.errores = guardado
+            self.archivo = os.path.basename(ruta)
+            self.fuente = contenido
+            self.internados = {}
+            internar = self.internados.setdefault
+            self.tokens.valores = [internar(valor, valor) if type(valor) is str else valor
+                                   for valor in self.tokens.valores]
+            return self.tokens
+        self.lex(contenido, os.path.basename(ruta))
+        cache.guardar(datos, self.tokens, self.errores)
+        return self.tokens
+
+    def lex_mmap(self, ruta):
+        """Analiza el archivo indicado proyectándolo en memoria, sin decodificarlo completo.
+
+        Retorna un TokenBufferBytes con los mismos tokens que lex_archivo();
+        sus valores se construyen a partir del archivo al pedirlos y sus
+        posiciones `inicio` están en bytes. Retiene menos memoria que
+        lex_archivo, pero no es más rápido (ver benchmark_mmap.py) y sus
+        tokens no se pueden editar con editar().
+        """
+        self.errores = []
+        self.archivo = os.path.basename(ruta)
+        self.fuente = abrir_mmap(ruta)
+        self.tokens = TokenBufferBytes(self.fuente)
+        self.tokens.extender(_escanear_bytes(self.fuente, self.errores, self.tokens.indice_lineas))
+        return self.tokens
+
+    def iter_tokens(self, fileobj, tamano_fragmento=TAMANO_FRAGMENTO):
+        """Versión por fragmentos de lex(): genera los tokens sin guardarlos."""
+        self.errores = []
+        self.archivo = getattr(fileobj, 'name', None)
+        return iter_tokens(fileobj, tamano_fragmento, self.errores)
+
 def analizar_lexico(contenido):
-    """Función principal del análisis léxico"""
+    """Función principal del análisis léxico.
+
+    Recorre el contenido lexema a lexema con `patron_lexico`; cada token
+    guarda solo su posición de inicio y la línea y columna exactas se
+    obtienen al pedirlas. Retorna la tupla (tokens, errores).
+    """
+    lexer = Lexer()
+    lexer.lex(contenido)
+    return lexer.tokens, lexer.errores
+
+def analizar_lexico_mmap(ruta):
+    """Análisis léxico de un archivo sobre sus bytes proyectados en memoria.
+
+    Retorna la tupla (tokens, errores), igual que analizar_lexico.
+    """
+    lexer = Lexer()
+    lexer.lex_mmap(ruta)
+    return lexer.tokens, lexer.errores
+
+def iter_tokens(fileobj, tamano_fragmento=TAMANO_FRAGMENTO, errores=None):
+    """Genera los tokens de un archivo abierto en modo texto sin cargarlo completo.
+
+    El archivo se lee en fragmentos de `tamano_fragmento` caracteres y los
+    tokens se producen a medida que se reconocen, así que la memoria usada
+    solo crece con la tabla de inicios de línea (4 bytes por línea). Los
+    errores léxicos se agregan a `errores` si se indica una lista.
+    """
+    if errores is None:
+        errores = []
+    indice_lineas = IndiceLineas()
+    for codigo, valor, inicio in _escanear('', fileobj.read, tamano_fragmento, errores, indice_lineas):
+        linea, columna = indice_lineas.posicion(inicio)
+        yield Token(nombres_tipos_token[codigo], valor, linea, columna)
+
+def analizar_lexico_clasico(contenido):
+    """Análisis léxico carácter a carácter (implementación de referencia).
+
+    Es el recorrido original, con sus contadores de línea y columna; se
+    conserva para comparar el rendimiento de analizar_lexico, que produce
+    los mismos tipos y valores pero con posiciones exactas. Retorna la
+    tupla (lista de Token, errores).
+    """
+    lista_de_tokens = []
+    lista_errores_lexicos = []
     linea = 1
     columna = 0
     i = 0
@@ -248,8 +1017,17 @@ def analizar_lexico(contenido):
         lista_errores_lexicos.append(error)
         i += 1
 
-def crear_tabla_tokens():
-    """Crea una tabla formateada con los tokens"""
+    return lista_de_tokens, lista_errores_lexicos
+
+def crear_tabla_tokens(lista_de_tokens):
+    """Crea una tabla formateada con los tokens.
+
+    Es la vista en cuadrícula de tabulate, que arma la tabla completa en
+    memoria; solo se genera cuando se pide (ver EscritorTokens para el
+    volcado normal).
+    """
+    from tabulate import tabulate
+
     if not lista_de_tokens:
         return "No hay tokens para mostrar."
     
@@ -261,16 +1039,272 @@ def crear_tabla_tokens():
     
     return tabulate(data, headers=headers, tablefmt="grid")
 
-def guardar_tokens_archivo():
-    """Guarda los tokens en un archivo"""
+# Formatos de volcado de tokens y la extensión de sus archivos. 'tabla' es la
+# cuadrícula de tabulate; los otros dos se escriben fila a fila.
+extensiones_formato_tokens = {
+    'jsonl': '.jsonl',
+    'binario': '.tokbin',
+    'tabla': '.txt',
+}
+
+# Formato binario: cabecera MAGIA_TOKENS y luego un registro por fila con
+# (codigo, linea, columna, etiqueta, longitud) seguido de `longitud` bytes de
+# contenido. La línea y la columna valen -1 si el token no tiene posición. La
+# etiqueta indica qué es el contenido; un registro ETIQUETA_TIPO define el
+# nombre de un código la primera vez que aparece, así el archivo no depende
+# del orden de registro de los tipos.
+MAGIA_TOKENS = b'TOKS\x01'
+ETIQUETA_TIPO, ETIQUETA_CADENA, ETIQUETA_ENTERO, ETIQUETA_FLOTANTE, ETIQUETA_NULO, ETIQUETA_ERROR, ETIQUETA_BOOLEANO = range(7)
+_registro_token = struct.Struct('<BiiBI')
+_flotante = struct.Struct('<d')
+
+def _valor_json(valor):
+    """Representación JSON de un valor de token."""
+    if isinstance(valor, str):
+        return json.dumps(valor, ensure_ascii=False)
+    if valor is None:
+        return 'null'
+    if isinstance(valor, bool):
+        return 'true' if valor else 'false'
+    if isinstance(valor, int):
+        return repr(valor)
+    if isinstance(valor, float):
+        # Como json.dumps: un literal que desborda escribe Infinity, que json.loads lee de vuelta.
+        return json.dumps(valor)
+    return json.dumps(str(valor), ensure_ascii=False)
+
+class EscritorTokens:
+    """Escritor de tokens en flujo: cada fila se escribe al recibirla.
+
+    Con formato 'jsonl' cada línea es un objeto {"tipo", "valor", "linea",
+    "columna"} (o {"error", "linea", "columna"} para un error léxico); con
+    'binario' se usan los registros con longitud descritos en MAGIA_TOKENS.
+    Nada se acumula en memoria, así que puede recibir los tokens de
+    iter_tokens() a medida que se reconocen. leer_tokens() lee ambos
+    formatos.
+    """
+
+    def __init__(self, ruta, formato='jsonl'):
+        if formato not in ('jsonl', 'binario'):
+            raise ValueError(f"Formato de tokens no soportado: {formato}")
+        self.ruta = ruta
+        self.formato = formato
+        if formato == 'jsonl':
+            self._archivo = open(ruta, 'w', encoding='utf-8')
+            self._tipos_json = {}
+        else:
+            self._archivo = open(ruta, 'wb')
+            self._archivo.write(MAGIA_TOKENS)
+            self._definidos = set()
+        self.filas = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._archivo.close()
+
+    def escribir(self, tipo, valor, linea, columna):
+        """Escribe una fila de token."""
+        self.filas += 1
+        if self.formato == 'jsonl':
+            tipo_json = self._tipos_json.get(tipo)
+            if tipo_json is None:
+                tipo_json = self._tipos_json[tipo] = json.dumps(tipo, ensure_ascii=False)
+            self._archivo.write(f'{{"tipo": {tipo_json}, "valor": {_valor_json(valor)}, '
+                                f'"linea": {_valor_json(linea)}, "columna": {_valor_json(columna)}}}\n')
+            return
+        codigo = codigo_tipo_token(tipo)
+        if codigo not in self._definidos:
+            self._definidos.add(codigo)
+            self._escribir_registro(codigo, -1, -1, ETIQUETA_TIPO, tipo.encode('utf-8'))
+        if isinstance(valor, str):
+            etiqueta, contenido = ETIQUETA_CADENA, valor.encode('utf-8')
+        elif isinstance(valor, int) and not isinstance(valor, bool):
+            etiqueta, contenido = ETIQUETA_ENTERO, str(valor).encode('ascii')
+        elif isinstance(valor, float):
+            etiqueta, contenido = ETIQUETA_FLOTANTE, _flotante.pack(valor)
+        elif valor is None:
+            etiqueta, contenido = ETIQUETA_NULO, b''
+        elif isinstance(valor, bool):
+            etiqueta, contenido = ETIQUETA_BOOLEANO, b'\x01' if valor else b'\x00'
+        else:
+            etiqueta, contenido = ETIQUETA_CADENA, str(valor).encode('utf-8')
+        self._escribir_registro(codigo, linea, columna, etiqueta, contenido)
+
+    def _escribir_registro(self, codigo, linea, columna, etiqueta, contenido):
+        self._archivo.write(_registro_token.pack(codigo, -1 if linea is None else linea,
+                                                 -1 if columna is None else columna, etiqueta, len(contenido)))
+        self._archivo.write(contenido)
+
+    def escribir_error(self, error):
+        """Escribe un error léxico."""
+        if self.formato == 'jsonl':
+            self._archivo.write(f'{{"error": {_valor_json(error.mensaje)}, "linea": {_valor_json(error.linea)}, '
+                                f'"columna": {_valor_json(error.columna)}}}\n')
+        else:
+            self._escribir_registro(0, error.linea, error.columna, ETIQUETA_ERROR, error.mensaje.encode('utf-8'))
+
+    def escribir_tokens(self, lista_de_tokens):
+        """Escribe todos los tokens de una lista, un TokenBuffer o un iterador de tokens.
+
+        Con un TokenBuffer de texto las líneas se calculan en un solo
+        recorrido de su índice de líneas, sin crear un objeto por token, y
+        la codificación de cada valor de texto distinto se reutiliza.
+        """
+        if type(lista_de_tokens) is not TokenBuffer:
+            for token in lista_de_tokens:
+                self.escribir(token.tipo, token.valor, token.linea, token.columna)
+            return
+        filas = _filas_token_buffer(lista_de_tokens)
+        if self.formato == 'jsonl':
+            self._escribir_filas_jsonl(filas)
+        else:
+            self._escribir_filas_binario(filas)
+
+    def _escribir_filas_jsonl(self, filas):
+        prefijos = {}
+        partes = []
+        for codigo, valor, linea, columna in filas:
+            clave = (codigo, valor) if type(valor) is str else None
+            prefijo = prefijos.get(clave) if clave is not None else None
+            if prefijo is None:
+                tipo = nombres_tipos_token[codigo]
+                tipo_json = self._tipos_json.get(tipo)
+                if tipo_json is None:
+                    tipo_json = self._tipos_json[tipo] = json.dumps(tipo, ensure_ascii=False)
+                prefijo = f'{{"tipo": {tipo_json}, "valor": {_valor_json(valor)}, '
+                if clave is not None:
+                    prefijos[clave] = prefijo
+            if linea is None:
+                partes.append(prefijo + '"linea": null, "columna": null}\n')
+            else:
+                partes.append(f'{prefijo}"linea": {linea}, "columna": {columna}}}\n')
+            if len(partes) == 4096:
+                self._archivo.write(''.join(partes))
+                partes.clear()
+            self.filas += 1
+        self._archivo.write(''.join(partes))
+
+    def _escribir_filas_binario(self, filas):
+        codificados = {}
+        empaquetar = _registro_token.pack
+        partes = []
+        for codigo, valor, linea, columna in filas:
+            if codigo not in self._definidos:
+                self._definidos.add(codigo)
+                self._escribir_registro(codigo, -1, -1, ETIQUETA_TIPO, nombres_tipos_token[codigo].encode('utf-8'))
+            if type(valor) is str:
+                contenido = codificados.get(valor)
+                if contenido is None:
+                    contenido = codificados[valor] = valor.encode('utf-8')
+                etiqueta = ETIQUETA_CADENA
+            elif type(valor) is int:
+                etiqueta, contenido = ETIQUETA_ENTERO, str(valor).encode('ascii')
+            elif type(valor) is float:
+                etiqueta, contenido = ETIQUETA_FLOTANTE, _flotante.pack(valor)
+            else:
+                self._archivo.write(b''.join(partes))
+                partes.clear()
+                self.escribir(nombres_tipos_token[codigo], valor, linea, columna)
+                continue
+            partes.append(empaquetar(codigo, -1 if linea is None else linea, -1 if columna is None else columna,
+                                     etiqueta, len(contenido)))
+            partes.append(contenido)
+            if len(partes) >= 8192:
+                self._archivo.write(b''.join(partes))
+                partes.clear()
+            self.filas += 1
+        self._archivo.write(b''.join(partes))
+
+def _filas_token_buffer(tokens):
+    """Genera (codigo, valor, linea, columna) de un TokenBuffer recorriendo su índice de líneas una vez."""
+    inicios_lineas = tokens.indice_lineas.inicios
+    total_lineas = len(inicios_lineas)
+    linea = 1
+    inicio_linea = 0
+    siguiente_linea = inicios_lineas[1] if total_lineas > 1 else SIN_POSICION
+    for codigo, valor, inicio in zip(tokens.tipos, tokens.valores, tokens.inicios):
+        if inicio == SIN_POSICION:
+            yield codigo, valor, None, None
+            continue
+        if inicio >= siguiente_linea or inicio < inicio_linea:
+            linea = bisect_right(inicios_lineas, inicio)
+            inicio_linea = inicios_lineas[linea - 1]
+            siguiente_linea = inicios_lineas[linea] if linea < total_lineas else SIN_POSICION
+        yield codigo, valor, linea, inicio - inicio_linea + 1
+
+def leer_tokens(ruta, errores=None):
+    """Genera los tokens (objetos Token) de un volcado JSONL o binario de EscritorTokens.
+
+    Los errores léxicos del volcado se agregan a `errores` si se indica una lista.
+    """
+    if errores is None:
+        errores = []
+    with open(ruta, 'rb') as f:
+        binario = f.read(len(MAGIA_TOKENS)) == MAGIA_TOKENS
+    if not binario:
+        with open(ruta, 'r', encoding='utf-8') as f:
+            for linea in f:
+                fila = json.loads(linea)
+                if 'error' in fila:
+                    errores.append(Error(fila['error'], fila['linea'], fila['columna']))
+                else:
+                    yield Token(fila['tipo'], fila['valor'], fila['linea'], fila['columna'])
+        return
+
+    nombres = {}
+    with open(ruta, 'rb') as f:
+        f.read(len(MAGIA_TOKENS))
+        while True:
+            cabecera = f.read(_registro_token.size)
+            if len(cabecera) < _registro_token.size:
+                return
+            codigo, linea, columna, etiqueta, longitud = _registro_token.unpack(cabecera)
+            contenido = f.read(longitud)
+            linea = None if linea == -1 else linea
+            columna = None if columna == -1 else columna
+            if etiqueta == ETIQUETA_TIPO:
+                nombres[codigo] = contenido.decode('utf-8')
+            elif etiqueta == ETIQUETA_ERROR:
+                errores.append(Error(contenido.decode('utf-8'), linea, columna))
+            else:
+                if etiqueta == ETIQUETA_CADENA:
+                    valor = contenido.decode('utf-8')
+                elif etiqueta == ETIQUETA_ENTERO:
+                    valor = int(contenido)
+                elif etiqueta == ETIQUETA_FLOTANTE:
+                    valor = _flotante.unpack(contenido)[0]
+                elif etiqueta == ETIQUETA_BOOLEANO:
+                    valor = contenido == b'\x01'
+                else:
+                    valor = None
+                yield Token(nombres[codigo], valor, linea, columna)
+
+def guardar_tokens_archivo(lista_de_tokens, lista_errores_lexicos, archivo, formato='jsonl'):
+    """Guarda los tokens en un archivo.
+
+    Con formato 'jsonl' o 'binario' se escriben en flujo con EscritorTokens;
+    'tabla' es la cuadrícula de texto de crear_tabla_tokens.
+    """
     output_folder = 'salida-tokens'
     if not os.path.exists(output_folder):
         os.makedirs(output_folder)
     
     nombre_archivo_sin_extension = os.path.splitext(archivo)[0]
-    nombre_archivo_salida = f"{nombre_archivo_sin_extension}-tokens.txt"
+    nombre_archivo_salida = f"{nombre_archivo_sin_extension}-tokens{extensiones_formato_tokens[formato]}"
     ruta_salida = os.path.join(output_folder, nombre_archivo_salida)
     
+    if formato != 'tabla':
+        with EscritorTokens(ruta_salida, formato) as escritor:
+            for error in lista_errores_lexicos:
+                escritor.escribir_error(error)
+            escritor.escribir_tokens(lista_de_tokens)
+        return ruta_salida
+
     with open(ruta_salida, 'w', encoding='utf-8') as f:
         f.write(f"Análisis léxico del archivo: {archivo}\n")
         f.write("="*50 + "\n\n")
@@ -282,17 +1316,24 @@ def guardar_tokens_archivo():
             f.write("\n")
         
         f.write("TOKENS RECONOCIDOS:\n")
-        f.write(crear_tabla_tokens())
+        f.write(crear_tabla_tokens(lista_de_tokens))
     
     return ruta_salida
 
-def mostrar_resultado_lexico(errores):
-    """Muestra el resultado del análisis léxico - VERSION SIN EMOJIS PARA WINDOWS"""
+def mostrar_resultado_lexico(errores, lista_de_tokens, archivo, formato='jsonl', mostrar_tabla=False):
+    """Muestra el resultado del análisis léxico - VERSION SIN EMOJIS PARA WINDOWS
+
+    La tabla de tokens solo se imprime con `mostrar_tabla`; los tokens se
+    guardan en el `formato` indicado (ver guardar_tokens_archivo).
+    """
     print(f"\nCódigo a compilar: {archivo}\n")
     
     # Mostrar tabla de tokens
-    print("Lista de Tokens:")
-    print(crear_tabla_tokens())
+    if mostrar_tabla:
+        print("Lista de Tokens:")
+        print(crear_tabla_tokens(lista_de_tokens))
+    else:
+        print(f"Tokens reconocidos: {len(lista_de_tokens)}")
     
     if errores:
         print("\nErrores lexicos encontrados:")
@@ -302,21 +1343,19 @@ def mostrar_resultado_lexico(errores):
         return False
     else:
         print("\nAnalisis lexico exitoso")
-        ruta_archivo_tokens = guardar_tokens_archivo()
+        ruta_archivo_tokens = guardar_tokens_archivo(lista_de_tokens, errores, archivo, formato)
         print(f"Tokens escritos exitosamente en el archivo {ruta_archivo_tokens}\n")
         return True
 
-# Ejecutar análisis léxico
-if os.path.exists(ruta_archivo):
-    with open(ruta_archivo, 'r', encoding='utf-8') as file:
-        contenido_archivo = file.read()
-    
-    # Limpiar listas anteriores
-    lista_de_tokens.clear()
-    lista_errores_lexicos.clear()
-    
-    # Realizar análisis léxico
-    analizar_lexico(contenido_archivo)
-else:
-    print(f"El archivo {archivo} no existe en la carpeta codigos-bocetos")
-    exit(1)
\ No newline at end of file
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Muestra como tabla un volcado de tokens (JSONL o binario)")
+    parser.add_argument('ruta', help='Archivo de salida-tokens generado por el compilador')
+    args = parser.parse_args()
+    errores = []
+    print(crear_tabla_tokens(list(leer_tokens(args.ruta, errores))))
+    for error in errores:
+        print(f"  - {error}")
+
+if __name__ == "__main__":
+    main()
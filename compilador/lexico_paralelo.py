@@ -0,0 +1,96 @@
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from lexico import Error
+from lexico import IndiceLineas
+from lexico import TokenBuffer
+from lexico import _escanear
+from lexico import analizar_lexico
+
+# Pre-escaneo para encontrar saltos de línea que no están dentro de una
+# cadena ni de un comentario. Fuera de ellos, '"' y '/' siempre empiezan un
+# lexema, así que recorrer solo estas construcciones basta para saber en qué
+# estado está el analizador léxico en cada salto de línea. Una cadena o un
+# comentario de bloque sin cerrar llegan hasta el final del texto.
+patron_cortes = re.compile(r'"[^"]*(?:"|\Z)|//[^\n]*|/\*.*?(?:\*/|\Z)|(?P<salto>\n)', re.DOTALL)
+
+# Por debajo de este tamaño no compensa repartir el texto entre procesos.
+TAMANO_MINIMO_FRAGMENTO = 256 * 1024
+
+def buscar_cortes(contenido, partes):
+    """Retorna las posiciones donde empieza cada fragmento del texto.
+
+    Cada corte está justo después de un salto de línea seguro, el primero
+    que aparece a partir de cada k/partes del texto. Un salto seguro es
+    siempre un límite entre lexemas (es un espacio), y el lexema anterior
+    ve el mismo carácter siguiente en su fragmento, así que analizar los
+    fragmentos por separado produce los mismos tokens.
+    """
+    cortes = [0]
+    if partes < 2:
+        return cortes
+    tamano = len(contenido) / partes
+    siguiente = tamano
+    for m in patron_cortes.finditer(contenido):
+        if m.lastgroup == 'salto' and m.start() >= siguiente:
+            if m.end() < len(contenido):
+                cortes.append(m.end())
+            if len(cortes) == partes:
+                break
+            siguiente = max(siguiente + tamano, m.end())
+    return cortes
+
+def _analizar_fragmento(fragmento, desplazamiento):
+    """Analiza un fragmento en un proceso trabajador.
+
+    Retorna los arreglos de tipos y posiciones (ya desplazadas a posiciones
+    del texto completo) como bytes, los valores y los errores como tuplas
+    (mensaje, inicio); la línea y columna de los errores se calculan en el
+    proceso principal con el índice de líneas del texto completo.
+    """
+    tokens = TokenBuffer()
+    errores = []
+    tokens.extender((codigo, valor, inicio + desplazamiento)
+                    for codigo, valor, inicio in _escanear(fragmento, None, 0, errores, IndiceLineas(fragmento),
+                                                            internados={}))
+    return (tokens.tipos.tobytes(), tokens.inicios.tobytes(), tokens.valores,
+            [(error.mensaje, error.inicio + desplazamiento) for error in errores])
+
+def analizar_lexico_paralelo(contenido, procesos=None, ejecutor=None):
+    """Análisis léxico de un texto grande repartido entre varios procesos.
+
+    Divide el texto con buscar_cortes(), analiza cada fragmento en un
+    ProcessPoolExecutor (el indicado en `ejecutor` o uno nuevo con `procesos`
+    trabajadores) y une los resultados en un único TokenBuffer cuyas líneas
+    y columnas salen del índice de líneas del texto completo. Produce
+    exactamente los mismos tokens y errores que analizar_lexico. Retorna la
+    tupla (tokens, errores).
+    """
+    if procesos is None:
+        procesos = getattr(ejecutor, '_max_workers', None) or os.cpu_count() or 1
+    partes = min(procesos, max(1, len(contenido) // TAMANO_MINIMO_FRAGMENTO))
+    cortes = buscar_cortes(contenido, partes)
+    if len(cortes) == 1:
+        return analizar_lexico(contenido)
+
+    limites = list(zip(cortes, cortes[1:] + [len(contenido)]))
+    fragmentos = [contenido[inicio:fin] for inicio, fin in limites]
+    desplazamientos = [inicio for inicio, _ in limites]
+    if ejecutor is None:
+        with ProcessPoolExecutor(max_workers=min(procesos, len(fragmentos))) as propio:
+            resultados = list(propio.map(_analizar_fragmento, fragmentos, desplazamientos))
+    else:
+        resultados = list(ejecutor.map(_analizar_fragmento, fragmentos, desplazamientos))
+
+    indice_lineas = IndiceLineas(contenido)
+    tokens = TokenBuffer(indice_lineas)
+    errores = []
+    for tipos, inicios, valores, errores_fragmento in resultados:
+        tokens.tipos.frombytes(tipos)
+        tokens.inicios.frombytes(inicios)
+        tokens.valores.extend(valores)
+        for mensaje, inicio in errores_fragmento:
+            linea, columna = indice_lineas.posicion(inicio)
+            errores.append(Error(mensaje, linea, columna, inicio))
+    return tokens, errores
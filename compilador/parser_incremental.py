@@ -0,0 +1,243 @@
+import hashlib
+import marshal
+from bisect import bisect_right
+
+from lexico import CODIGO_FIN
+from lexico import TokenBuffer
+from lexico import TokenBufferBytes
+from lexico import codigo_tipo_token
+from lexico import nombres_tipos_token
+
+CODIGO_FUNCION = codigo_tipo_token('funcion')
+CODIGO_MASFUNCN = codigo_tipo_token('masfuncn')
+CODIGO_VACIO = codigo_tipo_token('e')
+
+def dividir_funciones(tipos):
+    """Retorna los tramos [inicio, fin) de las funciones de nivel superior, o None si no los hay.
+
+    `tipos` son los códigos de los tokens, terminados en $. Cada función
+    empieza en un token funcion y termina antes de la siguiente o del $;
+    el programa debe empezar con una función. Un funcion dentro de un
+    bloque no es válido en la gramática: parte la función donde aparece,
+    y ninguno de sus dos tramos se analiza sin errores.
+    """
+    datos = tipos.tobytes() if hasattr(tipos, 'tobytes') else bytes(tipos)
+    fin = len(datos) - 1
+    if fin <= 0 or datos[0] != CODIGO_FUNCION or datos[fin] != CODIGO_FIN:
+        return None
+    tramos = []
+    inicio = 0
+    while inicio < fin:
+        siguiente = datos.find(CODIGO_FUNCION, inicio + 1, fin)
+        if siguiente < 0:
+            siguiente = fin
+        tramos.append((inicio, siguiente))
+        inicio = siguiente
+    return tramos
+
+class FuncionAnalizada:
+    """Subárbol de una función de nivel superior guardado por ParserIncremental.
+
+    `nodos` son el terminal funcion, el opcionprincipal y todos sus
+    descendientes; `terminales`, los nodos que consumieron un token, en
+    orden, y `posiciones` la (linea, columna) de cada uno. `ubicacion` es
+    lo que determina esas posiciones en el texto (ver ubicacion_tramo) y
+    `base` el id del programaprincipal que la contiene en el último árbol
+    armado.
+    """
+    __slots__ = ('nodos', 'terminales', 'posiciones', 'ubicacion', 'base')
+
+    def __init__(self, nodos, terminales, posiciones, ubicacion, base):
+        self.nodos = nodos
+        self.terminales = terminales
+        self.posiciones = posiciones
+        self.ubicacion = ubicacion
+        self.base = base
+
+def ubicacion_tramo(lista_de_tokens, inicio, fin):
+    """Datos de los que dependen la línea y la columna de los tokens [inicio, fin).
+
+    Son las posiciones de los tokens en el texto, el número de la línea del
+    primero y los inicios de las líneas que ocupa el tramo: si no cambian,
+    tampoco cambian las posiciones, sin tener que calcularlas. Retorna None
+    si el texto son bytes, cuyas columnas se cuentan en caracteres.
+    """
+    if isinstance(lista_de_tokens, TokenBufferBytes):
+        return None
+    inicios = lista_de_tokens.inicios[inicio:fin]
+    lineas = lista_de_tokens.indice_lineas.inicios
+    primera = bisect_right(lineas, inicios[0])
+    return primera, inicios, lineas[primera - 1:bisect_right(lineas, inicios[-1])]
+
+class ParserIncremental:
+    """Analizador sintáctico que reutiliza el subárbol de las funciones que no cambiaron.
+
+    Un programa es una cadena programaprincipal -> funcion opcionprincipal
+    masfuncn, una por función de nivel superior, y el subárbol de cada
+    función solo depende de sus propios tokens. analizar() divide los
+    tokens en funciones (dividir_funciones) y busca cada una en la caché por
+    el hash de los tipos y valores de sus tokens: solo las que no están se
+    analizan, cada una como un programa aparte. Las
+    demás se enlazan tal cual, corrigiendo los ids si la función cambió de
+    lugar y la línea y columna de sus tokens si se movieron en el texto.
+
+    `analizador` es la función (lista_de_tokens, tabla_ll1) -> (exito,
+    arbol, errores) con la que se analizan las funciones, normalmente
+    sintactico.analizador_sintactico_generado, y `Nodo` la clase de sus
+    nodos; se reciben como parámetros, igual que en el parser generado,
+    porque sintactico usa este módulo. El árbol es el mismo que el del
+    `analizador` sobre todos los tokens, con los mismos ids. Si el
+    programa tiene errores se analiza completo, para informar los mismos
+    errores. La caché guarda
+    las funciones del último análisis y sus nodos son los del árbol que se
+    retornó: el siguiente análisis los modifica, así que solo el último
+    árbol es válido, como los tokens de Lexer.editar.
+    """
+
+    def __init__(self, tabla_ll1, analizador, Nodo):
+        self.tabla_ll1 = tabla_ll1
+        self.analizador = analizador
+        self.Nodo = Nodo
+        self.cache = {}
+        self.reanalizadas = 0
+        self.reutilizadas = 0
+
+    def clave(self, lista_de_tokens, inicio, fin):
+        """Hash de los tipos y valores de los tokens [inicio, fin)."""
+        huella = hashlib.blake2b(lista_de_tokens.tipos[inicio:fin].tobytes(), digest_size=16)
+        huella.update(marshal.dumps(list(lista_de_tokens.valores[inicio:fin])))
+        return huella.digest()
+
+    def analizar(self, lista_de_tokens):
+        """Analiza un TokenBuffer terminado en $; retorna (exito, arbol, errores)."""
+        if not isinstance(lista_de_tokens, TokenBuffer):
+            buffer = TokenBuffer()
+            for token in lista_de_tokens:
+                buffer.append(token)
+            lista_de_tokens = buffer
+        self.reanalizadas = 0
+        self.reutilizadas = 0
+        tramos = dividir_funciones(lista_de_tokens.tipos)
+        if tramos is None:
+            return self.analizador(lista_de_tokens, self.tabla_ll1)
+
+        claves = [self.clave(lista_de_tokens, inicio, fin) for inicio, fin in tramos]
+        anterior = self.cache
+        # Si cambió la mayoría de las funciones (o es el primer análisis) conviene
+        # analizar el programa completo y guardar sus funciones desde el árbol.
+        if sum(clave not in anterior for clave in claves) * 2 > len(claves):
+            exito, arbol, errores = self.analizador(lista_de_tokens, self.tabla_ll1)
+            if exito:
+                self.cache = self._recolectar(arbol, lista_de_tokens, tramos, claves)
+                self.reanalizadas = len(claves)
+            return exito, arbol, errores
+
+        self.cache = {}
+        funciones = []
+        base = 1
+        for (inicio, fin), clave in zip(tramos, claves):
+            guardadas = anterior.get(clave)
+            if guardadas:
+                funcion = guardadas.pop()
+                self._reubicar(funcion, base, lista_de_tokens, inicio, fin)
+                self.reutilizadas += 1
+            else:
+                funcion = self._analizar_funcion(lista_de_tokens, inicio, fin, base)
+                if funcion is None:
+                    # Las funciones ya analizadas se conservan para cuando se corrija el error.
+                    for clave, guardadas in self.cache.items():
+                        anterior.setdefault(clave, []).extend(guardadas)
+                    self.cache = anterior
+                    return self.analizador(lista_de_tokens, self.tabla_ll1)
+                self.reanalizadas += 1
+            self.cache.setdefault(clave, []).append(funcion)
+            funciones.append(funcion)
+            base += len(funcion.nodos) + 2
+        return True, self._enlazar(funciones), []
+
+    def _analizar_funcion(self, lista_de_tokens, inicio, fin, base):
+        """Analiza los tokens [inicio, fin) como un programa de una función; None si tiene errores."""
+        tramo = TokenBuffer(lista_de_tokens.indice_lineas)
+        tramo.tipos = lista_de_tokens.tipos[inicio:fin]
+        tramo.inicios = lista_de_tokens.inicios[inicio:fin]
+        tramo.valores = list(lista_de_tokens.valores[inicio:fin])
+        tramo.agregar('$', '$')
+        exito, arbol, _ = self.analizador(tramo, self.tabla_ll1)
+        if not exito:
+            return None
+        funcion, opcion, _ = arbol.hijos
+        guardada = self._guardar(funcion, opcion, 1, lista_de_tokens, inicio, fin)
+        # El programaprincipal del tramo tiene id 1: sus ids se corren a los del programa completo.
+        self._reubicar(guardada, base, lista_de_tokens, inicio, fin)
+        return guardada
+
+    def _recolectar(self, arbol, lista_de_tokens, tramos, claves):
+        """Caché con las funciones del árbol de un programa completo, una por clave, en orden."""
+        cache = {}
+        programa = arbol
+        for (inicio, fin), clave in zip(tramos, claves):
+            funcion, opcion, masfuncn = programa.hijos
+            guardada = self._guardar(funcion, opcion, programa.id, lista_de_tokens, inicio, fin)
+            cache.setdefault(clave, []).append(guardada)
+            programa = masfuncn.hijos[0]
+        return cache
+
+    def _guardar(self, funcion, opcion, base, lista_de_tokens, inicio, fin):
+        """FuncionAnalizada con el subárbol de `funcion` y `opcion`, hijos del programaprincipal `base`.
+
+        [inicio, fin) son los tokens de la función en `lista_de_tokens`.
+        """
+        nodos = [funcion, opcion]
+        terminales = [funcion]
+        pendientes = list(reversed(opcion.hijos))
+        while pendientes:
+            nodo = pendientes.pop()
+            nodos.append(nodo)
+            if nodo.terminal:
+                if nodo.codigo != CODIGO_VACIO:
+                    terminales.append(nodo)
+            elif nodo.hijos:
+                pendientes.extend(reversed(nodo.hijos))
+        posiciones = [(nodo.linea, nodo.columna) for nodo in terminales]
+        return FuncionAnalizada(nodos, terminales, posiciones, ubicacion_tramo(lista_de_tokens, inicio, fin), base)
+
+    def _reubicar(self, funcion, base, lista_de_tokens, inicio, fin):
+        """Ajusta los ids y las posiciones de una función guardada a su lugar en los tokens [inicio, fin)."""
+        if funcion.base != base:
+            desplazamiento = base - funcion.base
+            for nodo in funcion.nodos:
+                nodo.id += desplazamiento
+            funcion.base = base
+        ubicacion = ubicacion_tramo(lista_de_tokens, inicio, fin)
+        if ubicacion is not None and ubicacion == funcion.ubicacion:
+            return
+        funcion.ubicacion = ubicacion
+        posiciones = list(lista_de_tokens.indice_lineas.posiciones(lista_de_tokens.inicios[inicio:fin]))
+        if funcion.posiciones != posiciones:
+            for nodo, (linea, columna) in zip(funcion.terminales, posiciones):
+                nodo.linea = linea
+                nodo.columna = columna
+            funcion.posiciones = posiciones
+
+    def _enlazar(self, funciones):
+        """Arma la cadena programaprincipal -> funcion opcionprincipal masfuncn con las funciones."""
+        Nodo = self.Nodo
+        nombre_inicial = nombres_tipos_token[self.tabla_ll1.inicial]
+        nombre_masfuncn = nombres_tipos_token[CODIGO_MASFUNCN]
+        raiz = None
+        masfuncn = None
+        for funcion in funciones:
+            base = funcion.base
+            programa = Nodo(base, nombre_inicial, None, None, None, False, self.tabla_ll1.inicial)
+            if masfuncn is None:
+                raiz = programa
+            else:
+                masfuncn.añadir_hijo(programa)
+            cabecera, opcion = funcion.nodos[0], funcion.nodos[1]
+            masfuncn = Nodo(base + 3, nombre_masfuncn, None, None, None, False, CODIGO_MASFUNCN)
+            programa.añadir_hijo(cabecera)
+            programa.añadir_hijo(opcion)
+            programa.añadir_hijo(masfuncn)
+        ultima = funciones[-1]
+        masfuncn.añadir_hijo(Nodo(ultima.base + len(ultima.nodos) + 2, "e", "e", None, None, True, CODIGO_VACIO))
+        return raiz
@@ -0,0 +1,60 @@
+# Valor que retorna entrar() para visitar los hijos de un nodo y luego llamar a salir() con él.
+SALIR = object()
+
+class Visitante:
+    """Recorrido en profundidad de un árbol con una pila explícita, sin recursión.
+
+    Sirve para cualquier árbol cuyos nodos tengan `hijos`: Nodo, los
+    cursores NodoArena y los nodos del AST. Las cadenas recursivas por la
+    derecha de la gramática (masfuncn, masinstrucciones, masexpresiones)
+    dan árboles de miles de niveles que un recorrido recursivo no alcanza
+    a visitar sin subir sys.setrecursionlimit.
+
+    Las subclases redefinen los ganchos:
+
+    - `entrar(nodo, padre)` se llama en pre-orden. Si retorna un valor
+      falso no se visitan los hijos de `nodo`; si retorna SALIR, después
+      de visitarlos se llama a `salir`.
+    - `salir(nodo, padre)` se llama en post-orden, solo para los nodos en
+      los que `entrar` retornó SALIR; así el recorrido no apila una salida
+      por cada nodo.
+    - `hijos(nodo)` da los hijos a visitar, en orden; por defecto
+      `nodo.hijos`.
+
+    Los hijos se visitan en el mismo orden que lo haría una función
+    recursiva, así que los mensajes y el código generado no cambian.
+    """
+
+    def entrar(self, nodo, padre):
+        return True
+
+    def salir(self, nodo, padre):
+        pass
+
+    def hijos(self, nodo):
+        return nodo.hijos
+
+    def recorrer(self, raiz, padre=None):
+        """Visita `raiz` y todos sus descendientes; `padre` es el que recibe la raíz en los ganchos."""
+        entrar = self.entrar
+        salir = self.salir
+        # Si la subclase no redefine hijos() se lee el atributo sin llamar a un método.
+        hijos = self.hijos if type(self).hijos is not Visitante.hijos else None
+        # Cada entrada es (nodo, padre, saliendo).
+        pendientes = [(raiz, padre, False)]
+        apilar = pendientes.append
+        desapilar = pendientes.pop
+        while pendientes:
+            nodo, padre, saliendo = desapilar()
+            if saliendo:
+                salir(nodo, padre)
+                continue
+            accion = entrar(nodo, padre)
+            if not accion:
+                continue
+            if accion is SALIR:
+                apilar((nodo, padre, True))
+            hijos_nodo = nodo.hijos if hijos is None else hijos(nodo)
+            if hijos_nodo:
+                for hijo in reversed(hijos_nodo):
+                    apilar((hijo, nodo, False))
@@ -1,20 +1,64 @@
-import pandas as pd
 import os
+import csv
+import sys
+import hashlib
+import marshal
+import argparse
+import time
 from graphviz import Digraph
 from lexico import Error
-from lexico import lista_errores_lexicos
+from lexico import Lexer
 from lexico import mostrar_resultado_lexico
-from lexico import lista_de_tokens
-from lexico import archivo
 from lexico import Token
+from lexico import TokenBuffer
+from lexico import CODIGO_FIN
+from lexico import codigo_tipo_token
+from lexico import codigos_tipos_token
+from lexico import nombres_tipos_token
+from cache_tokens import CacheTokens
+from generador_parser import cargar_parser_generado
+from parser_incremental import ParserIncremental
+from volcado_arbol import cargar_arbol
+from volcado_arbol import volcar_arbol
+from arbol_arena import TreeArena
+from recorrido import SALIR
+from recorrido import Visitante
+from arbol_abstracto import bajar_arbol
+from arbol_abstracto import ASIGNACIONES
+from arbol_abstracto import EXPRESIONES
+from arbol_abstracto import Assign
+from arbol_abstracto import BinOp
+from arbol_abstracto import Block
+from arbol_abstracto import Call
+from arbol_abstracto import CallStmt
+from arbol_abstracto import For
+from arbol_abstracto import FunctionDef
+from arbol_abstracto import If
+from arbol_abstracto import Literal
+from arbol_abstracto import Name
+from arbol_abstracto import Param
+from arbol_abstracto import Paren
+from arbol_abstracto import Program
+from arbol_abstracto import Read
+from arbol_abstracto import Return
+from arbol_abstracto import VarDecl
+from arbol_abstracto import While
 
 # Ingresar datos de la tabla en formato .csv
 directorio = os.path.dirname(__file__)
 archivo_ll1 = 'tabla_ll1.csv'  # Ingresar el nombre de la tabla.
 ruta_archivo_ll1 = os.path.join(directorio, '..', 'tabla-ll1', archivo_ll1)
+ruta_gramatica = os.path.join(directorio, '..', 'gramatica', 'gramatica.txt')
 
-# Agregar el $ a la lista de tokens.
-lista_de_tokens.append(Token("$", "$", None, None))
+# Versión del formato de la tabla LL(1) compilada; cambiarla invalida las ya escritas.
+FORMATO_TABLA_COMPILADA = 1
+
+# Archivo de codigos-bocetos que se compila si no se indica otro.
+archivo_por_defecto = 'recursion-test.txt'
+
+# Extensiones de los árboles binarios (volcado_arbol) que se guardan en salida-arboles.
+EXTENSION_ARBOL = '.arbol'
+EXTENSION_AST = '-ast.arbol'
 
 # Subclase para identificar un error sintáctico.
 class ErrorSintactico(Error):
@@ -63,16 +107,151 @@ class TablaSimbolos:
         return self.padre if self.padre else self
 
 # Función encargada de cargar una tabla LL1.
-def cargar_tabla_ll1(direccion):
-    df = pd.read_csv(direccion, index_col=0)
-    df = df.fillna('')
-    return df
+class TablaLL1:
+    """Tabla LL(1) compilada a una matriz densa indexada por códigos de tipo de token.
+
+    `matriz[no_terminal][terminal]` es la producción como tupla de pares
+    (codigo, es_terminal), una tupla vacía si la celda está vacía en el
+    CSV, o None si el terminal no es una columna de la tabla. Las filas de
+    los códigos que no son no terminales valen None. `inicial` es el no
+    terminal de la primera fila.
+
+    Un símbolo es no terminal si tiene fila en la tabla. Algunos nombres son
+    a la vez un no terminal y el tipo de token de su palabra reservada
+    (`condicional -> condicional pabierto ...`): como una gramática LL(1) no
+    tiene recursión por la izquierda, el primer símbolo de una producción
+    igual a su propio no terminal es el terminal.
+    """
+
+    def __init__(self, no_terminales, terminales, celdas):
+        self.no_terminales = no_terminales
+        self.terminales = terminales
+        self.inicial = no_terminales[0]
+        self.matriz = [None] * 256
+        es_no_terminal = set(no_terminales)
+        for no_terminal, fila in zip(no_terminales, celdas):
+            producciones = [None] * 256
+            for terminal, produccion in zip(terminales, fila):
+                producciones[terminal] = tuple(
+                    (simbolo, simbolo not in es_no_terminal or (posicion == 0 and simbolo == no_terminal))
+                    for posicion, simbolo in enumerate(produccion))
+            self.matriz[no_terminal] = tuple(producciones)
+
+    def produccion(self, no_terminal, terminal):
+        """Retorna la celda de la tabla para un par de códigos (ver `matriz`)."""
+        fila = self.matriz[no_terminal]
+        return None if fila is None else fila[terminal]
+
+    def siguientes(self, no_terminal):
+        """Terminales cuya celda es la producción vacía: el conjunto FOLLOW de un no terminal anulable."""
+        fila = self.matriz[no_terminal]
+        return frozenset(terminal for terminal in self.terminales if fila[terminal] == produccion_vacia)
+
+    def guardar(self, ruta, huella):
+        """Escribe la tabla compilada con marshal junto con la huella de sus fuentes.
+
+        Se guardan también los nombres de los códigos usados, porque los
+        códigos de los no terminales dependen del orden en que se registran.
+        """
+        nombres = nombres_tipos_token[:max(max(self.no_terminales), max(self.terminales)) + 1]
+        datos = marshal.dumps((huella, nombres, self.no_terminales, self.terminales, self.matriz))
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        with open(temporal, 'wb') as f:
+            f.write(datos)
+        os.replace(temporal, ruta)
+
+    @classmethod
+    def cargar(cls, ruta, huella):
+        """Lee una tabla escrita con guardar(); retorna None si falta, está dañada o no coincide la huella."""
+        try:
+            with open(ruta, 'rb') as f:
+                huella_guardada, nombres, no_terminales, terminales, matriz = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if huella_guardada != huella:
+            return None
+        # Los códigos solo valen si los nombres ya registrados coinciden; los
+        # que faltan se registran en el mismo orden y reciben el mismo código.
+        for codigo, nombre in enumerate(nombres):
+            if codigo_tipo_token(nombre) != codigo:
+                return None
+        tabla = cls.__new__(cls)
+        tabla.no_terminales = no_terminales
+        tabla.terminales = terminales
+        tabla.inicial = no_terminales[0]
+        tabla.matriz = matriz
+        return tabla
+
+def ruta_tabla_compilada(direccion):
+    """Ruta de la tabla LL(1) compilada que se guarda junto al CSV."""
+    return os.path.splitext(direccion)[0] + '.bin'
+
+def huella_tabla_ll1(direccion):
+    """Hash del CSV de la tabla y de la gramática con el que se valida la tabla compilada."""
+    huella = hashlib.sha256(f"{FORMATO_TABLA_COMPILADA}:{marshal.version}".encode('ascii'))
+    for ruta in (direccion, ruta_gramatica):
+        if os.path.exists(ruta):
+            with open(ruta, 'rb') as f:
+                huella.update(f.read())
+        huella.update(b'\0')
+    return huella.hexdigest()
+
+def huella_arboles(ruta_fuente):
+    """Hash del archivo fuente y de lo que determina sus árboles, con el que se validan los árboles guardados.
+
+    Incluye la tabla LL(1), la gramática y los módulos que construyen los
+    árboles, así que un cambio en el compilador invalida los ya guardados.
+    """
+    huella = hashlib.sha256()
+    for ruta in (ruta_fuente, ruta_archivo_ll1, ruta_gramatica, os.path.join(directorio, 'lexico.py'),
+                 os.path.abspath(__file__), os.path.join(directorio, 'arbol_abstracto.py')):
+        if os.path.exists(ruta):
+            with open(ruta, 'rb') as f:
+                huella.update(f.read())
+        huella.update(b'\0')
+    return huella.digest()
+
+def cargar_tabla_ll1(direccion, usar_compilada=True):
+    """Carga la tabla LL(1) del CSV y la compila a una TablaLL1.
+
+    Filas (no terminales) y columnas (terminales) se traducen a códigos de
+    `nombres_tipos_token`, y cada producción a la tupla de códigos de sus
+    símbolos; las celdas vacías quedan como tuplas vacías. El CSV es la
+    fuente que se edita: con `usar_compilada` la tabla se toma de su versión
+    compilada junto al CSV (ver ruta_tabla_compilada) si su huella coincide
+    con la del CSV y la gramática, y si no se vuelve a compilar y escribir.
+    """
+    if usar_compilada:
+        huella = huella_tabla_ll1(direccion)
+        tabla = TablaLL1.cargar(ruta_tabla_compilada(direccion), huella)
+        if tabla is not None:
+            return tabla
+
+    with open(direccion, 'r', encoding='utf-8', newline='') as f:
+        filas = list(csv.reader(f))
+    terminales = [codigo_tipo_token(nombre) for nombre in filas[0][1:]]
+    no_terminales = [codigo_tipo_token(fila[0]) for fila in filas[1:]]
+    celdas = [[tuple(codigo_tipo_token(simbolo) for simbolo in produccion.split()) for produccion in fila[1:]]
+              for fila in filas[1:]]
+    tabla = TablaLL1(no_terminales, terminales, celdas)
+
+    if usar_compilada:
+        try:
+            tabla.guardar(ruta_tabla_compilada(direccion), huella)
+        except OSError:
+            pass
+    return tabla
+
+# Producción vacía 'e' de la tabla LL(1).
+CODIGO_VACIO = codigo_tipo_token('e')
+produccion_vacia = ((CODIGO_VACIO, True),)
 
 # Clase Nodo para crear el árbol sintáctico.
 class Nodo:
-    def __init__(self, id, tipo, valor=None, linea=None, columna=None, terminal=False):
+    def __init__(self, id, tipo, valor=None, linea=None, columna=None, terminal=False, codigo=None):
         self.id = id
         self.tipo = tipo
+        self.codigo = codigos_tipos_token.get(tipo) if codigo is None else codigo
         self.valor = valor
         self.linea = linea
         self.columna = columna
@@ -84,10 +263,18 @@ class Nodo:
         hijo.padre = self  
         self.hijos.append(hijo)
 
-# Función para generar el Digraph del árbol sintáctico.
-def arbolSintactico(raiz, contorno_hojas=False, opcion="tipo"):
-    graph = Digraph()
-    def generar_nodos(node):
+class VisitanteDigraph(Visitante):
+    """Agrega al Digraph cada nodo del árbol sintáctico y la arista desde su padre."""
+
+    def __init__(self, graph, contorno_hojas, opcion):
+        self.graph = graph
+        self.contorno_hojas = contorno_hojas
+        self.opcion = opcion
+
+    def entrar(self, node, padre):
+        if padre is not None:
+            self.graph.edge(str(padre.id), str(node.id))
+        opcion = self.opcion
         if opcion == "tipo":
             label = f"{node.tipo}"
         elif opcion == "linea":
@@ -102,32 +289,59 @@ def arbolSintactico(raiz, contorno_hojas=False, opcion="tipo"):
             label = f"{node.terminal}"
         else:
             label = f"{node.tipo}"
-        if not node.hijos and contorno_hojas:
-            graph.node(str(node.id), label, style="filled", fillcolor='lightgrey', peripheries='2')
+        if not node.hijos and self.contorno_hojas:
+            self.graph.node(str(node.id), label, style="filled", fillcolor='lightgrey', peripheries='2')
         else:
-            graph.node(str(node.id), label, style="filled", fillcolor='white')
-        for hijo in node.hijos:
-            graph.edge(str(node.id), str(hijo.id))
-            generar_nodos(hijo)
-    generar_nodos(raiz)
+            self.graph.node(str(node.id), label, style="filled", fillcolor='white')
+        return True
+
+# Función para generar el Digraph del árbol sintáctico.
+def arbolSintactico(raiz, contorno_hojas=False, opcion="tipo"):
+    graph = Digraph()
+    VisitanteDigraph(graph, contorno_hojas, opcion).recorrer(raiz)
     return graph
 
 # Lista de errores semánticos
 errores_semanticos = []
 
-# Verificar que las variables estén declaradas 
-def verificar_variable(nodo, ambito_actual):
-    if nodo.tipo == 'restofuncn' or nodo.tipo == 'restomain':
-        if ambito_actual.hijos:
-            ambito_actual = ambito_actual.hijos.pop(0)
+# Nodos del AST que usan o declaran un identificador.
+NODOS_CON_IDENTIFICADOR = (Param, VarDecl, Assign, CallStmt, Read, Call, Name)
 
-    if nodo.tipo == 'id' and nodo.valor:
-        simbolo = ambito_actual.buscar_simbolo(nodo.valor)
-        if not simbolo:
-            mensaje = f"❌ Error semántico: La variable '{nodo.valor}' no está declarada en la línea {nodo.linea}, columna {nodo.columna}"
-            errores_semanticos.append(mensaje)
-    for hijo in nodo.hijos:
-        verificar_variable(hijo, ambito_actual)
+class VisitanteVariables(Visitante):
+    """Recorre el AST reportando los identificadores que no están declarados en su ámbito.
+
+    Al entrar en cada FunctionDef toma (y quita) el siguiente ámbito hijo
+    del ámbito actual, y lo deja al salir de ella.
+    """
+
+    def __init__(self, ambito_actual):
+        self.ambitos = [ambito_actual]
+
+    def entrar(self, nodo, padre):
+        ambito_actual = self.ambitos[-1]
+        if isinstance(nodo, FunctionDef):
+            if ambito_actual.hijos:
+                ambito_actual = ambito_actual.hijos.pop(0)
+            self.ambitos.append(ambito_actual)
+            accion = SALIR
+            usa_identificador = not nodo.principal
+        else:
+            accion = True
+            usa_identificador = isinstance(nodo, NODOS_CON_IDENTIFICADOR)
+
+        if usa_identificador:
+            simbolo = ambito_actual.buscar_simbolo(nodo.nombre)
+            if not simbolo:
+                mensaje = f"❌ Error semántico: La variable '{nodo.nombre}' no está declarada en la línea {nodo.linea}, columna {nodo.columna}"
+                errores_semanticos.append(mensaje)
+        return accion
+
+    def salir(self, nodo, padre):
+        self.ambitos.pop()
+
+# Verificar que las variables estén declaradas
+def verificar_variable(nodo, ambito_actual):
+    VisitanteVariables(ambito_actual).recorrer(nodo)
 
 # Función para generar el Digraph de la tabla de símbolos.
 def generar_diagrama_tabla_simbolos(tabla_simbolos, graph=None, id_padre=None):
@@ -187,6 +401,7 @@ def generar_tabla_simbolos_csv(tabla_simbolos, nombre_archivo, output_folder):
     recorrer_ambitos(tabla_simbolos)
 
     # Crear un DataFrame con los datos
+    import pandas as pd
     df = pd.DataFrame(datos_tabla, columns=['Símbolo', 'Categoría', 'Tipo', 'Ámbito', 'Parámetros', 'Retorno'])
     
     # Guardar la tabla en un archivo CSV
@@ -194,132 +409,46 @@ def generar_tabla_simbolos_csv(tabla_simbolos, nombre_archivo, output_folder):
     df.to_csv(ruta_csv, index=False, encoding='utf-8')
     print(f"Tabla de símbolos generada: {ruta_csv}")
 
-# Funciones para construir la tabla de símbolos recorriendo el árbol sintáctico
-def buscar_hijo(nodo, tipo):
-    """Encuentra un hijo con el tipo especificado."""
-    for hijo in nodo.hijos:
-        if hijo.tipo == tipo:
-            return hijo
-    return None
-
-def extraer_parametros(nodo_parametrosf):
-    """Extrae los parámetros de un nodo 'parametrosf'."""
-    parámetros = []
-    if not nodo_parametrosf:
-        return parámetros
-    print(f"Extrayendo parámetros del nodo: {nodo_parametrosf.tipo}")
-    # 'parametrosf' -> 'id tipodato masparametrosf' o vacío
-    if not nodo_parametrosf.hijos:
-        return parámetros  # Producción vacía
-    nodo_id = buscar_hijo(nodo_parametrosf, 'id')
-    nodo_tipodato = buscar_hijo(nodo_parametrosf, 'tipodato')
-    nodo_masparametrosf = buscar_hijo(nodo_parametrosf, 'masparametrosf')
-    if nodo_id and nodo_id.valor and nodo_tipodato and nodo_tipodato.hijos:
-        tipo_param = nodo_tipodato.hijos[0].tipo
-        parámetros.append({'nombre': nodo_id.valor, 'tipo': tipo_param})
-        print(f"Parámetro encontrado: {nodo_id.valor}, tipo: {tipo_param}")
+# Funciones para construir la tabla de símbolos recorriendo el AST
+def procesar_asignaciones(instruccion, ambito):
+    """Registra la variable de una declaración (VarDecl)."""
+    if isinstance(instruccion, VarDecl):
+        ambito.agregar_simbolo(instruccion.nombre, tipo=instruccion.tipo, categoria='variable')
+        print(f"Variable registrada: {instruccion.nombre}, tipo: {instruccion.tipo}")
     else:
-        print("No se encontró un parámetro en este nodo")
-    if nodo_masparametrosf and nodo_masparametrosf.hijos:
-        # 'masparametrosf' -> 'coma parametrosf' o vacío
-        siguientes_params = buscar_hijo(nodo_masparametrosf, 'parametrosf')
-        if siguientes_params:
-            parámetros.extend(extraer_parametros(siguientes_params))
-    return parámetros
-
-def procesar_asignaciones(nodo_asignaciones, ambito):
-    """Procesa un nodo 'asignaciones' para registrar variables."""
-    print(f"Procesando nodo asignaciones: {nodo_asignaciones.tipo}")
-    nodo_id = buscar_hijo(nodo_asignaciones, 'id')
-    nodo_ext = buscar_hijo(nodo_asignaciones, 'ext')
-    if nodo_id and nodo_id.valor and nodo_ext and nodo_ext.hijos:
-        hijo_ext = nodo_ext.hijos[0]
-        if hijo_ext.tipo == 'tipodato' and hijo_ext.hijos:
-            tipo_var = hijo_ext.hijos[0].tipo
-            ambito.agregar_simbolo(nodo_id.valor, tipo=tipo_var, categoria='variable')
-            print(f"Variable registrada: {nodo_id.valor}, tipo: {tipo_var}")
-        else:
-            print("No se encontró tipo para la variable")
-    else:
-        print("No se encontró variable en asignaciones")
-
-def procesar_instrucciones(nodo_masinstrucciones, ambito):
-    """Procesa las instrucciones dentro de un nodo 'masinstrucciones'."""
-    if not nodo_masinstrucciones:
-        return
-    print(f"Procesando nodo masinstrucciones: {nodo_masinstrucciones.tipo}")
-    for hijo in nodo_masinstrucciones.hijos:
-        print(f"Nodo hijo: {hijo.tipo}")
-        if hijo.tipo == 'instruccion':
-            hijo_instruccion = hijo.hijos[0] if hijo.hijos else None
-            if hijo_instruccion and hijo_instruccion.tipo == 'asignaciones':
-                procesar_asignaciones(hijo_instruccion, ambito)
-        elif hijo.tipo == 'masinstrucciones':
-            procesar_instrucciones(hijo, ambito)
-
-def procesar_funcion(nodo_func, ambito):
-    """Procesa un nodo 'restofuncn' o 'restomain' para registrar una función y su ámbito."""
-    print(f"Procesando nodo función: {nodo_func.tipo}")
-    if nodo_func.tipo == 'restomain':
-        nombre_func = 'main'
-        parámetros = []
-        retorno = 'tentero'
+        print("No se encontró tipo para la variable")
+
+def procesar_instrucciones(bloque, ambito):
+    """Procesa las declaraciones de primer nivel de un Block."""
+    for instruccion in bloque.instrucciones:
+        if isinstance(instruccion, ASIGNACIONES):
+            procesar_asignaciones(instruccion, ambito)
+
+def procesar_funcion(funcion, ambito):
+    """Procesa un FunctionDef para registrar la función y su ámbito."""
+    parámetros = [{'nombre': param.nombre, 'tipo': param.tipo} for param in funcion.parametros]
+    if funcion.principal:
         print("Función main encontrada")
-    elif nodo_func.tipo == 'restofuncn':
-        nodo_id = buscar_hijo(nodo_func, 'id')
-        nombre_func = nodo_id.valor if nodo_id and nodo_id.valor else None
-        if not nombre_func:
-            print("Nombre de función no encontrado")
-            return
-        nodo_param = buscar_hijo(nodo_func, 'parametrosf')
-        parámetros = extraer_parametros(nodo_param) if nodo_param else []
-        nodo_opciondato = buscar_hijo(nodo_func, 'opciondato')
-        retorno = 'tvacio'  # Valor por defecto
-        if nodo_opciondato and nodo_opciondato.hijos:
-            nodo_tipodato = buscar_hijo(nodo_opciondato, 'tipodato')
-            if nodo_tipodato and nodo_tipodato.hijos:
-                retorno = nodo_tipodato.hijos[0].tipo  # Extraer el tipo real (tentero, tflotante, etc.)
-        print(f"Función encontrada: {nombre_func}, parámetros: {parámetros}, retorno: {retorno}")
     else:
-        print("No es un nodo de función")
-        return
+        for param in parámetros:
+            print(f"Parámetro encontrado: {param['nombre']}, tipo: {param['tipo']}")
+        print(f"Función encontrada: {funcion.nombre}, parámetros: {parámetros}, retorno: {funcion.retorno}")
 
     # Registrar la función en el ámbito actual
-    ambito.agregar_simbolo(nombre_func, categoria='function', parámetros=parámetros, retorno=retorno)
+    ambito.agregar_simbolo(funcion.nombre, categoria='function', parámetros=parámetros, retorno=funcion.retorno)
     # Crear un nuevo ámbito para la función
     ambito_func = ambito.entrar_ambito()
     # Registrar los parámetros en el ámbito de la función
     for param in parámetros:
         ambito_func.agregar_simbolo(param['nombre'], tipo=param['tipo'], categoria='parametro')
     # Procesar las instrucciones dentro de la función para encontrar variables
-    nodo_masinstrucciones = buscar_hijo(nodo_func, 'masinstrucciones')
-    if nodo_masinstrucciones:
-        procesar_instrucciones(nodo_masinstrucciones, ambito_func)
-
-def construir_tabla_simbolos(arbol, tabla_simbolos):
-    """Construye la tabla de símbolos recorriendo el árbol sintáctico."""
-    if arbol.tipo != 'programaprincipal':
-        print(f"El nodo raíz no es 'programaprincipal', se encontró: {arbol.tipo}")
-        return
-    print("Construyendo tabla de símbolos desde programaprincipal")
-    # Procesar funciones definidas en el programa
-    nodo_actual = arbol
-    while nodo_actual and nodo_actual.tipo == 'programaprincipal':
-        print(f"Procesando nodo programaprincipal con hijos: {[hijo.tipo for hijo in nodo_actual.hijos]}")
-        # Buscar 'funcion' -> 'restofuncn' o 'opcionprincipal' -> 'restomain'/'restofuncn'
-        nodo_funcion = buscar_hijo(nodo_actual, 'funcion')
-        nodo_opcionprincipal = buscar_hijo(nodo_actual, 'opcionprincipal')
-        if nodo_funcion and nodo_funcion.hijos:
-            nodo_func = nodo_funcion.hijos[0]  # funcion -> restofuncn
-            procesar_funcion(nodo_func, tabla_simbolos)
-        elif nodo_opcionprincipal and nodo_opcionprincipal.hijos:
-            nodo_func = nodo_opcionprincipal.hijos[0]  # opcionprincipal -> restomain/restofuncn
-            procesar_funcion(nodo_func, tabla_simbolos)
-        nodo_masfuncn = buscar_hijo(nodo_actual, 'masfuncn')
-        if nodo_masfuncn and nodo_masfuncn.hijos:
-            nodo_actual = nodo_masfuncn.hijos[0]  # masfuncn -> programaprincipal
-        else:
-            break
+    procesar_instrucciones(funcion.cuerpo, ambito_func)
+
+def construir_tabla_simbolos(programa, tabla_simbolos):
+    """Construye la tabla de símbolos recorriendo el AST (Program)."""
+    print("Construyendo tabla de símbolos desde el AST")
+    for funcion in programa.funciones:
+        procesar_funcion(funcion, tabla_simbolos)
 
 # ===========================
 # VERIFICACIÓN DE TIPOS
@@ -421,150 +550,90 @@ class VerificadorTipos:
 
     def inferir_tipo_expresion(self, nodo, ambito_actual, errores_tipos):
         """
-        Infiere el tipo de una expresión recursivamente.
+        Infiere el tipo de una expresión del AST sin recursión.
         Retorna el tipo inferido o None si hay error.
+
+        La cadena de operaciones se recorre hacia la derecha con un bucle y
+        sus tipos se combinan al final, de derecha a izquierda; un paréntesis
+        apila la cadena en curso hasta conocer su tipo.
         """
-        if nodo.tipo == 'expresion':
-            # Una expresión puede ser: pabierto expresion pcerrado, id opciones, o valordato
-            if len(nodo.hijos) == 0:
-                return None
-                
-            primer_hijo = nodo.hijos[0]
-            
-            if primer_hijo.tipo == 'pabierto':
-                # Expresión entre paréntesis
-                expresion_interna = None
-                for hijo in nodo.hijos:
-                    if hijo.tipo == 'expresion':
-                        expresion_interna = hijo
-                        break
-                if expresion_interna:
-                    tipo_base = self.inferir_tipo_expresion(expresion_interna, ambito_actual, errores_tipos)
-                    # Buscar masexpresiones
-                    masexpresiones = None
-                    for hijo in nodo.hijos:
-                        if hijo.tipo == 'masexpresiones':
-                            masexpresiones = hijo
-                            break
-                    return self.procesar_masexpresiones(tipo_base, masexpresiones, ambito_actual, errores_tipos, nodo)
-                
-            elif primer_hijo.tipo == 'id':
-                # Variable o llamada a función
-                nombre_var = primer_hijo.valor
-                simbolo = ambito_actual.buscar_simbolo(nombre_var)
-                
-                if not simbolo:
-                    errores_tipos.append(f"❌ Error de tipos: Variable '{nombre_var}' no declarada en línea {primer_hijo.linea}")
-                    return None
-                
-                # Verificar si es una llamada a función
-                opciones = None
-                for hijo in nodo.hijos:
-                    if hijo.tipo == 'opciones':
-                        opciones = hijo
-                        break
-                
-                # CORRECCIÓN: Solo es función si opciones tiene hijos REALES (no 'e')
-                es_llamada_funcion = False
-                if opciones and opciones.hijos:
-                    # Verificar si tiene hijos que no sean 'e'
-                    hijos_reales = [h for h in opciones.hijos if h.tipo != 'e']
-                    if hijos_reales:
-                        es_llamada_funcion = True
-                
-                if es_llamada_funcion:
-                    # Es una llamada a función
-                    if simbolo['categoria'] != 'function':
-                        errores_tipos.append(f"❌ Error de tipos: '{nombre_var}' no es una función en línea {primer_hijo.linea}")
-                        return None
-                    tipo_base = simbolo['retorno']
-                else:
-                    # Es una variable normal
-                    tipo_base = simbolo['tipo']
-                
-                # Procesar masexpresiones
-                masexpresiones = None
-                for hijo in nodo.hijos:
-                    if hijo.tipo == 'masexpresiones':
-                        masexpresiones = hijo
-                        break
-                
-                return self.procesar_masexpresiones(tipo_base, masexpresiones, ambito_actual, errores_tipos, nodo)
-                
-            elif primer_hijo.tipo == 'valordato':
-                # Valor literal
-                tipo_base = self.obtener_tipo_valordato(primer_hijo)
-                
-                # Procesar masexpresiones
-                masexpresiones = None
-                for hijo in nodo.hijos:
-                    if hijo.tipo == 'masexpresiones':
-                        masexpresiones = hijo
-                        break
-                
-                return self.procesar_masexpresiones(tipo_base, masexpresiones, ambito_actual, errores_tipos, nodo)
-        
-        elif nodo.tipo == 'valordato':
-            return self.obtener_tipo_valordato(nodo)
-            
-        elif nodo.tipo == 'id':
-            nombre_var = nodo.valor
-            simbolo = ambito_actual.buscar_simbolo(nombre_var)
-            if simbolo:
-                return simbolo['tipo'] if simbolo['categoria'] != 'function' else simbolo['retorno']
-            else:
-                errores_tipos.append(f"❌ Error de tipos: Variable '{nombre_var}' no declarada en línea {nodo.linea}")
-                return None
-        
-        return None
+        if not isinstance(nodo, (BinOp, Paren)):
+            # Un operando solo
+            return self.obtener_tipo_operando(nodo, ambito_actual, errores_tipos)[0]
 
-    def obtener_tipo_valordato(self, nodo_valordato):
-        """Obtiene el tipo de un nodo valordato."""
-        if not nodo_valordato.hijos:
-            return None
-        
-        tipo_hijo = nodo_valordato.hijos[0].tipo
-        
-        if tipo_hijo == 'nentero':
+        # Cadenas suspendidas por un paréntesis y, de la cadena en curso, (tipo izquierdo, operador) de cada BinOp
+        cadenas = []
+        pendientes = []
+        while True:
+            # Una expresión es un operando (paréntesis, variable, llamada o literal) o un BinOp con él a la izquierda
+            operando = nodo.izquierda if isinstance(nodo, BinOp) else nodo
+
+            if isinstance(operando, Paren):
+                # Expresión entre paréntesis: su tipo se infiere antes de seguir con esta cadena
+                cadenas.append((nodo, pendientes))
+                nodo, pendientes = operando.expresion, []
+                continue
+
+            tipo_base, declarado = self.obtener_tipo_operando(operando, ambito_actual, errores_tipos)
+            while True:
+                # Si el operando no está declarado, el resto de la cadena no se evalúa
+                if declarado and isinstance(nodo, BinOp):
+                    pendientes.append((tipo_base, nodo.operador))
+                    nodo = nodo.derecha
+                    break
+
+                for tipo_izquierdo, tipo_operador in reversed(pendientes):
+                    if tipo_izquierdo is None or tipo_base is None:
+                        tipo_base = None
+                    else:
+                        tipo_base = self.procesar_operacion(tipo_operador, tipo_izquierdo, tipo_base, errores_tipos)
+                if not cadenas:
+                    return tipo_base
+                nodo, pendientes = cadenas.pop()
+                declarado = True
+
+    def obtener_tipo_operando(self, operando, ambito_actual, errores_tipos):
+        """
+        Retorna (tipo, declarado) de un Literal, Name o Call.
+        """
+        if isinstance(operando, Literal):
+            # Valor literal
+            return self.obtener_tipo_literal(operando), True
+
+        # Variable o llamada a función
+        simbolo = ambito_actual.buscar_simbolo(operando.nombre)
+
+        if not simbolo:
+            errores_tipos.append(f"❌ Error de tipos: Variable '{operando.nombre}' no declarada en línea {operando.linea}")
+            return None, False
+
+        if isinstance(operando, Call):
+            # Es una llamada a función
+            if simbolo['categoria'] != 'function':
+                errores_tipos.append(f"❌ Error de tipos: '{operando.nombre}' no es una función en línea {operando.linea}")
+                return None, False
+            return simbolo['retorno'], True
+
+        # Es una variable normal
+        return simbolo['tipo'], True
+
+    def obtener_tipo_literal(self, nodo_literal):
+        """Obtiene el tipo de un nodo Literal."""
+        if nodo_literal.tipo == 'nentero':
             return 'tentero'
-        elif tipo_hijo == 'nflotante':
+        elif nodo_literal.tipo == 'nflotante':
             return 'tflotante'
-        elif tipo_hijo == 'ncadena':
+        elif nodo_literal.tipo == 'ncadena':
             return 'tcadena'
-        elif tipo_hijo == 'nbooleano':
+        elif nodo_literal.tipo == 'nbooleano':
             return 'tbooleano'
         
         return None
 
-    def procesar_masexpresiones(self, tipo_izquierdo, nodo_masexpresiones, ambito_actual, errores_tipos, nodo_contexto):
+    def procesar_operacion(self, tipo_operador, tipo_izquierdo, tipo_derecho, errores_tipos):
         """
-        Procesa las operaciones en masexpresiones y retorna el tipo resultante.
+        Retorna el tipo resultante de aplicar un operador a los tipos de sus operandos.
         """
-        if not nodo_masexpresiones or not nodo_masexpresiones.hijos:
-            return tipo_izquierdo
-        
-        # masexpresiones -> operacion expresion
-        nodo_operacion = None
-        nodo_expresion = None
-        
-        for hijo in nodo_masexpresiones.hijos:
-            if hijo.tipo == 'operacion':
-                nodo_operacion = hijo
-            elif hijo.tipo == 'expresion':
-                nodo_expresion = hijo
-        
-        if not nodo_operacion or not nodo_expresion:
-            return tipo_izquierdo
-        
-        # Obtener el tipo de operador
-        tipo_operador = nodo_operacion.hijos[0].tipo if nodo_operacion.hijos else None
-        
-        # Inferir tipo de la expresión derecha
-        tipo_derecho = self.inferir_tipo_expresion(nodo_expresion, ambito_actual, errores_tipos)
-        
-        if tipo_izquierdo is None or tipo_derecho is None:
-            return None
-        
         # Aplicar reglas de inferencia
         if tipo_operador in self.reglas_operadores:
             reglas = self.reglas_operadores[tipo_operador]
@@ -573,8 +642,9 @@ class VerificadorTipos:
             if clave in reglas:
                 return reglas[clave]
             else:
+                # Las expresiones no guardan posición (tampoco la tenía el nodo expresion del árbol sintáctico)
                 errores_tipos.append(
-                    f"❌ Error de tipos: Operación '{tipo_operador}' no válida entre '{tipo_izquierdo}' y '{tipo_derecho}' en línea {nodo_contexto.linea if nodo_contexto.linea else 'desconocida'}"
+                    f"❌ Error de tipos: Operación '{tipo_operador}' no válida entre '{tipo_izquierdo}' y '{tipo_derecho}' en línea desconocida"
                 )
                 return None
         else:
@@ -623,142 +693,125 @@ def crear_copia_tabla_simbolos(tabla_original):
    
    return nueva_tabla
 
-def verificar_tipos_completo(nodo, ambito_actual, errores_tipos, verificador):
+class VisitanteTipos(Visitante):
    """
-   Función principal que recorre el árbol y verifica todos los tipos.
+   Recorre funciones, bloques e instrucciones del AST verificando los tipos de cada instrucción.
    """
-   # Cambiar de ámbito si es necesario - ANTES de procesar los hijos
-   if nodo.tipo == 'restofuncn' or nodo.tipo == 'restomain':
-       if ambito_actual.hijos:
-           # Usar el ámbito hijo que corresponde a esta función
-           ambito_funcion = ambito_actual.hijos[0]
-           
-           # Procesar todos los hijos con el nuevo ámbito
-           for hijo in nodo.hijos:
-               verificar_tipos_completo(hijo, ambito_funcion, errores_tipos, verificador)
-           return  # Salir temprano para evitar procesar los hijos otra vez
-
-   # Verificar asignaciones
-   if nodo.tipo == 'asignaciones':
-       verificar_asignacion_tipos(nodo, ambito_actual, errores_tipos, verificador)
-   
-   # Verificar expresiones en instrucciones
-   elif nodo.tipo == 'instruccion':
-       verificar_instruccion_tipos(nodo, ambito_actual, errores_tipos, verificador)
-   
-   # Continuar recursivamente con el ámbito actual
-   for hijo in nodo.hijos:
-       verificar_tipos_completo(hijo, ambito_actual, errores_tipos, verificador)
+   def __init__(self, ambito_actual, errores_tipos, verificador):
+       self.ambito_actual = ambito_actual
+       self.ambito_funcion = ambito_actual
+       self.errores_tipos = errores_tipos
+       self.verificador = verificador
 
-def verificar_asignacion_tipos(nodo_asignaciones, ambito_actual, errores_tipos, verificador):
+   def hijos(self, nodo):
+       # De las instrucciones solo se recorren sus bloques; sus expresiones las verifica entrar
+       if isinstance(nodo, (FunctionDef, While, For)):
+           return [nodo.cuerpo]
+       if isinstance(nodo, If):
+           return [nodo.cuerpo, nodo.sino] if nodo.sino else [nodo.cuerpo]
+       return nodo.hijos
+
+   def entrar(self, nodo, padre):
+       if isinstance(nodo, FunctionDef):
+           # Cambiar de ámbito si es necesario
+           self.ambito_funcion = self.ambito_actual
+           if self.ambito_actual.hijos:
+               # Usar el ámbito hijo que corresponde a esta función
+               self.ambito_funcion = self.ambito_actual.hijos[0]
+           return True
+       if isinstance(nodo, (Program, Block)):
+           return True
+       verificar_instruccion_tipos(nodo, self.ambito_funcion, self.errores_tipos, self.verificador)
+       return isinstance(nodo, (If, While, For))
+
+def verificar_tipos_completo(programa, ambito_actual, errores_tipos, verificador):
    """
-   Verifica los tipos en una asignación.
+   Función principal que recorre el AST y verifica todos los tipos.
    """
-   nodo_id = buscar_hijo(nodo_asignaciones, 'id')
-   nodo_ext = buscar_hijo(nodo_asignaciones, 'ext')
-   
-   if not nodo_id or not nodo_ext:
-       return
-   
-   nombre_var = nodo_id.valor
+   VisitanteTipos(ambito_actual, errores_tipos, verificador).recorrer(programa)
+
+def verificar_asignacion_tipos(instruccion, ambito_actual, errores_tipos, verificador):
+   """
+   Verifica los tipos en una asignación (VarDecl, Assign o CallStmt).
+   """
+   nombre_var = instruccion.nombre
    simbolo = ambito_actual.buscar_simbolo(nombre_var)
    
    if not simbolo:
        return  # Error ya reportado en verificación de variables
    
-   nodo_expresion = None
+   # Una llamada o una declaración sin valor no asignan nada
+   if isinstance(instruccion, CallStmt) or instruccion.valor is None:
+       return
    
-   # CASO 1: ext -> extension -> igual expresion (asignación sin tipo)
-   if nodo_ext.hijos and nodo_ext.hijos[0].tipo == 'extension':
-       nodo_extension = nodo_ext.hijos[0]
-       
-       if nodo_extension.hijos and nodo_extension.hijos[0].tipo == 'igual':
-           for hijo in nodo_extension.hijos:
-               if hijo.tipo == 'expresion':
-                   nodo_expresion = hijo
-                   break
+   tipo_expresion = verificador.inferir_tipo_expresion(instruccion.valor, ambito_actual, errores_tipos)
    
-   # CASO 2: ext -> tipodato opcionesasig (declaración con tipo y posible asignación)
-   elif nodo_ext.hijos and nodo_ext.hijos[0].tipo == 'tipodato':
-       # Buscar opcionesasig
-       nodo_opcionesasig = None
-       for hijo in nodo_ext.hijos:
-           if hijo.tipo == 'opcionesasig':
-               nodo_opcionesasig = hijo
-               break
+   if tipo_expresion:
+       tipo_variable = simbolo['tipo']
        
-       if nodo_opcionesasig and nodo_opcionesasig.hijos:
-           # opcionesasig -> igual expresion
-           if nodo_opcionesasig.hijos[0].tipo == 'igual':
-               for hijo in nodo_opcionesasig.hijos:
-                   if hijo.tipo == 'expresion':
-                       nodo_expresion = hijo
-                       break
-       else:
-           return  # No hay asignación, solo declaración
-   
-   if nodo_expresion:
-       tipo_expresion = verificador.inferir_tipo_expresion(nodo_expresion, ambito_actual, errores_tipos)
-       
-       if tipo_expresion:
-           tipo_variable = simbolo['tipo']
-           
-           verificador.verificar_asignacion(
-               tipo_variable, 
-               tipo_expresion, 
-               nombre_var, 
-               nodo_id.linea, 
-               errores_tipos
-           )
-
-def verificar_instruccion_tipos(nodo_instruccion, ambito_actual, errores_tipos, verificador):
+       verificador.verificar_asignacion(
+           tipo_variable, 
+           tipo_expresion, 
+           nombre_var, 
+           instruccion.linea, 
+           errores_tipos
+       )
+
+def verificar_instruccion_tipos(instruccion, ambito_actual, errores_tipos, verificador):
    """
-   Verifica tipos en diferentes tipos de instrucciones.
+   Verifica tipos en diferentes tipos de instrucciones (sin sus bloques, que recorre VisitanteTipos).
    """
-   if not nodo_instruccion.hijos:
-       return
-   
-   tipo_instruccion = nodo_instruccion.hijos[0].tipo
+   if isinstance(instruccion, ASIGNACIONES):
+       verificar_asignacion_tipos(instruccion, ambito_actual, errores_tipos, verificador)
    
    # Verificar condiciones en if, while, etc.
-   if tipo_instruccion in ['condicional', 'buclemientras']:
-       verificar_condiciones_booleanas(nodo_instruccion.hijos[0], ambito_actual, errores_tipos, verificador)
+   elif isinstance(instruccion, (If, While)):
+       verificar_condiciones_booleanas(instruccion, ambito_actual, errores_tipos, verificador)
+   
+   # En el bucle para se verifican sus dos asignaciones
+   elif isinstance(instruccion, For):
+       verificar_asignacion_tipos(instruccion.inicio, ambito_actual, errores_tipos, verificador)
+       verificar_asignacion_tipos(instruccion.paso, ambito_actual, errores_tipos, verificador)
    
    # Verificar expresión de retorno
-   elif tipo_instruccion == 'devolver':
-       for hijo in nodo_instruccion.hijos:
-           if hijo.tipo == 'expresion':
-               tipo_retorno = verificador.inferir_tipo_expresion(hijo, ambito_actual, errores_tipos)
-               # Aquí podrías verificar que coincida con el tipo de retorno de la función
-               break
+   elif isinstance(instruccion, Return):
+       tipo_retorno = verificador.inferir_tipo_expresion(instruccion.valor, ambito_actual, errores_tipos)
+       # Aquí podrías verificar que coincida con el tipo de retorno de la función
 
-def verificar_condiciones_booleanas(nodo, ambito_actual, errores_tipos, verificador):
+class VisitanteCondiciones(Visitante):
    """
-   Verifica que las condiciones en if/while sean booleanas.
+   Busca las expresiones de una instrucción if/while y verifica que sean booleanas.
    """
-   # Buscar expresiones en condiciones
-   def buscar_expresiones(nodo_actual):
-       if nodo_actual.tipo == 'expresion':
-           tipo_expresion = verificador.inferir_tipo_expresion(nodo_actual, ambito_actual, errores_tipos)
+   def __init__(self, ambito_actual, errores_tipos, verificador):
+       self.ambito_actual = ambito_actual
+       self.errores_tipos = errores_tipos
+       self.verificador = verificador
+
+   def entrar(self, nodo, padre):
+       # El operando izquierdo de un BinOp es parte de él, no otra expresión (pero sí se recorren sus hijos)
+       if isinstance(nodo, EXPRESIONES) and not (isinstance(padre, BinOp) and nodo is padre.izquierda):
+           tipo_expresion = self.verificador.inferir_tipo_expresion(nodo, self.ambito_actual, self.errores_tipos)
            if tipo_expresion and tipo_expresion != 'tbooleano':
-               errores_tipos.append(
-                   f"❌ Error de tipos: Se esperaba expresión booleana en condición, se encontró '{tipo_expresion}' en línea {nodo_actual.linea if nodo_actual.linea else 'desconocida'}"
+               self.errores_tipos.append(
+                   f"❌ Error de tipos: Se esperaba expresión booleana en condición, se encontró '{tipo_expresion}' en línea desconocida"
                )
-       
-       for hijo in nodo_actual.hijos:
-           buscar_expresiones(hijo)
-   
-   buscar_expresiones(nodo)
+       return True
+
+def verificar_condiciones_booleanas(nodo, ambito_actual, errores_tipos, verificador):
+   """
+   Verifica que las condiciones en if/while sean booleanas.
+   """
+   VisitanteCondiciones(ambito_actual, errores_tipos, verificador).recorrer(nodo)
 
-def ejecutar_verificacion_tipos(arbol_sintactico, tabla_simbolos):
+def ejecutar_verificacion_tipos(arbol_abstracto, tabla_simbolos):
    """
-   Función principal que ejecuta toda la verificación de tipos.
+   Función principal que ejecuta toda la verificación de tipos sobre el AST.
    """
    errores_tipos = []
    verificador = VerificadorTipos()
    
    print("\n🔍 Iniciando verificación de tipos...")
-   verificar_tipos_completo(arbol_sintactico, tabla_simbolos, errores_tipos, verificador)
+   verificar_tipos_completo(arbol_abstracto, tabla_simbolos, errores_tipos, verificador)
    
    if errores_tipos:
        print("\n🚨 Errores de tipos encontrados:")
@@ -771,12 +824,21 @@ def ejecutar_verificacion_tipos(arbol_sintactico, tabla_simbolos):
 
 # Función que realiza el algoritmo analizador sintáctico.
 def analizador_sintactico(lista_de_tokens, tabla_ll1):
+   if not isinstance(lista_de_tokens, TokenBuffer):
+       buffer = TokenBuffer()
+       for token in lista_de_tokens:
+           buffer.append(token)
+       lista_de_tokens = buffer
+   # El análisis compara solo códigos enteros; los nombres se guardan en los
+   # nodos para mostrar el árbol y para las fases siguientes.
+   tipos = lista_de_tokens.tipos
+   matriz = tabla_ll1.matriz
    errores_sintacticos = []
    pila = []
-   inicial = tabla_ll1.index[0]
+   inicial = tabla_ll1.inicial
    contador = 0
-   nodo_dolar = Nodo(contador, "$", None, None, None, True)
-   nodo_inicio = Nodo(contador + 1, inicial, None, None, None, False)
+   nodo_dolar = Nodo(contador, "$", None, None, None, True, CODIGO_FIN)
+   nodo_inicio = Nodo(contador + 1, nombres_tipos_token[inicial], None, None, None, False, inicial)
    pila.append(nodo_dolar)
    pila.append(nodo_inicio)
    nodoPadre = nodo_inicio
@@ -786,46 +848,40 @@ def analizador_sintactico(lista_de_tokens, tabla_ll1):
 
    while pila:
        cima = pila.pop()
-       if cima.terminal and indice < len(lista_de_tokens) and lista_de_tokens[indice].tipo == cima.tipo:
-           token_actual = lista_de_tokens[indice]
-           cima.valor = token_actual.valor
-           cima.linea = token_actual.linea
-           cima.columna = token_actual.columna
+       if cima.terminal and indice < len(tipos) and tipos[indice] == cima.codigo:
+           cima.valor = lista_de_tokens.valores[indice]
+           cima.linea, cima.columna = lista_de_tokens.posicion(indice)
            indice += 1
        elif cima.terminal:
            return False, None, errores_sintacticos
-       elif cima.tipo in tabla_ll1.index:
-           if indice < len(lista_de_tokens):
-               token_actual = lista_de_tokens[indice].tipo
-               try:
-                   produccion = tabla_ll1.at[cima.tipo, token_actual]
-                   if produccion:
-                       if produccion == 'e':
-                           nodo_e = Nodo(contador, "e", "e", None, None, True)
-                           cima.añadir_hijo(nodo_e)
-                           contador += 1
-                       else:
-                           simbolos = produccion.split()
-                           nuevos_hijos = []
-                           for simbolo in simbolos:
-                               es_terminal = simbolo in [token.tipo for token in lista_de_tokens]
-                               nodo_hijo = Nodo(contador, simbolo, None, None, None, es_terminal)
-                               nuevos_hijos.append(nodo_hijo)
-                               contador += 1
-                           for hijo in reversed(nuevos_hijos):
-                               pila.append(hijo)
-                           for hijo in nuevos_hijos:
-                               cima.añadir_hijo(hijo)
-                   else:
-                       token_error = lista_de_tokens[indice]
-                       error = ErrorSintactico(cima.tipo, "e", token_error.linea, token_error.columna)
-                       errores_sintacticos.append(error)
-                       return False, None, errores_sintacticos
-               except KeyError:
+       elif matriz[cima.codigo] is not None:
+           if indice < len(tipos):
+               produccion = matriz[cima.codigo][tipos[indice]]
+               if produccion is None:
                    token_error = lista_de_tokens[indice]
                    error = ErrorSintactico(cima.tipo, "", token_error.linea, token_error.columna)
                    errores_sintacticos.append(error)
                    return False, None, errores_sintacticos
+               if produccion:
+                   if produccion == produccion_vacia:
+                       nodo_e = Nodo(contador, "e", "e", None, None, True, CODIGO_VACIO)
+                       cima.añadir_hijo(nodo_e)
+                       contador += 1
+                   else:
+                       nuevos_hijos = []
+                       for simbolo, es_terminal in produccion:
+                           nodo_hijo = Nodo(contador, nombres_tipos_token[simbolo], None, None, None, es_terminal, simbolo)
+                           nuevos_hijos.append(nodo_hijo)
+                           contador += 1
+                       for hijo in reversed(nuevos_hijos):
+                           pila.append(hijo)
+                       for hijo in nuevos_hijos:
+                           cima.añadir_hijo(hijo)
+               else:
+                   token_error = lista_de_tokens[indice]
+                   error = ErrorSintactico(cima.tipo, "e", token_error.linea, token_error.columna)
+                   errores_sintacticos.append(error)
+                   return False, None, errores_sintacticos
            else:
                token_error = lista_de_tokens[indice]
                error = ErrorSintactico("", "", token_error.linea, token_error.columna)
@@ -836,9 +892,285 @@ def analizador_sintactico(lista_de_tokens, tabla_ll1):
            error = ErrorSintactico(cima.tipo, "", token_error.linea, token_error.columna)
            errores_sintacticos.append(error)
            return False, None, errores_sintacticos
-   exito = indice == len(lista_de_tokens)
+   exito = indice == len(tipos)
    return exito, arbol, errores_sintacticos
 
+# Modo pánico: no terminales en los que se retoma el análisis después de un error,
+# con el terminal que cierra cada uno de sus elementos (None si no lo hay).
+CODIGO_LLAVEABI = codigo_tipo_token('llaveabi')
+CODIGO_LLAVECERR = codigo_tipo_token('llavecerr')
+CODIGO_SINO = codigo_tipo_token('sino')
+puntos_recuperacion = {
+   codigo_tipo_token('masinstrucciones'): codigo_tipo_token('fsentencia'),
+   codigo_tipo_token('masfuncn'): None,
+}
+
+def sincronizar(pila, tipos, indice, tabla_ll1):
+   """Descarta símbolos de la pila y tokens hasta un punto donde el análisis puede seguir; retorna el nuevo índice.
+
+   Se desapila hasta el punto de recuperación más cercano cuyo bloque ya
+   está abierto: un masinstrucciones que espera otra instrucción, o
+   masfuncn, que espera otra función. Luego se saltan tokens, con los
+   bloques { } completos, hasta el final de la instrucción (fsentencia, que
+   se consume, o el cierre de un bloque saltado) o hasta un token del
+   FOLLOW del punto de recuperación (llavecerr, $). Para masfuncn se salta
+   hasta la siguiente función. Si no queda ningún punto de recuperación,
+   se saltan tokens hasta uno que el símbolo de la cima acepte, y al
+   llegar al $ solo queda el $ en la pila.
+   """
+   matriz = tabla_ll1.matriz
+   fin = len(tipos) - 1
+   # Las llaves que se desapilan sin haberse abierto cierran bloques que aún no empezaron.
+   llaves = 0
+   posicion = len(pila) - 1
+   while posicion > 0:
+      simbolo = pila[posicion]
+      if simbolo.terminal:
+         if simbolo.codigo == CODIGO_LLAVEABI:
+            llaves += 1
+         elif simbolo.codigo == CODIGO_LLAVECERR and llaves:
+            llaves -= 1
+      elif simbolo.codigo in puntos_recuperacion and not llaves:
+         break
+      posicion -= 1
+
+   if posicion == 0:
+      cima = pila[-1]
+      while indice < fin:
+         if tipos[indice] == cima.codigo if cima.terminal else matriz[cima.codigo][tipos[indice]]:
+            break
+         indice += 1
+      if indice >= fin:
+         del pila[1:]
+      return indice
+
+   del pila[posicion + 1:]
+   punto = pila[-1].codigo
+   terminador = puntos_recuperacion[punto]
+   siguientes = tabla_ll1.siguientes(punto)
+   profundidad = 0
+   while indice < fin:
+      tipo = tipos[indice]
+      if not profundidad:
+         if terminador is None and matriz[punto][tipo]:
+            break
+         if tipo == terminador:
+            indice += 1
+            break
+         if tipo in siguientes:
+            break
+      indice += 1
+      if tipo == CODIGO_LLAVEABI:
+         profundidad += 1
+      elif tipo == CODIGO_LLAVECERR and profundidad:
+         profundidad -= 1
+         # Un bloque saltado completo termina la instrucción, salvo que siga su else.
+         if not profundidad and terminador is not None and tipos[indice] != CODIGO_SINO:
+            break
+   if indice >= fin:
+      del pila[1:]
+   return indice
+
+# Función que realiza el análisis sintáctico informando todos los errores.
+def analizador_sintactico_recuperacion(lista_de_tokens, tabla_ll1):
+   """Igual que analizador_sintactico, pero sigue después de cada error sintáctico (modo pánico).
+
+   En un error se llama a sincronizar, que abandona la instrucción o la
+   función donde ocurrió y retoma en la siguiente, así que un solo
+   análisis reúne los errores de todo el archivo con su posición. No se
+   informa un segundo error en el mismo token. Retorna (exito, arbol,
+   errores) como analizador_sintactico; si hubo errores el árbol es None.
+   """
+   if not isinstance(lista_de_tokens, TokenBuffer):
+       buffer = TokenBuffer()
+       for token in lista_de_tokens:
+           buffer.append(token)
+       lista_de_tokens = buffer
+   tipos = lista_de_tokens.tipos
+   matriz = tabla_ll1.matriz
+   errores_sintacticos = []
+   inicial = tabla_ll1.inicial
+   nodo_dolar = Nodo(0, "$", None, None, None, True, CODIGO_FIN)
+   arbol = Nodo(1, nombres_tipos_token[inicial], None, None, None, False, inicial)
+   pila = [nodo_dolar, arbol]
+   contador = 2
+   indice = 0
+   ultimo_error = None
+
+   while pila:
+       cima = pila.pop()
+       if cima.terminal:
+           if indice < len(tipos) and tipos[indice] == cima.codigo:
+               cima.valor = lista_de_tokens.valores[indice]
+               cima.linea, cima.columna = lista_de_tokens.posicion(indice)
+               indice += 1
+               continue
+           encontrado = nombres_tipos_token[tipos[indice]]
+       else:
+           produccion = matriz[cima.codigo][tipos[indice]]
+           if produccion:
+               if produccion == produccion_vacia:
+                   cima.añadir_hijo(Nodo(contador, "e", "e", None, None, True, CODIGO_VACIO))
+                   contador += 1
+               else:
+                   nuevos_hijos = []
+                   for simbolo, es_terminal in produccion:
+                       nuevos_hijos.append(Nodo(contador, nombres_tipos_token[simbolo], None, None, None, es_terminal, simbolo))
+                       contador += 1
+                   pila.extend(reversed(nuevos_hijos))
+                   for hijo in nuevos_hijos:
+                       cima.añadir_hijo(hijo)
+               continue
+           encontrado = "" if produccion is None else "e"
+       if indice != ultimo_error:
+           token_error = lista_de_tokens[indice]
+           errores_sintacticos.append(ErrorSintactico(cima.tipo, encontrado, token_error.linea, token_error.columna))
+           ultimo_error = indice
+       pila.append(cima)
+       indice = sincronizar(pila, tipos, indice, tabla_ll1)
+   exito = not errores_sintacticos and indice == len(tipos)
+   return exito, arbol if exito else None, errores_sintacticos
+
+# Función que realiza el análisis sintáctico construyendo el árbol en una TreeArena.
+def analizador_sintactico_arena(lista_de_tokens, tabla_ll1):
+   """Igual que analizador_sintactico, pero el árbol se guarda en una TreeArena.
+
+   Retorna (exito, raiz, errores) con `raiz` un NodoArena: los nodos tienen
+   los mismos ids, tipos, valores y posiciones que los Nodo del árbol de
+   analizador_sintactico, sin crear un objeto por nodo.
+   """
+   if not isinstance(lista_de_tokens, TokenBuffer):
+       buffer = TokenBuffer()
+       for token in lista_de_tokens:
+           buffer.append(token)
+       lista_de_tokens = buffer
+   tipos = lista_de_tokens.tipos
+   matriz = tabla_ll1.matriz
+   errores_sintacticos = []
+   arena = TreeArena(lista_de_tokens)
+   codigos = arena.codigos
+   terminales = arena.terminales
+   tokens = arena.tokens
+   agregar_hijos = arena.agregar_hijos
+   arena.agregar(CODIGO_FIN, True)
+   arena.agregar(tabla_ll1.inicial, False)
+   pila = [0, 1]
+   indice = 0
+
+   while pila:
+       cima = pila.pop()
+       codigo = codigos[cima]
+       if terminales[cima]:
+           if indice < len(tipos) and tipos[indice] == codigo:
+               tokens[cima] = indice
+               indice += 1
+           else:
+               return False, None, errores_sintacticos
+           continue
+       produccion = matriz[codigo][tipos[indice]]
+       if produccion is None:
+           token_error = lista_de_tokens[indice]
+           errores_sintacticos.append(ErrorSintactico(nombres_tipos_token[codigo], "", token_error.linea, token_error.columna))
+           return False, None, errores_sintacticos
+       if not produccion:
+           token_error = lista_de_tokens[indice]
+           errores_sintacticos.append(ErrorSintactico(nombres_tipos_token[codigo], "e", token_error.linea, token_error.columna))
+           return False, None, errores_sintacticos
+       primero = agregar_hijos(cima, produccion)
+       if produccion != produccion_vacia:
+           pila.extend(range(primero + len(produccion) - 1, primero - 1, -1))
+   exito = indice == len(tipos)
+   return exito, arena.raiz(), errores_sintacticos
+
+# Función que realiza el análisis sintáctico pidiendo los tokens a un iterador.
+def analizador_sintactico_flujo(tokens, tabla_ll1):
+   """Igual que analizador_sintactico, pero toma los tokens de un iterador a medida que los necesita.
+
+   `tokens` es cualquier iterable de objetos con los atributos de Token,
+   por ejemplo lexico.iter_tokens sobre un archivo abierto: el análisis
+   léxico avanza junto con el sintáctico y solo se guarda el token de
+   preanálisis, así que la lista de tokens nunca existe completa y la
+   memoria la ocupa el árbol. Si el último token no es $, se agrega al
+   agotarse el iterador.
+   """
+   iterador = iter(tokens)
+   fin = Token("$", "$", None, None)
+   matriz = tabla_ll1.matriz
+   errores_sintacticos = []
+   pila = []
+   inicial = tabla_ll1.inicial
+   contador = 0
+   nodo_dolar = Nodo(contador, "$", None, None, None, True, CODIGO_FIN)
+   nodo_inicio = Nodo(contador + 1, nombres_tipos_token[inicial], None, None, None, False, inicial)
+   pila.append(nodo_dolar)
+   pila.append(nodo_inicio)
+   arbol = nodo_inicio
+   contador += 2
+   # Token de preanálisis; None cuando ya se consumió el $ agregado al final.
+   actual = next(iterador, fin)
+   codigo_actual = codigo_tipo_token(actual.tipo)
+
+   while pila:
+       cima = pila.pop()
+       if cima.terminal and actual is not None and codigo_actual == cima.codigo:
+           cima.valor = actual.valor
+           cima.linea, cima.columna = actual.linea, actual.columna
+           if actual is fin:
+               actual = codigo_actual = None
+           else:
+               actual = next(iterador, fin)
+               codigo_actual = codigo_tipo_token(actual.tipo)
+       elif cima.terminal:
+           return False, None, errores_sintacticos
+       elif matriz[cima.codigo] is not None:
+           produccion = matriz[cima.codigo][codigo_actual]
+           if produccion is None:
+               errores_sintacticos.append(ErrorSintactico(cima.tipo, "", actual.linea, actual.columna))
+               return False, None, errores_sintacticos
+           if produccion:
+               if produccion == produccion_vacia:
+                   nodo_e = Nodo(contador, "e", "e", None, None, True, CODIGO_VACIO)
+                   cima.añadir_hijo(nodo_e)
+                   contador += 1
+               else:
+                   nuevos_hijos = []
+                   for simbolo, es_terminal in produccion:
+                       nodo_hijo = Nodo(contador, nombres_tipos_token[simbolo], None, None, None, es_terminal, simbolo)
+                       nuevos_hijos.append(nodo_hijo)
+                       contador += 1
+                   for hijo in reversed(nuevos_hijos):
+                       pila.append(hijo)
+                   for hijo in nuevos_hijos:
+                       cima.añadir_hijo(hijo)
+           else:
+               errores_sintacticos.append(ErrorSintactico(cima.tipo, "e", actual.linea, actual.columna))
+               return False, None, errores_sintacticos
+       else:
+           errores_sintacticos.append(ErrorSintactico(cima.tipo, "", actual.linea, actual.columna))
+           return False, None, errores_sintacticos
+   # Éxito si no quedan tokens después del $.
+   exito = actual is None or actual is fin
+   return exito, arbol, errores_sintacticos
+
+# Función que realiza el análisis con el parser descendente recursivo generado a partir de la tabla.
+def analizador_sintactico_generado(lista_de_tokens, tabla_ll1):
+   """Igual que analizador_sintactico, con el módulo que genera generador_parser.
+
+   El módulo se vuelve a generar si cambió la tabla o la gramática. Un
+   anidamiento de bloques que supere el límite de recursión de Python se
+   analiza con analizador_sintactico, que no usa la pila de Python.
+   """
+   if not isinstance(lista_de_tokens, TokenBuffer):
+       buffer = TokenBuffer()
+       for token in lista_de_tokens:
+           buffer.append(token)
+       lista_de_tokens = buffer
+   analizar = cargar_parser_generado(tabla_ll1, ruta_gramatica)
+   try:
+       return analizar(lista_de_tokens, Nodo, ErrorSintactico)
+   except RecursionError:
+       return analizador_sintactico(lista_de_tokens, tabla_ll1)
+
 # ===========================
 # IMPORTACIÓN DEL GENERADOR DE ASSEMBLY
 # ===========================
@@ -852,7 +1184,7 @@ except ImportError:
 # ===========================
 # FUNCIÓN DE INTEGRACIÓN CON ASSEMBLY
 # ===========================
-def ejecutar_generacion_assembly_integrada():
+def ejecutar_generacion_assembly_integrada(respuesta, arbol_abstracto, tabla_simbolos, errores_sintacticos, archivo):
     """Ejecuta la generación de assembly MIPS integrada con el análisis sintáctico"""
     try:
         from assembly_mips import GeneradorAssemblyMIPS, guardar_codigo_assembly_mips
@@ -875,7 +1207,7 @@ def ejecutar_generacion_assembly_integrada():
     
     try:
         generador = GeneradorAssemblyMIPS()
-        codigo_assembly = generador.generar(arbol_sintactico, tabla_simbolos)
+        codigo_assembly = generador.generar(arbol_abstracto, tabla_simbolos)
         
         # Guardar el código generado
         ruta_archivo = guardar_codigo_assembly_mips(codigo_assembly, archivo)
@@ -893,52 +1225,32 @@ def ejecutar_generacion_assembly_integrada():
         print(f"❌ Error durante la generación de assembly MIPS: {str(e)}")
         return False
 
-# Cargamos la tabla LL1.
-tabla_ll1 = cargar_tabla_ll1(ruta_archivo_ll1)
+def resolver_ruta_fuente(archivo):
+   """Retorna la ruta del archivo a compilar: tal cual si existe, o dentro de codigos-bocetos."""
+   if os.path.isfile(archivo):
+       return archivo
+   return os.path.join(directorio, '..', 'codigos-bocetos', archivo)
 
-# Llamada al analizador sintáctico.
-respuesta, arbol_sintactico, errores_sintacticos = analizador_sintactico(lista_de_tokens, tabla_ll1)
+def ejecutar_fases_ast(arbol_abstracto, archivo, nombre_arbol, output_folder):
+   """Ejecuta sobre el AST de un archivo sin errores sintácticos las fases siguientes al análisis sintáctico.
 
-# Definimos nombre del árbol y del atributo que deseamos mostrar en el .dot.
-nombre_arbol = f"arbol-{os.path.splitext(archivo)[0]}"
-atributo_arbol = "tipo"  # Evaluar el atributo del nodo que se quiere ver
-
-# Mostrar el resultado del análisis léxico.
-mostrar_resultado_lexico(lista_errores_lexicos)
-
-# Verificamos el análisis sintáctico.
-if respuesta:
-   output_folder = 'salida-arboles'
-   if not os.path.exists(output_folder):
-       os.makedirs(output_folder)
-   
-   # Generar el árbol sintáctico
-   graph = arbolSintactico(arbol_sintactico, True, atributo_arbol) 
-   dot_contenido = graph.source
-   salida_arbol_directorio = os.path.join(output_folder, nombre_arbol + ".dot")
-   with open(salida_arbol_directorio, 'w') as f:
-       f.write(dot_contenido)
-   with open(salida_arbol_directorio, 'r+') as file:
-       content = file.read()
-       if content.endswith(('\n', '\r')):
-           content = content.rstrip('\n\r')
-           file.seek(0)
-           file.write(content)
-           file.truncate()
-   
-   # Construir la tabla de símbolos recorriendo el árbol sintáctico
+   Construye la tabla de símbolos (y su CSV y diagrama en `output_folder`),
+   verifica las variables y los tipos y, si no hay errores, genera el
+   assembly MIPS.
+   """
+   # Construir la tabla de símbolos recorriendo el AST
    tabla_simbolos = TablaSimbolos()
-   construir_tabla_simbolos(arbol_sintactico, tabla_simbolos)
-   
+   construir_tabla_simbolos(arbol_abstracto, tabla_simbolos)
+
    # Generar la tabla de símbolos en formato CSV
    generar_tabla_simbolos_csv(tabla_simbolos, nombre_arbol, output_folder)
-   
+
    # CREAR COPIA ANTES de verificar_variable para que no se pierdan los ámbitos
    tabla_simbolos_para_tipos = crear_copia_tabla_simbolos(tabla_simbolos)
-   
+
    # Verificar que las variables estén declaradas (esto modifica la tabla original)
-   verificar_variable(arbol_sintactico, tabla_simbolos)
-   
+   verificar_variable(arbol_abstracto, tabla_simbolos)
+
    # NUEVA SECCIÓN: Verificación de tipos
    if errores_semanticos:
        print("\n🚨 Errores semánticos encontrados:")
@@ -947,18 +1259,19 @@ if respuesta:
        print("\n❌ Saltando verificación de tipos debido a errores semánticos previos")
    else:
        print("\n✅ Verificación semántica exitosa: todas las variables están declaradas.")
-       
+
        # Ejecutar verificación de tipos con la copia intacta
-       tipos_correctos = ejecutar_verificacion_tipos(arbol_sintactico, tabla_simbolos_para_tipos)
-       
+       tipos_correctos = ejecutar_verificacion_tipos(arbol_abstracto, tabla_simbolos_para_tipos)
+
        if not tipos_correctos:
            print("\n❌ Compilación fallida por errores de tipos")
        else:
            print("\n✅ Verificación de tipos exitosa: todos los tipos son compatibles.")
-           
+
            # NUEVA FASE: Generación de Assembly
-           assembly_exitoso = ejecutar_generacion_assembly_integrada()
-           
+           assembly_exitoso = ejecutar_generacion_assembly_integrada(
+                True, arbol_abstracto, tabla_simbolos, [], archivo)
+
            if assembly_exitoso:
                print("\n🎉 COMPILACIÓN COMPLETA EXITOSA:")
                print("   ✅ Análisis Léxico")
@@ -976,13 +1289,200 @@ if respuesta:
        grafo_tabla_simbolos.render(ruta_tabla_simbolos, format='png', cleanup=True)
    except Exception as e:
        print(f"Error al generar el diagrama de la tabla de símbolos: {str(e)}")
+
+def compilar(archivo, usar_mmap=False, usar_cache=True, formato_tokens='jsonl', mostrar_tabla_tokens=False,
+             usar_parser_generado=True, usar_arena=False, parser_incremental=None, usar_paralelo=False,
+             usar_arbol_guardado=False):
+   """Ejecuta todas las fases del compilador sobre un archivo de codigos-bocetos.
+
+   Con `usar_mmap` el análisis léxico recorre el archivo proyectado en
+   memoria como bytes en lugar de leerlo y decodificarlo completo: retiene
+   menos memoria, pero no es más rápido. Con
+   `usar_cache` los tokens se toman de la caché de salida-tokens/.cache
+   cuando el archivo no cambió desde la última compilación. Los tokens se
+   guardan en salida-tokens con `formato_tokens` ('jsonl', 'binario' o
+   'tabla') y la tabla de tokens solo se imprime con `mostrar_tabla_tokens`.
+   Con `usar_parser_generado` el análisis sintáctico usa el parser
+   descendente recursivo generado a partir de la tabla LL(1); si no, la
+   tabla se interpreta con una pila. Ambos producen el mismo árbol. Con
+   `usar_arena` el árbol se construye en una TreeArena. Con un
+   `parser_incremental` (ParserIncremental) que se reutiliza entre
+   compilaciones, solo se analizan las funciones que cambiaron desde la
+   anterior. Con `usar_paralelo` las funciones de un archivo grande se
+   analizan en varios procesos y el árbol queda en una TreeArena. El árbol
+   sintáctico y el AST se guardan en salida-arboles en el formato binario
+   de volcado_arbol; con `usar_arbol_guardado`, si el AST guardado
+   corresponde al archivo (huella_arboles), se carga y se pasa directo a
+   las fases siguientes sin analizar el archivo. Si el análisis falla, analizador_sintactico_recuperacion reúne todos los errores
+   sintácticos del archivo y no se ejecuta ninguna fase más. Las fases
+   siguientes (tabla de símbolos, verificaciones y assembly) recorren el
+   AST que bajar_arbol construye a partir del árbol sintáctico.
+   """
+   ruta_fuente = resolver_ruta_fuente(archivo)
+   if not os.path.exists(ruta_fuente):
+       print(f"El archivo {archivo} no existe en la carpeta codigos-bocetos")
+       return False
+   archivo = os.path.basename(ruta_fuente)
+   nombre_arbol = f"arbol-{os.path.splitext(archivo)[0]}"
+   output_folder = 'salida-arboles'
+   huella = huella_arboles(ruta_fuente)
+
+   # Con un AST guardado del mismo archivo se pasa directo a las fases siguientes.
+   if usar_arbol_guardado:
+       ruta_ast = os.path.join(output_folder, nombre_arbol + EXTENSION_AST)
+       try:
+           arbol_abstracto = cargar_arbol(ruta_ast, huella=huella)
+       except (OSError, ValueError):
+           arbol_abstracto = None
+       if arbol_abstracto is not None:
+           print(f"🌳 AST cargado de {ruta_ast}: sin análisis léxico ni sintáctico")
+           errores_semanticos.clear()
+           ejecutar_fases_ast(arbol_abstracto, archivo, nombre_arbol, output_folder)
+           print("\nAnálisis desde el AST guardado exitoso ✅✅\n")
+           return True
+       print(f"🌳 No hay un AST guardado de {archivo} al día: se analiza el archivo")
+
+   # Análisis léxico con un analizador propio de esta compilación.
+   lexer = Lexer()
+   if usar_mmap:
+       lista_de_tokens = lexer.lex_mmap(ruta_fuente)
+   else:
+       lista_de_tokens = lexer.lex_archivo(ruta_fuente, CacheTokens() if usar_cache else None)
+   lista_errores_lexicos = lexer.errores
+
+   # Agregar el $ a la lista de tokens.
+   lista_de_tokens.append(Token("$", "$", None, None))
+   errores_semanticos.clear()
+
+   # Cargamos la tabla LL1.
+   tabla_ll1 = cargar_tabla_ll1(ruta_archivo_ll1)
+
+   # Llamada al analizador sintáctico.
+   if parser_incremental is not None:
+       respuesta, arbol_sintactico, errores_sintacticos = parser_incremental.analizar(lista_de_tokens)
+       print(f"🔁 Funciones reanalizadas: {parser_incremental.reanalizadas}, "
+             f"reutilizadas: {parser_incremental.reutilizadas}")
+   elif usar_paralelo:
+       # sintactico_paralelo usa este módulo: se importa al usarlo.
+       from sintactico_paralelo import analizador_sintactico_paralelo
+       respuesta, arbol_sintactico, errores_sintacticos = analizador_sintactico_paralelo(lista_de_tokens, tabla_ll1)
+   elif usar_arena:
+       respuesta, arbol_sintactico, errores_sintacticos = analizador_sintactico_arena(lista_de_tokens, tabla_ll1)
+   elif usar_parser_generado:
+       respuesta, arbol_sintactico, errores_sintacticos = analizador_sintactico_generado(lista_de_tokens, tabla_ll1)
+   else:
+       respuesta, arbol_sintactico, errores_sintacticos = analizador_sintactico(lista_de_tokens, tabla_ll1)
+
+   # Los analizadores se detienen en el primer error: si falló, se analiza de
+   # nuevo en modo pánico para informar todos los errores sintácticos.
+   if not respuesta:
+       _, _, errores_sintacticos = analizador_sintactico_recuperacion(lista_de_tokens, tabla_ll1)
+
+   # Definimos el atributo que deseamos mostrar en el .dot.
+   atributo_arbol = "tipo"  # Evaluar el atributo del nodo que se quiere ver
+
+   # Mostrar el resultado del análisis léxico.
+   mostrar_resultado_lexico(lista_errores_lexicos, lista_de_tokens, archivo, formato_tokens, mostrar_tabla_tokens)
+
+   # Verificamos el análisis sintáctico.
+   if respuesta:
+      if not os.path.exists(output_folder):
+          os.makedirs(output_folder)
+   
+      # Generar el árbol sintáctico
+      graph = arbolSintactico(arbol_sintactico, True, atributo_arbol) 
+      dot_contenido = graph.source
+      salida_arbol_directorio = os.path.join(output_folder, nombre_arbol + ".dot")
+      with open(salida_arbol_directorio, 'w') as f:
+          f.write(dot_contenido)
+      with open(salida_arbol_directorio, 'r+') as file:
+          content = file.read()
+          if content.endswith(('\n', '\r')):
+              content = content.rstrip('\n\r')
+              file.seek(0)
+              file.write(content)
+              file.truncate()
+   
+      # Bajar el árbol sintáctico al AST que recorren las fases siguientes; un
+      # fallo se informa como error del compilador y no detiene el proceso.
+      try:
+          arbol_abstracto = bajar_arbol(arbol_sintactico)
+      except Exception as e:
+          print(f"\n❌ Error al construir el AST: {type(e).__name__}: {e}\n")
+          return False
+
+      # Guardar ambos árboles para cargarlos sin volver a analizar el archivo
+      volcar_arbol(arbol_sintactico, os.path.join(output_folder, nombre_arbol + EXTENSION_ARBOL), huella)
+      volcar_arbol(arbol_abstracto, os.path.join(output_folder, nombre_arbol + EXTENSION_AST), huella)
+   
+      ejecutar_fases_ast(arbol_abstracto, archivo, nombre_arbol, output_folder)
    
-   print("\nAnálisis sintáctico exitoso ✅✅\n")
-   print(f"Generador del árbol sintáctico: {nombre_arbol}.dot creado en: {salida_arbol_directorio}\n")
-   print(f"Árbol de ámbitos generado: {nombre_arbol}-symbol-table.png en: {output_folder}\n")
-else:
-   print("\n❌❌❌ Análisis sintáctico fallido ❌❌❌\n")
-   print("Error sintáctico reconocido:")
-   for error in errores_sintacticos:
-       print(error)
-   print()
\ No newline at end of file
+      print("\nAnálisis sintáctico exitoso ✅✅\n")
+      print(f"Generador del árbol sintáctico: {nombre_arbol}.dot creado en: {salida_arbol_directorio}\n")
+      print(f"Árbol de ámbitos generado: {nombre_arbol}-symbol-table.png en: {output_folder}\n")
+      print(f"Árboles binarios: {nombre_arbol}{EXTENSION_ARBOL} y {nombre_arbol}{EXTENSION_AST} en: {output_folder}\n")
+   else:
+      print("\n❌❌❌ Análisis sintáctico fallido ❌❌❌\n")
+      if len(errores_sintacticos) > 1:
+          print(f"Errores sintácticos reconocidos ({len(errores_sintacticos)}):")
+      else:
+          print("Error sintáctico reconocido:")
+      for error in errores_sintacticos:
+          print(error)
+      print()
+   return respuesta
+
+def main():
+   parser = argparse.ArgumentParser(description="Compila un archivo de codigos-bocetos")
+   parser.add_argument('archivo', nargs='?', default=archivo_por_defecto,
+                       help='Archivo a compilar (nombre dentro de codigos-bocetos o ruta)')
+   parser.add_argument('--mmap', action='store_true',
+                       help='Analizar el archivo proyectado en memoria, sin decodificarlo completo (menos memoria, no más rápido)')
+   parser.add_argument('--sin-cache', action='store_true',
+                       help='Analizar el archivo aunque sus tokens estén en la caché')
+   parser.add_argument('--formato-tokens', choices=['jsonl', 'binario', 'tabla'], default='jsonl',
+                       help='Formato del archivo de tokens en salida-tokens')
+   parser.add_argument('--tabla-tokens', action='store_true',
+                       help='Imprimir la tabla de tokens en la salida')
+   parser.add_argument('--parser-tabla', action='store_true',
+                       help='Interpretar la tabla LL(1) con una pila en lugar de usar el parser generado')
+   parser.add_argument('--arbol-arena', action='store_true',
+                       help='Guardar el árbol sintáctico en arreglos (TreeArena) en lugar de objetos Nodo')
+   parser.add_argument('--vigilar', action='store_true',
+                       help='Recompilar cada vez que cambia el archivo, reanalizando solo las funciones modificadas')
+   parser.add_argument('--paralelo', action='store_true',
+                       help='Analizar las funciones de un archivo grande en varios procesos')
+   parser.add_argument('--arbol-guardado', action='store_true',
+                       help='Cargar el AST guardado en salida-arboles si el archivo no cambió, sin volver a analizarlo')
+   args, _ = parser.parse_known_args()
+   ruta_fuente = resolver_ruta_fuente(args.archivo)
+   if not os.path.exists(ruta_fuente):
+       print(f"El archivo {args.archivo} no existe en la carpeta codigos-bocetos")
+       sys.exit(1)
+   parser_incremental = None
+   if args.vigilar:
+       parser_incremental = ParserIncremental(cargar_tabla_ll1(ruta_archivo_ll1), analizador_sintactico_generado, Nodo)
+   compilar(args.archivo, args.mmap, not args.sin_cache, args.formato_tokens, args.tabla_tokens,
+            not args.parser_tabla, args.arbol_arena, parser_incremental, args.paralelo,
+            args.arbol_guardado)
+   if not args.vigilar:
+       return
+   print(f"\n👀 Vigilando {ruta_fuente} (Ctrl+C para terminar)")
+   modificado = os.path.getmtime(ruta_fuente)
+   try:
+       while True:
+           time.sleep(0.5)
+           try:
+               actual = os.path.getmtime(ruta_fuente)
+           except OSError:
+               continue
+           if actual != modificado:
+               modificado = actual
+               compilar(args.archivo, args.mmap, not args.sin_cache, args.formato_tokens, args.tabla_tokens,
+                        not args.parser_tabla, args.arbol_arena, parser_incremental, args.paralelo,
+                        args.arbol_guardado)
+   except KeyboardInterrupt:
+       print("\n👋 Fin de la vigilancia")
+
+if __name__ == "__main__":
+   main()
@@ -0,0 +1,128 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from lexico import CODIGO_FIN
+from lexico import SIN_POSICION
+from lexico import TokenBuffer
+from arbol_arena import SIN_NODO
+from arbol_arena import TreeArena
+from parser_incremental import dividir_funciones
+from sintactico import analizador_sintactico_arena
+
+# Por debajo de este número de tokens por proceso no compensa repartir el análisis.
+TOKENS_MINIMOS_FRAGMENTO = 20000
+
+def agrupar_funciones(tramos, partes):
+    """Reparte los tramos de las funciones en `partes` grupos contiguos con un número parecido de tokens.
+
+    Retorna los límites [inicio, fin) de cada grupo en la lista de tokens.
+    """
+    total = tramos[-1][1]
+    grupos = []
+    inicio = 0
+    for _, fin in tramos:
+        if fin - inicio >= (total - inicio) / (partes - len(grupos)):
+            grupos.append((inicio, fin))
+            inicio = fin
+    if inicio < total:
+        grupos.append((inicio, total))
+    return grupos
+
+def _analizar_fragmento(tipos, tabla_ll1):
+    """Analiza en un proceso trabajador los tokens de un grupo de funciones, como un programa completo.
+
+    Solo se envían los tipos: el árbol guarda índices de token, así que los
+    valores y las posiciones se leen después en el proceso principal.
+    Retorna los arreglos de la TreeArena como bytes, o None si el grupo
+    tiene errores.
+    """
+    tokens = TokenBuffer()
+    tokens.tipos = array('B', tipos)
+    tokens.tipos.append(CODIGO_FIN)
+    tokens.inicios = array('I', [SIN_POSICION]) * len(tokens.tipos)
+    tokens.valores = [None] * len(tokens.tipos)
+    exito, raiz, _ = analizador_sintactico_arena(tokens, tabla_ll1)
+    if not exito:
+        return None
+    arena = raiz.arena
+    return (arena.codigos.tobytes(), arena.terminales.tobytes(), arena.tokens.tobytes(),
+            arena.padres.tobytes(), arena.primeros_hijos.tobytes(), arena.siguientes_hermanos.tobytes())
+
+def _desplazar(datos, desde, desplazamiento):
+    """Arreglo de ids (o índices de token) de `datos` a partir de `desde`, sumando `desplazamiento` a los que no son SIN_NODO."""
+    arreglo = array('i')
+    arreglo.frombytes(datos)
+    return array('i', [valor if valor == SIN_NODO else valor + desplazamiento for valor in arreglo[desde:]])
+
+def unir_fragmentos(lista_de_tokens, grupos, resultados):
+    """Une las TreeArena de los grupos en la del programa completo.
+
+    Un grupo analizado aparte tiene los mismos ids que en el programa
+    completo, corridos: su programaprincipal (id 1) ocupa el lugar del nodo
+    'e' con que termina la cadena masfuncn del grupo anterior, así que se
+    descarta ese nodo y el $ (id 0) del grupo, y el programaprincipal queda
+    como hijo del último masfuncn. `grupos` son los límites de los tokens
+    de cada grupo y `resultados` los arreglos de _analizar_fragmento.
+    """
+    arena = TreeArena(lista_de_tokens)
+    for (inicio, _), (codigos, terminales, tokens, padres, primeros_hijos, siguientes_hermanos) in zip(grupos, resultados):
+        if len(arena):
+            masfuncn = arena.padres[-1]
+            for arreglo in (arena.codigos, arena.terminales, arena.tokens, arena.padres,
+                            arena.primeros_hijos, arena.siguientes_hermanos):
+                del arreglo[-1]
+            desde = 1
+        else:
+            masfuncn = SIN_NODO
+            desde = 0
+        desplazamiento = len(arena) - desde
+        primero = len(arena)
+        arena.codigos.frombytes(codigos[desde:])
+        arena.terminales.frombytes(terminales[desde:])
+        arena.tokens.extend(_desplazar(tokens, desde, inicio))
+        arena.padres.extend(_desplazar(padres, desde, desplazamiento))
+        arena.primeros_hijos.extend(_desplazar(primeros_hijos, desde, desplazamiento))
+        arena.siguientes_hermanos.extend(_desplazar(siguientes_hermanos, desde, desplazamiento))
+        if masfuncn != SIN_NODO:
+            arena.padres[primero] = masfuncn
+    # El $ del primer grupo es el que consume el $ del programa completo.
+    arena.tokens[0] = len(lista_de_tokens) - 1
+    return arena
+
+def analizador_sintactico_paralelo(lista_de_tokens, tabla_ll1, procesos=None, ejecutor=None):
+    """Análisis sintáctico de un programa grande repartido entre varios procesos.
+
+    Divide los tokens en grupos de funciones de nivel superior
+    (dividir_funciones, agrupar_funciones) y analiza cada grupo en un
+    ProcessPoolExecutor (el indicado en `ejecutor` o uno nuevo con
+    `procesos` trabajadores) con analizador_sintactico_arena; luego une sus
+    árboles con unir_fragmentos. Retorna (exito, raiz, errores) con el mismo
+    árbol que analizador_sintactico_arena sobre todos los tokens. Si algún
+    grupo tiene errores, o el programa es pequeño, se analiza completo en
+    este proceso, con los mismos errores.
+    """
+    if not isinstance(lista_de_tokens, TokenBuffer):
+        buffer = TokenBuffer()
+        for token in lista_de_tokens:
+            buffer.append(token)
+        lista_de_tokens = buffer
+    if procesos is None:
+        procesos = getattr(ejecutor, '_max_workers', None) or os.cpu_count() or 1
+    partes = min(procesos, max(1, len(lista_de_tokens) // TOKENS_MINIMOS_FRAGMENTO))
+    tramos = dividir_funciones(lista_de_tokens.tipos) if partes > 1 else None
+    grupos = agrupar_funciones(tramos, partes) if tramos else []
+    if len(grupos) < 2:
+        return analizador_sintactico_arena(lista_de_tokens, tabla_ll1)
+
+    tipos = lista_de_tokens.tipos.tobytes()
+    fragmentos = [tipos[inicio:fin] for inicio, fin in grupos]
+    tablas = [tabla_ll1] * len(fragmentos)
+    if ejecutor is None:
+        with ProcessPoolExecutor(max_workers=min(procesos, len(fragmentos))) as propio:
+            resultados = list(propio.map(_analizar_fragmento, fragmentos, tablas))
+    else:
+        resultados = list(ejecutor.map(_analizar_fragmento, fragmentos, tablas))
+    if any(resultado is None for resultado in resultados):
+        return analizador_sintactico_arena(lista_de_tokens, tabla_ll1)
+    return True, unir_fragmentos(lista_de_tokens, grupos, resultados).raiz(), []
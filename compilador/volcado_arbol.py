@@ -0,0 +1,308 @@
+import sys
+import struct
+from array import array
+
+from arbol_abstracto import NodoAST
+
+# Formato binario de árboles: cabecera MAGIA_ARBOL, versión y clase de árbol,
+# y luego secciones con su longitud (ver arbol_a_bytes). Los arreglos se
+# guardan en little-endian. Cambiar el formato requiere subir VERSION_ARBOL.
+MAGIA_ARBOL = b'ARBL'
+VERSION_ARBOL = 1
+ARBOL_SINTACTICO, ARBOL_ABSTRACTO = range(2)
+VALOR_NULO, VALOR_CADENA, VALOR_ENTERO, VALOR_FLOTANTE, VALOR_BOOLEANO = range(5)
+_cabecera = struct.Struct('<4sBB')
+_longitud = struct.Struct('<I')
+_flotante = struct.Struct('<d')
+
+# En los campos de hijos de un nodo AST, un número >= 0 es la longitud de una lista.
+CAMPO_NODO = -1
+CAMPO_NULO = -2
+
+def _clases_ast():
+    """Clases de nodo del AST por nombre."""
+    clases = {}
+    pendientes = [NodoAST]
+    while pendientes:
+        clase = pendientes.pop()
+        clases[clase.__name__] = clase
+        pendientes.extend(clase.__subclasses__())
+    return clases
+
+clases_ast = _clases_ast()
+
+# Atributos que no son hijos de cada clase del AST, en el orden de __slots__.
+escalares_ast = {nombre: tuple(atributo for atributo in clase.__slots__ if atributo not in clase.campos_hijos)
+                 for nombre, clase in clases_ast.items()}
+
+# Para cargar cada clase: la clase, qué argumentos del constructor (los de
+# __slots__, en su orden) son hijos y cuántos escalares y campos de hijos tiene.
+planes_ast = {nombre: (clase, tuple(atributo in clase.campos_hijos for atributo in clase.__slots__),
+                       len(escalares_ast[nombre]), len(clase.campos_hijos))
+              for nombre, clase in clases_ast.items()}
+
+def _a_bytes(arreglo):
+    if sys.byteorder == 'big':
+        arreglo = array(arreglo.typecode, arreglo)
+        arreglo.byteswap()
+    return arreglo.tobytes()
+
+def _desde_bytes(typecode, datos):
+    arreglo = array(typecode)
+    arreglo.frombytes(datos)
+    if sys.byteorder == 'big':
+        arreglo.byteswap()
+    return arreglo
+
+class TablaValores:
+    """Tabla de los valores distintos de un árbol; cada nodo guarda el índice de su valor.
+
+    Los valores pueden ser cadenas, enteros, flotantes, booleanos o None, y
+    se distinguen por tipo (1, 1.0 y True son entradas distintas).
+    """
+
+    def __init__(self):
+        self.valores = []
+        self.indices = {}
+
+    def indice(self, valor):
+        clave = (type(valor), valor)
+        indice = self.indices.get(clave)
+        if indice is None:
+            indice = self.indices[clave] = len(self.valores)
+            self.valores.append(valor)
+        return indice
+
+    def secciones(self):
+        """Etiquetas, longitudes y contenido concatenado de los valores."""
+        etiquetas = array('B')
+        longitudes = array('I')
+        partes = []
+        for valor in self.valores:
+            if valor is None:
+                etiqueta, contenido = VALOR_NULO, b''
+            elif type(valor) is bool:
+                etiqueta, contenido = VALOR_BOOLEANO, b'\x01' if valor else b'\x00'
+            elif isinstance(valor, int):
+                etiqueta, contenido = VALOR_ENTERO, str(valor).encode('ascii')
+            elif isinstance(valor, float):
+                etiqueta, contenido = VALOR_FLOTANTE, _flotante.pack(valor)
+            else:
+                etiqueta, contenido = VALOR_CADENA, str(valor).encode('utf-8')
+            etiquetas.append(etiqueta)
+            longitudes.append(len(contenido))
+            partes.append(contenido)
+        return [etiquetas.tobytes(), _a_bytes(longitudes), b''.join(partes)]
+
+def _leer_valores(etiquetas, longitudes, contenido):
+    """Lista de valores de las secciones escritas por TablaValores.secciones."""
+    valores = []
+    posicion = 0
+    for etiqueta, longitud in zip(etiquetas, _desde_bytes('I', longitudes)):
+        datos = contenido[posicion:posicion + longitud]
+        posicion += longitud
+        if etiqueta == VALOR_CADENA:
+            valores.append(str(datos, 'utf-8'))
+        elif etiqueta == VALOR_ENTERO:
+            valores.append(int(datos))
+        elif etiqueta == VALOR_FLOTANTE:
+            valores.append(_flotante.unpack(datos)[0])
+        elif etiqueta == VALOR_BOOLEANO:
+            valores.append(datos == b'\x01')
+        else:
+            valores.append(None)
+    return valores
+
+class TablaTipos:
+    """Nombres de los tipos de nodo de un árbol; cada nodo guarda el índice del suyo.
+
+    Se guardan los nombres y no los códigos de lexico, que dependen del
+    orden en que se registran los tipos.
+    """
+
+    def __init__(self):
+        self.nombres = []
+        self.indices = {}
+
+    def indice(self, nombre):
+        indice = self.indices.get(nombre)
+        if indice is None:
+            indice = self.indices[nombre] = len(self.nombres)
+            self.nombres.append(nombre)
+        return indice
+
+    def seccion(self):
+        return '\n'.join(self.nombres).encode('utf-8')
+
+def arbol_a_bytes(arbol, huella=b''):
+    """Serializa un árbol sintáctico (Nodo o NodoArena) o un AST (Program) en el formato binario.
+
+    Los nodos se guardan en anchura: así los hijos de cada nodo son
+    consecutivos y basta un arreglo de desplazamientos, `primeros_hijos`,
+    con n + 1 entradas (los hijos del nodo i son los nodos
+    primeros_hijos[i]..primeros_hijos[i + 1] - 1). El tipo y el valor de
+    cada nodo son índices en la tabla de tipos y en la de valores.
+    `huella` identifica el código fuente del árbol (por ejemplo, su
+    sha256) y cargar_arbol la compara si se le pide.
+
+    Secciones de un árbol sintáctico: huella, tipos, etiquetas, longitudes
+    y contenido de los valores, y los arreglos tipos, terminales, ids,
+    valores, lineas, columnas y primeros_hijos. Las de un AST tienen, en
+    lugar de los arreglos de Nodo, tipos, escalares (índices de los
+    valores de los atributos que no son hijos, en el orden de __slots__),
+    campos (longitud de cada lista de hijos, CAMPO_NODO o CAMPO_NULO) y
+    primeros_hijos.
+    """
+    tipos = TablaTipos()
+    valores = TablaValores()
+    primeros_hijos = array('I', [1])
+    orden = [arbol]
+    if isinstance(arbol, NodoAST):
+        clase = ARBOL_ABSTRACTO
+        tipos_nodos = array('H')
+        escalares = array('i')
+        campos = array('i')
+        for nodo in orden:
+            nombre = type(nodo).__name__
+            tipos_nodos.append(tipos.indice(nombre))
+            for atributo in escalares_ast[nombre]:
+                escalares.append(valores.indice(getattr(nodo, atributo)))
+            for atributo in nodo.campos_hijos:
+                valor = getattr(nodo, atributo)
+                if isinstance(valor, list):
+                    campos.append(len(valor))
+                    orden.extend(valor)
+                elif valor is None:
+                    campos.append(CAMPO_NULO)
+                else:
+                    campos.append(CAMPO_NODO)
+                    orden.append(valor)
+            primeros_hijos.append(len(orden))
+        arreglos = [tipos_nodos, escalares, campos, primeros_hijos]
+    else:
+        clase = ARBOL_SINTACTICO
+        tipos_nodos = array('H')
+        terminales = array('B')
+        ids = array('i')
+        valores_nodos = array('i')
+        lineas = array('i')
+        columnas = array('i')
+        for nodo in orden:
+            tipos_nodos.append(tipos.indice(nodo.tipo))
+            terminales.append(1 if nodo.terminal else 0)
+            ids.append(nodo.id)
+            valores_nodos.append(valores.indice(nodo.valor))
+            linea = nodo.linea
+            lineas.append(-1 if linea is None else linea)
+            columna = nodo.columna
+            columnas.append(-1 if columna is None else columna)
+            orden.extend(nodo.hijos)
+            primeros_hijos.append(len(orden))
+        arreglos = [tipos_nodos, terminales, ids, valores_nodos, lineas, columnas, primeros_hijos]
+
+    secciones = [huella, tipos.seccion()] + valores.secciones() + [_a_bytes(arreglo) for arreglo in arreglos]
+    partes = [_cabecera.pack(MAGIA_ARBOL, VERSION_ARBOL, clase)]
+    for seccion in secciones:
+        partes.append(_longitud.pack(len(seccion)))
+        partes.append(seccion)
+    return b''.join(partes)
+
+def _leer_secciones(datos):
+    """Retorna (clase, secciones) de los bytes de un árbol; ValueError si no es un árbol de esta versión."""
+    if len(datos) < _cabecera.size:
+        raise ValueError("El archivo no es un árbol binario")
+    magia, version, clase = _cabecera.unpack_from(datos)
+    if magia != MAGIA_ARBOL:
+        raise ValueError("El archivo no es un árbol binario")
+    if version != VERSION_ARBOL:
+        raise ValueError(f"Versión de árbol no soportada: {version}")
+    vista = memoryview(datos)
+    secciones = []
+    posicion = _cabecera.size
+    while posicion < len(datos):
+        longitud, = _longitud.unpack_from(datos, posicion)
+        posicion += _longitud.size
+        secciones.append(vista[posicion:posicion + longitud])
+        posicion += longitud
+    return clase, secciones
+
+def arbol_desde_bytes(datos, Nodo=None, huella=None):
+    """Reconstruye el árbol serializado por arbol_a_bytes.
+
+    Un árbol sintáctico se arma con objetos `Nodo` (sintactico.Nodo, que se
+    recibe como parámetro porque sintactico usa este módulo), con los mismos
+    ids, tipos, valores, posiciones, hijos y padres; un AST, con las clases
+    de arbol_abstracto. Si se indica `huella` y no es la guardada, retorna
+    None, como una entrada de caché que no corresponde al código fuente.
+    """
+    clase, secciones = _leer_secciones(datos)
+    huella_guardada, nombres, etiquetas, longitudes, contenido = secciones[:5]
+    if huella is not None and bytes(huella_guardada) != huella:
+        return None
+    nombres = str(nombres, 'utf-8').split('\n')
+    valores = _leer_valores(etiquetas, longitudes, bytes(contenido))
+
+    if clase == ARBOL_ABSTRACTO:
+        tipos_nodos, escalares, campos, primeros_hijos = (
+            _desde_bytes(typecode, seccion) for typecode, seccion in zip('HiiI', secciones[5:]))
+        planes = [planes_ast[nombre] for nombre in nombres]
+        # Los hijos de un nodo están después de él: armando los nodos del último
+        # al primero, cada uno se crea con su constructor y sus hijos ya armados.
+        nodos = [None] * len(tipos_nodos)
+        escalar = len(escalares)
+        campo = len(campos)
+        for i in range(len(nodos) - 1, -1, -1):
+            clase_nodo, son_hijos, cantidad_escalares, cantidad_campos = planes[tipos_nodos[i]]
+            escalar -= cantidad_escalares
+            campo -= cantidad_campos
+            e = escalar
+            c = campo
+            hijo = primeros_hijos[i]
+            argumentos = []
+            for es_hijo in son_hijos:
+                if not es_hijo:
+                    argumentos.append(valores[escalares[e]])
+                    e += 1
+                    continue
+                cantidad = campos[c]
+                c += 1
+                if cantidad == CAMPO_NULO:
+                    argumentos.append(None)
+                elif cantidad == CAMPO_NODO:
+                    argumentos.append(nodos[hijo])
+                    hijo += 1
+                else:
+                    argumentos.append(nodos[hijo:hijo + cantidad])
+                    hijo += cantidad
+            nodos[i] = clase_nodo(*argumentos)
+        return nodos[0]
+
+    if Nodo is None:
+        raise ValueError("Se necesita la clase Nodo para cargar un árbol sintáctico")
+    tipos_nodos, terminales, ids, valores_nodos, lineas, columnas, primeros_hijos = (
+        _desde_bytes(typecode, seccion) for typecode, seccion in zip('HBiiiiI', secciones[5:]))
+    # El código de cada tipo se calcula una vez por tipo y no una por nodo.
+    codigos = [Nodo(0, nombre).codigo for nombre in nombres]
+    nodos = [Nodo(id, nombres[tipo], valores[valor], None if linea == -1 else linea,
+                  None if columna == -1 else columna, terminal == 1, codigos[tipo])
+             for tipo, terminal, id, valor, linea, columna
+             in zip(tipos_nodos, terminales, ids, valores_nodos, lineas, columnas)]
+    for i, nodo in enumerate(nodos):
+        inicio = primeros_hijos[i]
+        fin = primeros_hijos[i + 1]
+        if inicio != fin:
+            hijos = nodos[inicio:fin]
+            nodo.hijos = hijos
+            for hijo in hijos:
+                hijo.padre = nodo
+    return nodos[0]
+
+def volcar_arbol(arbol, ruta, huella=b''):
+    """Guarda un árbol sintáctico o un AST en el archivo `ruta` (ver arbol_a_bytes)."""
+    with open(ruta, 'wb') as f:
+        f.write(arbol_a_bytes(arbol, huella))
+
+def cargar_arbol(ruta, Nodo=None, huella=None):
+    """Carga el árbol guardado por volcar_arbol en `ruta` (ver arbol_desde_bytes)."""
+    with open(ruta, 'rb') as f:
+        return arbol_desde_bytes(f.read(), Nodo, huella)
@@ -12,38 +12,14 @@ import subprocess
 import time
 from pathlib import Path
 
-def modificar_archivo_objetivo(nombre_archivo):
-    """Modifica el archivo objetivo en lexico.py"""
-    lexico_path = Path('compilador/lexico.py')
-    
-    if not lexico_path.exists():
-        return False
-    
-    # Leer archivo
-    with open(lexico_path, 'r', encoding='utf-8') as f:
-        contenido = f.read()
-    
-    # Buscar y reemplazar la línea del archivo
-    lineas = contenido.split('\n')
-    for i, linea in enumerate(lineas):
-        if linea.strip().startswith("archivo = "):
-            lineas[i] = f"archivo = '{nombre_archivo}'"
-            break
-    
-    # Escribir archivo modificado
-    with open(lexico_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(lineas))
-    
-    return True
-
 def compilar_archivo(nombre_archivo=None, mostrar_salida=True):
     """Compila un archivo específico"""
     
+    # El archivo se pasa como argumento: sintactico.py ya no se configura editando lexico.py
+    comando = [sys.executable, 'compilador/sintactico.py']
     if nombre_archivo:
         print(f"[INFO] Compilando archivo: {nombre_archivo}")
-        if not modificar_archivo_objetivo(nombre_archivo):
-            print("[ERROR] No se pudo modificar el archivo objetivo")
-            return False
+        comando.append(nombre_archivo)
     
     try:
         # Ejecutar sintactico.py directamente
@@ -51,15 +27,11 @@ def compilar_archivo(nombre_archivo=None, mostrar_salida=True):
         
         if mostrar_salida:
             # Mostrar salida en tiempo real
-            proceso = subprocess.run([
-                sys.executable, 'compilador/sintactico.py'
-            ], cwd='.')
+            proceso = subprocess.run(comando, cwd='.')
             resultado = proceso.returncode == 0
         else:
             # Capturar salida
-            proceso = subprocess.run([
-                sys.executable, 'compilador/sintactico.py'
-            ], capture_output=True, text=True, cwd='.')
+            proceso = subprocess.run(comando, capture_output=True, text=True, cwd='.')
             resultado = proceso.returncode == 0
             
             # Analizar resultado
@@ -323,12 +323,9 @@ fn main() int {
     def probar_compilacion(self, archivo):
         """Prueba la compilación de un archivo específico"""
         try:
-            # Modificar archivo objetivo en lexico.py
-            self.modificar_archivo_objetivo(archivo)
-            
             # Ejecutar compilador
             resultado = subprocess.run([
-                sys.executable, 'compilador/sintactico.py'
+                sys.executable, 'compilador/sintactico.py', archivo
             ], capture_output=True, text=True, cwd='.')
             
             exito = resultado.returncode == 0 and "exitoso" in resultado.stdout
@@ -349,26 +346,6 @@ fn main() int {
             self.log_error(f"Error probando {archivo}: {e}")
             return False
     
-    def modificar_archivo_objetivo(self, nombre_archivo):
-        """Modifica el archivo objetivo en lexico.py"""
-        try:
-            with open('compilador/lexico.py', 'r', encoding='utf-8') as f:
-                contenido = f.read()
-            
-            lineas = contenido.split('\n')
-            for i, linea in enumerate(lineas):
-                if linea.strip().startswith("archivo = "):
-                    lineas[i] = f"archivo = '{nombre_archivo}'"
-                    break
-            
-            with open('compilador/lexico.py', 'w', encoding='utf-8') as f:
-                f.write('\n'.join(lineas))
-            
-            return True
-        except Exception as e:
-            self.log_error(f"Error modificando archivo objetivo: {e}")
-            return False
-    
     def ejecutar_validacion_final(self):
         """Ejecuta la validación final de la rúbrica"""
         print("\n🎯 Ejecutando validación final...")
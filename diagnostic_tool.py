@@ -7,6 +7,7 @@ Identifica exactamente qué está fallando en el compilador
 
 import os
 import sys
+import time
 import subprocess
 
 def diagnosticar_archivo_especifico(archivo):
@@ -14,25 +15,10 @@ def diagnosticar_archivo_especifico(archivo):
     print(f"\n🔍 DIAGNÓSTICO DETALLADO: {archivo}")
     print("=" * 50)
     
-    # Modificar archivo objetivo
-    lexico_path = 'compilador/lexico.py'
-    with open(lexico_path, 'r', encoding='utf-8') as f:
-        contenido = f.read()
-    
-    # Cambiar archivo objetivo
-    lineas = contenido.split('\n')
-    for i, linea in enumerate(lineas):
-        if linea.strip().startswith("archivo = "):
-            lineas[i] = f"archivo = '{archivo}'"
-            break
-    
-    with open(lexico_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(lineas))
-    
     # Ejecutar compilador con captura detallada
     try:
         resultado = subprocess.run([
-            sys.executable, 'compilador/sintactico.py'
+            sys.executable, 'compilador/sintactico.py', archivo
         ], capture_output=True, text=True, timeout=10)
         
         print(f"📊 Código de salida: {resultado.returncode}")
@@ -49,6 +35,7 @@ def diagnosticar_archivo_especifico(archivo):
         
         # Analizar la salida
         analizar_salida(resultado.stdout, resultado.stderr)
+        inspeccionar_arbol_guardado(archivo)
         
     except subprocess.TimeoutExpired:
         print("⏰ TIMEOUT - El compilador se colgó")
@@ -98,7 +85,7 @@ def verificar_archivos_generados():
     print("\n📁 ARCHIVOS GENERADOS:")
     
     directorios = [
-        ('salida-tokens', '*.txt'),
+        ('salida-tokens', '*-tokens.*'),
         ('salida-arboles', '*.dot'),
         ('salida-arboles', '*.csv'),
         ('salida-assembly', '*.s'),
@@ -120,6 +107,39 @@ def verificar_archivos_generados():
         else:
             print(f"   ❌ {directorio}: directorio no existe")
 
+def inspeccionar_arbol_guardado(archivo):
+    """Carga el AST que guardó el compilador y muestra sus funciones, sin volver a analizar el archivo"""
+    print("\n🌳 AST GUARDADO:")
+    
+    sys.path.insert(0, os.path.abspath('compilador'))
+    from volcado_arbol import cargar_arbol
+    
+    nombre = os.path.splitext(archivo)[0]
+    ruta = os.path.join('salida-arboles', f'arbol-{nombre}-ast.arbol')
+    if not os.path.exists(ruta):
+        print(f"   ❌ {ruta}: no existe (el análisis sintáctico no terminó)")
+        return
+    
+    try:
+        inicio = time.perf_counter()
+        programa = cargar_arbol(ruta)
+        tiempo = (time.perf_counter() - inicio) * 1000
+    except ValueError as e:
+        print(f"   ❌ {ruta}: {e}")
+        return
+    
+    nodos = 0
+    pendientes = [programa]
+    while pendientes:
+        nodo = pendientes.pop()
+        nodos += 1
+        pendientes.extend(nodo.hijos)
+    print(f"   ✅ {ruta}: {nodos} nodos cargados en {tiempo:.2f} ms")
+    for funcion in programa.funciones:
+        parametros = ', '.join(f"{p.nombre} {p.tipo}" for p in funcion.parametros)
+        print(f"      - {funcion.nombre}({parametros}) -> {funcion.retorno}: "
+              f"{len(funcion.cuerpo.instrucciones)} instrucciones")
+
 def probar_tabla_ll1():
     """Verifica que la tabla LL(1) esté correcta"""
     print("\n🔍 VERIFICANDO TABLA LL(1):")
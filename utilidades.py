@@ -15,6 +15,7 @@ Funciones incluidas:
 
 import os
 import sys
+import glob
 import shutil
 import subprocess
 import json
@@ -81,13 +82,10 @@ def compilar_todos_ejemplos():
         print(f"\n[{i}/{len(archivos)}] 📁 {nombre}")
         
         try:
-            # Modificar archivo objetivo en lexico.py
-            modificar_archivo_objetivo(nombre)
-            
             # Ejecutar compilador
             inicio = time.time()
             resultado = subprocess.run([
-                sys.executable, 'compilador/sintactico.py', '--quiet'
+                sys.executable, 'compilador/sintactico.py', nombre, '--quiet'
             ], capture_output=True, text=True, cwd='.')
             tiempo = time.time() - inicio
             
@@ -130,28 +128,6 @@ def compilar_todos_ejemplos():
     
     return resultados
 
-def modificar_archivo_objetivo(nombre_archivo):
-    """Modifica temporalmente el archivo objetivo en lexico.py"""
-    lexico_path = Path('compilador/lexico.py')
-    
-    if not lexico_path.exists():
-        return
-    
-    # Leer archivo
-    with open(lexico_path, 'r', encoding='utf-8') as f:
-        contenido = f.read()
-    
-    # Buscar y reemplazar la línea del archivo
-    lineas = contenido.split('\n')
-    for i, linea in enumerate(lineas):
-        if linea.strip().startswith("archivo = "):
-            lineas[i] = f"archivo = '{nombre_archivo}'"
-            break
-    
-    # Escribir archivo modificado
-    with open(lexico_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(lineas))
-
 def guardar_reporte(resultados):
     """Guarda un reporte detallado en JSON"""
     os.makedirs('reportes', exist_ok=True)
@@ -253,10 +229,118 @@ def ejecutar_tests():
             'nombre': 'Test de análisis léxico',
             'funcion': test_analisis_lexico
         },
+        {
+            'nombre': 'Test de la expresión maestra del léxico',
+            'funcion': test_lexico_expresion_maestra
+        },
+        {
+            'nombre': 'Test del TokenBuffer',
+            'funcion': test_token_buffer
+        },
+        {
+            'nombre': 'Test del Lexer reentrante',
+            'funcion': test_lexer_reentrante
+        },
+        {
+            'nombre': 'Test de posiciones de los tokens',
+            'funcion': test_posiciones_tokens
+        },
+        {
+            'nombre': 'Test del internado de valores',
+            'funcion': test_internado_valores
+        },
+        {
+            'nombre': 'Test de análisis léxico por fragmentos',
+            'funcion': test_analisis_lexico_fragmentos
+        },
+        {
+            'nombre': 'Test del análisis léxico en paralelo',
+            'funcion': test_lexico_paralelo
+        },
+        {
+            'nombre': 'Test de reanálisis léxico incremental',
+            'funcion': test_relexado_incremental
+        },
+        {
+            'nombre': 'Test del análisis léxico sobre mmap',
+            'funcion': test_lexico_mmap
+        },
+        {
+            'nombre': 'Test del análisis léxico con NumPy',
+            'funcion': test_lexico_numpy
+        },
+        {
+            'nombre': 'Test de la caché de tokens',
+            'funcion': test_cache_tokens
+        },
+        {
+            'nombre': 'Test de volcado de tokens',
+            'funcion': test_volcado_tokens
+        },
+        {
+            'nombre': 'Test de los códigos de tipo de token',
+            'funcion': test_codigos_tipos_token
+        },
+        {
+            'nombre': 'Test del parser generado',
+            'funcion': test_parser_generado
+        },
+        {
+            'nombre': 'Test de la caché del parser generado',
+            'funcion': test_cache_parser_generado
+        },
+        {
+            'nombre': 'Test del parser en flujo',
+            'funcion': test_parser_flujo
+        },
+        {
+            'nombre': 'Test de recuperación de errores sintácticos',
+            'funcion': test_recuperacion_errores
+        },
+        {
+            'nombre': 'Test del análisis incremental por funciones',
+            'funcion': test_parser_incremental
+        },
+        {
+            'nombre': 'Test del análisis sintáctico en paralelo',
+            'funcion': test_sintactico_paralelo
+        },
+        {
+            'nombre': 'Test del volcado binario de árboles',
+            'funcion': test_volcado_arbol
+        },
+        {
+            'nombre': 'Test del árbol en arreglos',
+            'funcion': test_arbol_arena
+        },
+        {
+            'nombre': 'Test del AST',
+            'funcion': test_arbol_abstracto
+        },
+        {
+            'nombre': 'Test de recorridos sobre árboles profundos',
+            'funcion': test_recorrido_profundo
+        },
         {
             'nombre': 'Test de tabla LL(1)',
             'funcion': test_tabla_ll1
         },
+        {
+            'nombre': 'Test de la tabla LL(1) compilada',
+            'funcion': test_tabla_ll1_compilada
+        },
+        {
+            'nombre': 'Test de la clasificación de símbolos',
+            'funcion': test_clasificacion_simbolos
+        },
+        {
+            'nombre': 'Test de la caché de la tabla LL(1)',
+            'funcion': test_cache_tabla_ll1
+        },
+        {
+            'nombre': 'Test de la línea de comandos',
+            'funcion': test_linea_comandos
+        },
         {
             'nombre': 'Test de compilación simple',
             'funcion': test_compilacion_simple
@@ -310,6 +394,843 @@ def test_analisis_lexico():
     except:
         return False
 
+def test_lexico_expresion_maestra():
+    """Test de que la expresión maestra produce los mismos tokens y errores que el análisis carácter a carácter"""
+    try:
+        from compilador.lexico import analizar_lexico, analizar_lexico_clasico
+
+        def resumen(tokens, errores):
+            return [(t.tipo, t.valor) for t in tokens], [e.mensaje for e in errores]
+
+        codigos = [archivo.read_text(encoding='utf-8') for archivo in sorted(Path('codigos-bocetos').glob('*.txt'))]
+        codigos += ['x = 1.5 + 2.3.4 - a.b; 3abc _x9 >= <= == != && || !y',
+                    'show("hola\nmundo") // comentario\n/* bloque\n */ @ # x',
+                    'a/b/*c*/d//e',
+                    'fn main() int {\n    s string = "sin cerrar']
+        for codigo in codigos:
+            assert resumen(*analizar_lexico(codigo)) == resumen(*analizar_lexico_clasico(codigo))
+
+        return True
+    except:
+        return False
+
+def test_token_buffer():
+    """Test de que TokenBuffer se comporta como la lista de objetos Token que reemplaza"""
+    try:
+        import io
+        from compilador.lexico import Token, TokenBuffer, analizar_lexico, iter_tokens, crear_tabla_tokens
+
+        codigo = 'fn main() int {\n    x float = 2.5;\n    show("hola");\n    return x;\n}'
+        tokens, _ = analizar_lexico(codigo)
+        lista = list(iter_tokens(io.StringIO(codigo)))
+        assert len(tokens) == len(lista)
+        assert [(t.tipo, t.valor, t.linea, t.columna) for t in tokens] == \
+               [(t.tipo, t.valor, t.linea, t.columna) for t in lista]
+        assert tokens[-1].valor == lista[-1].valor and tokens[len(tokens) - 1].tipo == lista[-1].tipo
+        try:
+            tokens[len(tokens)]
+            return False
+        except IndexError:
+            pass
+        assert crear_tabla_tokens(tokens) == crear_tabla_tokens(lista)
+
+        # append() con objetos Token, como hace el parser con el '$' final.
+        buffer = TokenBuffer()
+        for token in lista + [Token("$", "$", None, None)]:
+            buffer.append(token)
+        assert [(t.tipo, t.valor) for t in buffer] == [(t.tipo, t.valor) for t in lista] + [('$', '$')]
+        assert (buffer[-1].linea, buffer[-1].columna) == (None, None)
+        buffer.clear()
+        assert len(buffer) == 0 and list(buffer) == []
+
+        return True
+    except:
+        return False
+
+def test_lexer_reentrante():
+    """Test de que importar lexico no tiene efectos y de que varios Lexer trabajan a la vez sin compartir estado"""
+    try:
+        from concurrent.futures import ThreadPoolExecutor
+        from compilador.lexico import Lexer
+
+        resultado = subprocess.run([sys.executable, '-c', 'import lexico'], cwd='compilador', capture_output=True, text=True)
+        assert resultado.returncode == 0 and resultado.stdout == ''
+
+        def analizar(codigo):
+            lexer = Lexer()
+            lexer.lex(codigo, 'fuente.txt')
+            return [(t.tipo, t.valor, t.linea, t.columna) for t in lexer.tokens], [str(e) for e in lexer.errores]
+
+        codigos = [f'fn main() int {{\n    x{i} int = {i}; @\n    return x{i};\n}}' for i in range(8)]
+        referencias = [analizar(codigo) for codigo in codigos]
+        with ThreadPoolExecutor(max_workers=4) as ejecutor:
+            assert list(ejecutor.map(analizar, codigos * 4)) == referencias * 4
+
+        # Un Lexer conserva sus tokens y errores aunque otro analice después.
+        primero, segundo = Lexer(), Lexer()
+        primero.lex(codigos[0])
+        segundo.lex(codigos[1])
+        assert [(t.tipo, t.valor, t.linea, t.columna) for t in primero.tokens] == referencias[0][0]
+        assert [str(e) for e in primero.errores] == referencias[0][1]
+
+        return True
+    except:
+        return False
+
+def test_posiciones_tokens():
+    """Test de que la línea y columna calculadas con IndiceLineas son las del primer carácter de cada lexema"""
+    try:
+        from compilador.lexico import IndiceLineas, SIN_POSICION, analizar_lexico
+
+        def posicion(fuente, inicio):
+            return fuente.count('\n', 0, inicio) + 1, inicio - fuente.rfind('\n', 0, inicio)
+
+        fuente = ('fn main() int {\n\tx int = 10; // comentario\n    /* bloque\n  largo */ y string = "año\nnuevo";\n'
+                  '  z string = "ñandú"; if (x <= 3.14) { show(y); } @\n\n    return x;\n}')
+        tokens, errores = analizar_lexico(fuente)
+        assert len(errores) == 1
+        inicios = [t.inicio for t in tokens]
+        assert [(t.linea, t.columna) for t in tokens] == [posicion(fuente, inicio) for inicio in inicios]
+        assert all(fuente.startswith(t.valor, t.inicio) for t in tokens if t.tipo == 'id')
+        assert list(tokens.posiciones()) == [(t.linea, t.columna) for t in tokens]
+        assert [(e.linea, e.columna) for e in errores] == [posicion(fuente, e.inicio) for e in errores]
+        assert fuente[errores[0].inicio] == '@'
+
+        # Sobre bytes UTF-8 las posiciones están en bytes y las columnas en caracteres.
+        indice_bytes = IndiceLineas(fuente.encode('utf-8'))
+        assert [indice_bytes.posicion(len(fuente[:inicio].encode('utf-8'))) for inicio in inicios] == \
+               [posicion(fuente, inicio) for inicio in inicios]
+        assert IndiceLineas(fuente).posicion(SIN_POSICION) == (None, None)
+
+        return True
+    except:
+        return False
+
+def test_internado_valores():
+    """Test de que los identificadores y cadenas repetidos comparten un único objeto str"""
+    try:
+        import tempfile
+        sys.path.insert(0, os.path.abspath('compilador'))
+        from lexico import Lexer, analizar_lexico_clasico
+        from cache_tokens import CacheTokens
+
+        def comprobar(tokens):
+            vistos = {}
+            for token in tokens:
+                if token.tipo in ('id', 'ncadena'):
+                    assert vistos.setdefault(token.valor, token.valor) is token.valor
+
+        codigo = ('fn suma(total int, x int) int {\n    total = total + x;\n    show("total");\n'
+                  '    show("total");\n    return total;\n}')
+        lexer = Lexer()
+        tokens = lexer.lex(codigo)
+        comprobar(tokens)
+        assert [(t.tipo, t.valor) for t in tokens] == [(t.tipo, t.valor) for t in analizar_lexico_clasico(codigo)[0]]
+
+        # Los valores que trae una edición se internan en la misma tabla.
+        posicion = codigo.index('return total')
+        comprobar(lexer.editar(posicion, 0, 'x = total;\n    '))
+        assert lexer.internados['total'] is tokens[tokens.valores.index('total')].valor
+
+        # También los tokens que vienen de la caché.
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, 'fuente.txt')
+            with open(ruta, 'w', encoding='utf-8') as f:
+                f.write(codigo)
+            cache = CacheTokens(os.path.join(directorio, 'cache'))
+            Lexer().lex_archivo(ruta, cache)
+            lexer = Lexer()
+            comprobar(lexer.lex_archivo(ruta, cache))
+            assert cache.aciertos == 1
+
+        return True
+    except:
+        return False
+
+def test_analisis_lexico_fragmentos():
+    """Test de iter_tokens con lexemas que cruzan el límite entre fragmentos"""
+    try:
+        import io
+        from compilador.lexico import iter_tokens
+
+        codigo = 'fn main() int {\n    /* comentario\n largo */ x int = 10;\n    show("hola mundo");\n    if (x <= 3.14) { }\n}'
+        referencia = [(t.tipo, t.valor, t.linea, t.columna) for t in iter_tokens(io.StringIO(codigo), len(codigo), [])]
+        for tamano in (1, 2, 3, 7):
+            tokens = [(t.tipo, t.valor, t.linea, t.columna) for t in iter_tokens(io.StringIO(codigo), tamano, [])]
+            assert tokens == referencia
+
+        return True
+    except:
+        return False
+
+def test_lexico_paralelo():
+    """Test de que analizar_lexico_paralelo une los fragmentos en los mismos tokens que analizar_lexico"""
+    try:
+        sys.path.insert(0, os.path.abspath('compilador'))
+        import lexico_paralelo
+        from lexico import analizar_lexico
+
+        def resumen(tokens, errores):
+            return ([(t.codigo, t.valor, t.inicio, t.linea, t.columna) for t in tokens],
+                    [(e.mensaje, e.inicio, e.linea, e.columna) for e in errores])
+
+        # Cadenas y comentarios de varias líneas: los saltos dentro de ellos no pueden ser cortes.
+        bloque = ('fn f{0}() int {{\n    show("cadena\n con\n saltos {0}");\n    /* comentario\n\n de bloque */\n'
+                  '    x int = {0} @ 1; // línea\n    return x;\n}}\n')
+        codigo = ''.join(bloque.format(i) for i in range(12))
+        minimo = lexico_paralelo.TAMANO_MINIMO_FRAGMENTO
+        lexico_paralelo.TAMANO_MINIMO_FRAGMENTO = 40
+        try:
+            for contenido in (codigo, codigo + 'fn g() int {\n    /* sin cerrar\n}\n', codigo + 'show("sin cerrar\n);\n'):
+                referencia = resumen(*analizar_lexico(contenido))
+                for procesos in (2, 3, 7):
+                    assert len(lexico_paralelo.buscar_cortes(contenido, procesos)) == procesos
+                    assert resumen(*lexico_paralelo.analizar_lexico_paralelo(contenido, procesos)) == referencia
+        finally:
+            lexico_paralelo.TAMANO_MINIMO_FRAGMENTO = minimo
+
+        return True
+    except:
+        return False
+
+def test_relexado_incremental():
+    """Test de Lexer.editar frente a un análisis completo del texto editado"""
+    try:
+        from compilador.lexico import Lexer
+
+        def resumen(lexer):
+            return ([(t.tipo, t.valor, t.linea, t.columna, t.inicio) for t in lexer.tokens],
+                    [(e.mensaje, e.linea, e.columna, e.inicio) for e in lexer.errores])
+
+        codigo = 'fn main() int {\n    x int = 10;\n    show("hola\nmundo");\n    if (x <= 3.14) { }\n}'
+        ediciones = [(19, 0, '\n'), (23, 3, 'float'), (0, 0, '/*'), (0, 2, ''), (30, 0, '"'), (30, 1, ''), (5, 4, 'x1')]
+        lexer = Lexer()
+        lexer.lex(codigo)
+        for desplazamiento, longitud_borrada, texto in ediciones:
+            lexer.editar(desplazamiento, longitud_borrada, texto)
+            referencia = Lexer()
+            referencia.lex(lexer.fuente)
+            assert resumen(lexer) == resumen(referencia)
+
+        return True
+    except:
+        return False
+
+def test_lexico_mmap():
+    """Test de que Lexer.lex_mmap da los mismos tokens y errores que analizar_lexico y no admite editar()"""
+    try:
+        import tempfile
+        from compilador.lexico import Lexer, analizar_lexico
+
+        def resumen(tokens, errores):
+            return ([(t.codigo, t.valor, t.linea, t.columna) for t in tokens],
+                    [(e.mensaje, e.linea, e.columna) for e in errores])
+
+        fuentes = [open(ruta, encoding='utf-8').read() for ruta in sorted(glob.glob('codigos-bocetos/*.txt'))]
+        fuentes.append('fn main() int {\n    año int = 1; @ x float = 3.14;\n    show("ñandú\n");\n    /* é */ y = año;\n}')
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, 'fuente.txt')
+            for contenido in fuentes:
+                with open(ruta, 'w', encoding='utf-8', newline='') as f:
+                    f.write(contenido)
+                lexer = Lexer()
+                tokens = lexer.lex_mmap(ruta)
+                try:
+                    assert resumen(tokens, lexer.errores) == resumen(*analizar_lexico(contenido))
+                    try:
+                        lexer.editar(0, 0, ' ')
+                        return False
+                    except ValueError:
+                        pass
+                finally:
+                    if hasattr(lexer.fuente, 'close'):
+                        lexer.fuente.close()
+
+        return True
+    except:
+        return False
+
+def test_lexico_numpy():
+    """Test de que analizar_lexico_numpy da los mismos códigos, valores, posiciones y errores que analizar_lexico"""
+    try:
+        sys.path.insert(0, os.path.abspath('compilador'))
+        from lexico import analizar_lexico
+        from lexico_numpy import analizar_lexico_numpy
+
+        def resumen(tokens, errores):
+            return ([(t.codigo, t.valor, t.inicio, t.linea, t.columna) for t in tokens],
+                    [(e.mensaje, e.inicio, e.linea, e.columna) for e in errores])
+
+        fuentes = [open(ruta, encoding='utf-8').read() for ruta in sorted(glob.glob('codigos-bocetos/*.txt'))]
+        fuentes += ['fn main() int {\n    año int = 1; @ x float = 3.14 ;\n    y = x<=2 && !b;# z\n}',
+                    'fn main() int {\n    /* comentario sin cerrar\n}',
+                    'fn main() int {\n    show("cadena sin cerrar);\n}']
+        for contenido in fuentes:
+            assert resumen(*analizar_lexico_numpy(contenido)) == resumen(*analizar_lexico(contenido))
+
+        return True
+    except:
+        return False
+
+def test_cache_tokens():
+    """Test de aciertos, invalidación, desalojo LRU y --sin-cache de la caché de tokens"""
+    try:
+        import tempfile
+        sys.path.insert(0, os.path.abspath('compilador'))
+        import cache_tokens
+        from cache_tokens import CacheTokens
+        from lexico import Lexer, analizar_lexico
+
+        def resumen(tokens, errores):
+            return ([(t.codigo, t.valor, t.inicio, t.linea, t.columna) for t in tokens],
+                    [(e.mensaje, e.linea, e.columna) for e in errores])
+
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, 'fuente.txt')
+            cache = CacheTokens(os.path.join(directorio, 'cache'))
+            for contenido in ('fn main() int {\n    x int = 1; @\n    return x;\n}', 'fn main() int {\n    return 2;\n}'):
+                with open(ruta, 'w', encoding='utf-8') as f:
+                    f.write(contenido)
+                # Un contenido nuevo falla y se guarda; el mismo contenido acierta.
+                for aciertos in (cache.aciertos, cache.aciertos + 1):
+                    lexer = Lexer()
+                    lexer.lex_archivo(ruta, cache)
+                    assert cache.aciertos == aciertos
+                    assert resumen(lexer.tokens, lexer.errores) == resumen(*analizar_lexico(contenido))
+            assert (cache.aciertos, cache.fallos) == (2, 2)
+
+            # Otra versión del analizador léxico no usa las entradas guardadas.
+            with open(ruta, 'rb') as f:
+                datos = f.read()
+            version = cache_tokens.version_lexico
+            cache_tokens.version_lexico = 'otra version'
+            try:
+                assert cache.obtener(datos, datos.decode('utf-8')) is None
+            finally:
+                cache_tokens.version_lexico = version
+            assert cache.obtener(datos, datos.decode('utf-8')) is not None
+
+            # Al superar el tamaño máximo se borra la entrada usada hace más tiempo.
+            lru = CacheTokens(os.path.join(directorio, 'lru'))
+            entradas = [('fn f%d() int {\n    return %d;\n}' % (i, i)).encode('utf-8') for i in range(3)]
+            for datos in entradas[:2]:
+                lru.guardar(datos, *analizar_lexico(datos.decode('utf-8')))
+            for antiguedad, datos in zip((2000, 1000), entradas[:2]):
+                os.utime(lru._ruta(lru.clave(datos)), (antiguedad, antiguedad))
+            assert lru.obtener(entradas[0], entradas[0].decode('utf-8')) is not None
+            lru.tamano_maximo = sum(os.path.getsize(lru._ruta(lru.clave(datos))) for datos in entradas[:2])
+            lru.guardar(entradas[2], *analizar_lexico(entradas[2].decode('utf-8')))
+            assert [lru.obtener(datos, datos.decode('utf-8')) is not None for datos in entradas] == [True, False, True]
+
+            # --sin-cache no escribe la caché; sin la opción sí.
+            compilador = os.path.abspath('compilador/sintactico.py')
+            for opciones, con_cache in ((['--sin-cache'], False), ([], True)):
+                subprocess.run([sys.executable, compilador, ruta] + opciones, cwd=directorio, capture_output=True)
+                directorio_cache = os.path.join(directorio, cache_tokens.DIRECTORIO_CACHE)
+                assert (os.path.isdir(directorio_cache) and len(os.listdir(directorio_cache)) > 0) == con_cache
+
+        return True
+    except:
+        return False
+
+def test_volcado_tokens():
+    """Test de ida y vuelta de los volcados JSONL y binario de tokens"""
+    try:
+        import tempfile
+        from compilador.lexico import Lexer, Token, EscritorTokens, leer_tokens
+
+        lexer = Lexer()
+        # Un literal flotante que desborda vale inf; los valores None y bool se escriben fuera del camino rápido.
+        tokens = lexer.lex('fn main() int {\n    x float = 3.14;\n    y float = 1' + '0' * 400 + '.5;\n'
+                           '    show("hola\n\u00f1");\n    @\n}')
+        tokens.append(Token("nbooleano", True, None, None))
+        tokens.append(Token("$", None, None, None))
+        tokens.append(Token("$", "$", None, None))
+        referencia = [(t.tipo, t.valor, t.linea, t.columna) for t in tokens]
+        assert float('inf') in [valor for _, valor, _, _ in referencia]
+        with tempfile.TemporaryDirectory() as directorio:
+            for formato in ('jsonl', 'binario'):
+                for origen in (tokens, list(tokens)):
+                    ruta = os.path.join(directorio, 'tokens.' + formato)
+                    with EscritorTokens(ruta, formato) as escritor:
+                        for error in lexer.errores:
+                            escritor.escribir_error(error)
+                        escritor.escribir_tokens(origen)
+                    assert escritor.filas == len(referencia)
+                    errores = []
+                    assert [(t.tipo, t.valor, t.linea, t.columna) for t in leer_tokens(ruta, errores)] == referencia
+                    assert [str(e) for e in errores] == [str(e) for e in lexer.errores]
+
+        return True
+    except:
+        return False
+
+def test_codigos_tipos_token():
+    """Test de que el léxico, la tabla LL(1) y el árbol sintáctico usan los mismos códigos de tipo de token"""
+    try:
+        import csv
+        sys.path.insert(0, os.path.abspath('compilador'))
+        import sintactico
+        from lexico import Token, Lexer, codigos_tipos_token, nombres_tipos_token
+
+        assert len(nombres_tipos_token) <= 256
+        assert all(nombres_tipos_token[codigo] == nombre for nombre, codigo in codigos_tipos_token.items())
+
+        tabla_ll1 = sintactico.cargar_tabla_ll1(sintactico.ruta_archivo_ll1)
+        with open(sintactico.ruta_archivo_ll1, 'r', encoding='utf-8', newline='') as f:
+            filas = list(csv.reader(f))
+        assert tabla_ll1.terminales == [codigos_tipos_token[nombre] for nombre in filas[0][1:]]
+        assert tabla_ll1.no_terminales == [codigos_tipos_token[fila[0]] for fila in filas[1:]]
+
+        codigo = 'fn main() int {\n    x int = 1 + 2 * 3;\n    if (x > 2) { x = 0; } else { x = 1; }\n    return x;\n}'
+        tokens = Lexer().lex(codigo)
+        assert all(t.codigo == codigos_tipos_token[t.tipo] for t in tokens)
+        codigos_tokens = [t.codigo for t in tokens]
+        tokens.append(Token("$", "$", None, None))
+        exito, arbol, _ = sintactico.analizador_sintactico(tokens, tabla_ll1)
+        assert exito
+
+        hojas = []
+        pendientes = [arbol]
+        while pendientes:
+            nodo = pendientes.pop()
+            assert nodo.codigo == codigos_tipos_token[nodo.tipo]
+            if nodo.terminal and nodo.tipo != 'e':
+                hojas.append(nodo.codigo)
+            pendientes.extend(reversed(nodo.hijos))
+        assert hojas == codigos_tokens
+
+        return True
+    except:
+        return False
+
+def test_parser_generado():
+    """Test de que el parser generado construye el mismo árbol y errores que la tabla con pila"""
+    try:
+        sys.path.insert(0, os.path.abspath('compilador'))
+        import sintactico
+        from lexico import Lexer, Token
+
+        def recorrer(nodo):
+            pendientes = [nodo] if nodo else []
+            while pendientes:
+                nodo = pendientes.pop()
+                yield (nodo.id, nodo.tipo, nodo.valor, nodo.linea, nodo.columna, nodo.terminal,
+                       nodo.padre.id if nodo.padre else None)
+                pendientes.extend(reversed(nodo.hijos))
+
+        tabla_ll1 = sintactico.cargar_tabla_ll1(sintactico.ruta_archivo_ll1)
+        for codigo in ('fn suma(a int, b int) int {\n    return a + b * (2 - a);\n}\n'
+                       'fn main() int {\n    x int = suma(1, 2);\n    if (x > 2) { x = 0; } else { x = 1; }\n    return x;\n}',
+                       'fn main() int {\n    x int = ;\n}'):
+            tokens = Lexer().lex(codigo)
+            tokens.append(Token("$", "$", None, None))
+            exito, arbol, errores = sintactico.analizador_sintactico(tokens, tabla_ll1)
+            exito_generado, arbol_generado, errores_generado = sintactico.analizador_sintactico_generado(tokens, tabla_ll1)
+            assert exito == exito_generado
+            assert list(recorrer(arbol)) == list(recorrer(arbol_generado))
+            assert [str(e) for e in errores] == [str(e) for e in errores_generado]
+
+        return True
+    except:
+        return False
+
+def test_cache_parser_generado():
+    """Test de que la tabla compilada y el parser generado se validan y no se regeneran sin cambios"""
+    try:
+        import shutil
+        import marshal
+        import tempfile
+        sys.path.insert(0, os.path.abspath('compilador'))
+        import sintactico
+        import generador_parser
+
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta_csv = os.path.join(directorio, 'tabla.csv')
+            shutil.copyfile(sintactico.ruta_archivo_ll1, ruta_csv)
+            tabla = sintactico.cargar_tabla_ll1(ruta_csv)
+            ruta_bin = sintactico.ruta_tabla_compilada(ruta_csv)
+            huella = sintactico.huella_tabla_ll1(ruta_csv)
+            assert sintactico.TablaLL1.cargar(ruta_bin, huella).matriz == tabla.matriz
+
+            # Una tabla compilada con otra asignación de códigos no se usa.
+            with open(ruta_bin, 'rb') as f:
+                guardada = list(marshal.loads(f.read()))
+            nombres = list(guardada[1])
+            nombres[tabla.inicial], nombres[tabla.terminales[0]] = nombres[tabla.terminales[0]], nombres[tabla.inicial]
+            guardada[1] = nombres
+            with open(ruta_bin, 'wb') as f:
+                f.write(marshal.dumps(tuple(guardada)))
+            assert sintactico.TablaLL1.cargar(ruta_bin, huella) is None
+            assert sintactico.cargar_tabla_ll1(ruta_csv).matriz == tabla.matriz
+
+            # El parser generado se escribe una vez; con la misma tabla no se regenera
+            # aunque haya más referencias a sus producciones.
+            ruta_parser = os.path.join(directorio, 'parser.py')
+            generador_parser.cargar_parser_generado(tabla, sintactico.ruta_gramatica, ruta_parser)
+            with open(ruta_parser, 'r', encoding='utf-8') as f:
+                fuente = f.read()
+            modificacion = os.stat(ruta_parser).st_mtime_ns
+            producciones = [produccion for fila in tabla.matriz if fila for produccion in fila if produccion]
+            generador_parser._parsers_cargados.clear()
+            generador_parser.cargar_parser_generado(sintactico.cargar_tabla_ll1(ruta_csv),
+                                                    sintactico.ruta_gramatica, ruta_parser)
+            assert os.stat(ruta_parser).st_mtime_ns == modificacion
+            assert len(producciones) > 0
+
+            # Un módulo con otra huella se vuelve a generar.
+            with open(ruta_parser, 'w', encoding='utf-8') as f:
+                f.write("HUELLA = 'otra'\n")
+            generador_parser._parsers_cargados.clear()
+            generador_parser.cargar_parser_generado(tabla, sintactico.ruta_gramatica, ruta_parser)
+            with open(ruta_parser, 'r', encoding='utf-8') as f:
+                assert f.read() == fuente
+            generador_parser._parsers_cargados.clear()
+
+        return True
+    except:
+        return False
+
+def test_parser_flujo():
+    """Test de que el parser en flujo da el mismo resultado que el parser sobre la lista de tokens"""
+    try:
+        import io
+        sys.path.insert(0, os.path.abspath('compilador'))
+        import sintactico
+        from lexico import Lexer, Token, iter_tokens
+
+        tabla_ll1 = sintactico.cargar_tabla_ll1(sintactico.ruta_archivo_ll1)
+        for codigo in ('fn main() int {\n    x int = 1 + 2;\n    if (x > 2) { x = 0; }\n    return x;\n}',
+                       'fn main() int {\n    return ;\n}'):
+            tokens = Lexer().lex(codigo)
+            tokens.append(Token("$", "$", None, None))
+            exito, arbol, errores = sintactico.analizador_sintactico(tokens, tabla_ll1)
+            exito_flujo, arbol_flujo, errores_flujo = sintactico.analizador_sintactico_flujo(
+                iter_tokens(io.StringIO(codigo), 8), tabla_ll1)
+            assert exito == exito_flujo
+            assert [str(e) for e in errores] == [str(e) for e in errores_flujo]
+            pendientes = [(arbol, arbol_flujo)] if arbol else []
+            while pendientes:
+                nodo, nodo_flujo = pendientes.pop()
+                assert (nodo.id, nodo.tipo, nodo.valor, nodo.linea, nodo.columna) == \
+                       (nodo_flujo.id, nodo_flujo.tipo, nodo_flujo.valor, nodo_flujo.linea, nodo_flujo.columna)
+                assert len(nodo.hijos) == len(nodo_flujo.hijos)
+                pendientes.extend(zip(nodo.hijos, nodo_flujo.hijos))
+
+        return True
+    except:
+        return False
+
+def test_recuperacion_errores():
+    """Test de que el modo pánico informa todos los errores sintácticos y no cambia los programas correctos"""
+    try:
+        sys.path.insert(0, os.path.abspath('compilador'))
+        import sintactico
+        from lexico import Lexer, Token
+
+        tabla_ll1 = sintactico.cargar_tabla_ll1(sintactico.ruta_archivo_ll1)
+        codigo = ('fn f(a int) int {\n    a = a +;\n    return a;\n}\n'
+                  'fn main( int {\n    x int = 1;\n}\n'
+                  'fn g() int {\n    x int = ;\n    if (x < ) { x = 1; } else { x = 2; }\n'
+                  '    y int = 2 2;\n    return x;\n}')
+        tokens = Lexer().lex(codigo)
+        tokens.append(Token("$", "$", None, None))
+        _, _, errores = sintactico.analizador_sintactico(tokens, tabla_ll1)
+        exito, arbol, errores_recuperacion = sintactico.analizador_sintactico_recuperacion(tokens, tabla_ll1)
+        assert not exito and arbol is None
+        assert [(e.linea, e.columna) for e in errores_recuperacion] == [(2, 12), (5, 10), (9, 13), (10, 13), (11, 15)]
+        assert str(errores_recuperacion[0]) == str(errores[0])
+
+        codigo = 'fn main() int {\n    x int = 1 + 2;\n    if (x > 2) { x = 0; } else { x = 1; }\n    return x;\n}'
+        tokens = Lexer().lex(codigo)
+        tokens.append(Token("$", "$", None, None))
+        exito, arbol, _ = sintactico.analizador_sintactico(tokens, tabla_ll1)
+        exito_recuperacion, arbol_recuperacion, errores_recuperacion = \
+            sintactico.analizador_sintactico_recuperacion(tokens, tabla_ll1)
+        assert exito and exito_recuperacion and not errores_recuperacion
+        pendientes = [(arbol, arbol_recuperacion)]
+        while pendientes:
+            nodo, nodo_recuperacion = pendientes.pop()
+            assert (nodo.id, nodo.tipo, nodo.valor, nodo.linea, nodo.columna) == \
+                   (nodo_recuperacion.id, nodo_recuperacion.tipo, nodo_recuperacion.valor,
+                    nodo_recuperacion.linea, nodo_recuperacion.columna)
+            assert len(nodo.hijos) == len(nodo_recuperacion.hijos)
+            pendientes.extend(zip(nodo.hijos, nodo_recuperacion.hijos))
+
+        return True
+    except:
+        return False
+
+def test_parser_incremental():
+    """Test de que ParserIncremental reanaliza solo la función editada y da el mismo árbol que un análisis completo"""
+    try:
+        sys.path.insert(0, os.path.abspath('compilador'))
+        import sintactico
+        from lexico import Lexer, Token
+        from parser_incremental import ParserIncremental
+
+        def recorrer(nodo):
+            pendientes = [nodo] if nodo else []
+            while pendientes:
+                nodo = pendientes.pop()
+                yield (nodo.id, nodo.tipo, nodo.valor, nodo.linea, nodo.columna, nodo.terminal,
+                       nodo.padre.id if nodo.padre else None)
+                pendientes.extend(reversed(nodo.hijos))
+
+        funcion = 'fn f{0}(a int) int {{\n    x int = a * {0};\n    if (x > a) {{ x = 0; }}\n    return x;\n}}\n'
+        funciones = [funcion.format(i) for i in range(4)] + ['fn main() int {\n    return f1(2);\n}\n']
+        tabla_ll1 = sintactico.cargar_tabla_ll1(sintactico.ruta_archivo_ll1)
+        incremental = ParserIncremental(tabla_ll1, sintactico.analizador_sintactico_generado, sintactico.Nodo)
+        ediciones = [(None, None), (1, 'return x;', 'x = x + 1;\n    return x;'), (2, '* 2', '* 22'),
+                     (3, 'return x;', 'return ;'), (3, 'return ;', 'return x;')]
+        reanalizadas = []
+        for edicion in ediciones:
+            if edicion[0] is not None:
+                numero, antes, despues = edicion
+                funciones[numero] = funciones[numero].replace(antes, despues)
+            tokens = Lexer().lex(''.join(funciones))
+            tokens.append(Token("$", "$", None, None))
+            exito, arbol, errores = sintactico.analizador_sintactico_generado(tokens, tabla_ll1)
+            exito_incremental, arbol_incremental, errores_incremental = incremental.analizar(tokens)
+            assert exito == exito_incremental
+            assert [str(e) for e in errores] == [str(e) for e in errores_incremental]
+            assert list(recorrer(arbol)) == list(recorrer(arbol_incremental))
+            reanalizadas.append(incremental.reanalizadas)
+        assert reanalizadas == [5, 1, 1, 0, 0]
+
+        return True
+    except:
+        return False
+
+def test_sintactico_paralelo():
+    """Test de que el análisis en varios procesos da la misma TreeArena que el análisis en un proceso"""
+    try:
+        sys.path.insert(0, os.path.abspath('compilador'))
+        import sintactico
+        import sintactico_paralelo
+        from lexico import Lexer, Token
+
+        def arreglos(raiz):
+            arena = raiz.arena
+            return (list(arena.codigos), list(arena.terminales), list(arena.tokens), list(arena.padres),
+                    list(arena.primeros_hijos), list(arena.siguientes_hermanos))
+
+        funcion = 'fn f{0}(a int) int {{\n    x int = a * {0};\n    if (x > a) {{ x = 0; }}\n    return x;\n}}\n'
+        codigo = ''.join(funcion.format(i) for i in range(7)) + 'fn main() int {\n    return f1(2);\n}\n'
+        tabla_ll1 = sintactico.cargar_tabla_ll1(sintactico.ruta_archivo_ll1)
+        minimo = sintactico_paralelo.TOKENS_MINIMOS_FRAGMENTO
+        # Con un mínimo pequeño el programa de prueba se reparte entre los procesos.
+        sintactico_paralelo.TOKENS_MINIMOS_FRAGMENTO = 10
+        try:
+            for fuente in (codigo, codigo.replace('return x;', 'return ;', 1)):
+                tokens = Lexer().lex(fuente)
+                tokens.append(Token("$", "$", None, None))
+                exito, raiz, errores = sintactico.analizador_sintactico_arena(tokens, tabla_ll1)
+                exito_paralelo, raiz_paralelo, errores_paralelo = \
+                    sintactico_paralelo.analizador_sintactico_paralelo(tokens, tabla_ll1, 3)
+                assert exito == exito_paralelo
+                assert [str(e) for e in errores] == [str(e) for e in errores_paralelo]
+                if exito:
+                    assert arreglos(raiz) == arreglos(raiz_paralelo)
+        finally:
+            sintactico_paralelo.TOKENS_MINIMOS_FRAGMENTO = minimo
+
+        return True
+    except:
+        return False
+
+def test_volcado_arbol():
+    """Test de que el árbol sintáctico y el AST se cargan iguales desde el formato binario"""
+    try:
+        sys.path.insert(0, os.path.abspath('compilador'))
+        import sintactico
+        from lexico import Lexer, Token
+        from arbol_abstracto import bajar_arbol
+        from volcado_arbol import arbol_a_bytes, arbol_desde_bytes
+
+        def recorrer(nodo):
+            pendientes = [nodo]
+            while pendientes:
+                nodo = pendientes.pop()
+                yield (nodo.id, nodo.tipo, nodo.codigo, nodo.valor, nodo.linea, nodo.columna, nodo.terminal,
+                       nodo.padre.id if nodo.padre else None, len(nodo.hijos))
+                pendientes.extend(reversed(nodo.hijos))
+
+        codigo = ('fn doble(a int) int {\n    return a * 2;\n}\n'
+                  'fn main() int {\n    x float = 1.5;\n'
+                  '    n int = doble(3);\n    if (n > 2) { n = n - 1; } else { n = 0; }\n    return n;\n}')
+        tokens = Lexer().lex(codigo)
+        tokens.append(Token("$", "$", None, None))
+        tabla_ll1 = sintactico.cargar_tabla_ll1(sintactico.ruta_archivo_ll1)
+        for analizador in (sintactico.analizador_sintactico_generado, sintactico.analizador_sintactico_arena):
+            exito, arbol, _ = analizador(tokens, tabla_ll1)
+            assert exito
+            datos = arbol_a_bytes(arbol, b'huella')
+            assert list(recorrer(arbol_desde_bytes(datos, sintactico.Nodo))) == list(recorrer(arbol))
+            assert arbol_desde_bytes(datos, sintactico.Nodo, b'otra') is None
+
+        programa = bajar_arbol(arbol)
+        cargado = arbol_desde_bytes(arbol_a_bytes(programa))
+        assert cargado == programa and repr(cargado) == repr(programa)
+        try:
+            arbol_desde_bytes(b'TOKS\x01')
+            return False
+        except ValueError:
+            pass
+
+        return True
+    except:
+        return False
+
+def test_arbol_arena():
+    """Test de que la TreeArena tiene los mismos nodos que el árbol de objetos Nodo"""
+    try:
+        sys.path.insert(0, os.path.abspath('compilador'))
+        import sintactico
+        from lexico import Lexer, Token
+
+        tabla_ll1 = sintactico.cargar_tabla_ll1(sintactico.ruta_archivo_ll1)
+        codigo = 'fn main() int {\n    x int = 1 + 2;\n    while (x > 2) { x = x - 1; }\n    return x;\n}'
+        tokens = Lexer().lex(codigo)
+        tokens.append(Token("$", "$", None, None))
+        exito, arbol, _ = sintactico.analizador_sintactico(tokens, tabla_ll1)
+        exito_arena, raiz, _ = sintactico.analizador_sintactico_arena(tokens, tabla_ll1)
+        assert exito == exito_arena
+        pendientes = [(arbol, raiz)] if arbol else []
+        while pendientes:
+            nodo, cursor = pendientes.pop()
+            assert (nodo.id, nodo.tipo, nodo.valor, nodo.linea, nodo.columna, nodo.terminal) == \
+                   (cursor.id, cursor.tipo, cursor.valor, cursor.linea, cursor.columna, cursor.terminal)
+            assert len(nodo.hijos) == len(cursor.hijos)
+            assert all(hijo.padre == cursor for hijo in cursor.hijos)
+            pendientes.extend(zip(nodo.hijos, cursor.hijos))
+
+        return True
+    except:
+        return False
+
+def test_arbol_abstracto():
+    """Test de que bajar_arbol construye el AST esperado, igual desde Nodo que desde TreeArena"""
+    try:
+        sys.path.insert(0, os.path.abspath('compilador'))
+        import sintactico
+        from lexico import Lexer, Token
+        from arbol_abstracto import (Program, FunctionDef, Param, Block, VarDecl, Assign, If,
+                                     Return, BinOp, Call, Name, Literal, Paren)
+
+        tabla_ll1 = sintactico.cargar_tabla_ll1(sintactico.ruta_archivo_ll1)
+        codigo = 'fn f(n int) int {\n    if (n < 2) { n = (n + 1) * 2; } else { r int; }\n    return f(n, 1);\n}'
+        tokens = Lexer().lex(codigo)
+        tokens.append(Token("$", "$", None, None))
+        _, arbol, _ = sintactico.analizador_sintactico(tokens, tabla_ll1)
+        _, raiz, _ = sintactico.analizador_sintactico_arena(tokens, tabla_ll1)
+        esperado = Program([FunctionDef('f', [Param('n', 'tentero', 1, 6)], 'tentero', Block([
+            If(BinOp('menorque', Name('n', 2, 9), Literal('nentero', 2, 2, 13)),
+               Block([Assign('n', BinOp('mul', Paren(BinOp('suma', Name('n', 2, 23), Literal('nentero', 1, 2, 27))),
+                                        Literal('nentero', 2, 2, 32)), 2, 18)]),
+               Block([VarDecl('r', 'tentero', None, 2, 44)])),
+            Return(Call('f', [Name('n', 3, 14), Literal('nentero', 1, 3, 17)], 3, 12)),
+        ]), False, 1, 4)])
+        assert sintactico.bajar_arbol(arbol) == esperado
+        assert sintactico.bajar_arbol(raiz) == esperado
+
+        # Un fallo al bajar el árbol se informa como error de compilación, sin excepción.
+        import io
+        import contextlib
+
+        def fallar(arbol):
+            raise RecursionError("maximum recursion depth exceeded")
+
+        fuente = Path('codigos-bocetos/test_temp_ast.txt')
+        salidas = [Path('salida-tokens/test_temp_ast-tokens.jsonl'), Path('salida-arboles/arbol-test_temp_ast.dot')]
+        fuente.write_text(codigo, encoding='utf-8')
+        bajar_arbol = sintactico.bajar_arbol
+        sintactico.bajar_arbol = fallar
+        try:
+            salida = io.StringIO()
+            with contextlib.redirect_stdout(salida):
+                assert sintactico.compilar(fuente.name, usar_cache=False) is False
+            assert 'Error al construir el AST: RecursionError' in salida.getvalue()
+        finally:
+            sintactico.bajar_arbol = bajar_arbol
+            for ruta in [fuente] + salidas:
+                if ruta.exists():
+                    ruta.unlink()
+
+        return True
+    except:
+        return False
+
+def test_recorrido_profundo():
+    """Test de que las fases recorren sin recursión programas con miles de instrucciones, términos y niveles de anidamiento"""
+    try:
+        import io
+        import contextlib
+        sys.path.insert(0, os.path.abspath('compilador'))
+        import sintactico
+        from lexico import Lexer, Token
+        from assembly import GeneradorAssembly
+        from assembly_mips import GeneradorAssemblyMIPS
+
+        tabla_ll1 = sintactico.cargar_tabla_ll1(sintactico.ruta_archivo_ll1)
+        codigo = ('fn main() int {\n    x int = 0;\n' + '    if (x < 1) { x = x + 1; }\n' * 1200 +
+                  '    x = ' + ' + '.join(['x'] * 1200) + ';\n    return x;\n}')
+        tokens = Lexer().lex(codigo)
+        tokens.append(Token("$", "$", None, None))
+        limite = sys.getrecursionlimit()
+        exito, arbol, _ = sintactico.analizador_sintactico_generado(tokens, tabla_ll1)
+        assert exito
+        grafo = sintactico.arbolSintactico(arbol, True)
+        assert sum(1 for linea in grafo.body if '->' not in linea) > 10000
+        arbol_abstracto = sintactico.bajar_arbol(arbol)
+        assert len(arbol_abstracto.funciones[0].cuerpo.instrucciones) == 1203
+        tabla_simbolos = sintactico.TablaSimbolos()
+        errores_tipos = []
+        sintactico.errores_semanticos.clear()
+        with contextlib.redirect_stdout(io.StringIO()):
+            sintactico.construir_tabla_simbolos(arbol_abstracto, tabla_simbolos)
+            copia = sintactico.crear_copia_tabla_simbolos(tabla_simbolos)
+            sintactico.verificar_tipos_completo(arbol_abstracto, copia, errores_tipos, sintactico.VerificadorTipos())
+            assert GeneradorAssemblyMIPS().generar(arbol_abstracto, copia).count('add ') == 2400 - 1
+            assert GeneradorAssembly().generar(arbol_abstracto, copia).count('add %') == 2400 - 1
+            sintactico.verificar_variable(arbol_abstracto, tabla_simbolos)
+        assert not sintactico.errores_semanticos
+        # verificar_condiciones_booleanas revisa también las subexpresiones y el cuerpo de cada if
+        assert errores_tipos and all('booleana' in error for error in errores_tipos)
+
+        # Anidamientos más profundos que el límite de recursión: bloques, paréntesis y argumentos.
+        for codigo in ('fn main() int {\n    x int = 0;\n' + '    if (x < 1) {\n' * 1200 + '    x = 1;\n' +
+                       '    }\n' * 1200 + '    return x;\n}',
+                       'fn main() int {\n    x int = ' + '(' * 2000 + '1' + ')' * 2000 + ';\n    return x;\n}',
+                       'fn f(a int) int {\n    return a;\n}\nfn main() int {\n    x int = ' + 'f(' * 1500 + '1' +
+                       ')' * 1500 + ';\n    return x;\n}'):
+            tokens = Lexer().lex(codigo)
+            tokens.append(Token("$", "$", None, None))
+            exito, arbol, _ = sintactico.analizador_sintactico_generado(tokens, tabla_ll1)
+            assert exito
+            arbol_abstracto = sintactico.bajar_arbol(arbol)
+            _, raiz, _ = sintactico.analizador_sintactico_arena(tokens, tabla_ll1)
+            assert sintactico.bajar_arbol(raiz) == arbol_abstracto
+            profundidad = 0
+            pendientes = [(arbol_abstracto, 0)]
+            while pendientes:
+                nodo, nivel = pendientes.pop()
+                profundidad = max(profundidad, nivel)
+                pendientes.extend((hijo, nivel + 1) for hijo in nodo.hijos)
+            assert profundidad > 1500
+            tabla_simbolos = sintactico.TablaSimbolos()
+            with contextlib.redirect_stdout(io.StringIO()):
+                sintactico.construir_tabla_simbolos(arbol_abstracto, tabla_simbolos)
+                copia = sintactico.crear_copia_tabla_simbolos(tabla_simbolos)
+                sintactico.verificar_tipos_completo(arbol_abstracto, copia, [], sintactico.VerificadorTipos())
+                GeneradorAssemblyMIPS().generar(arbol_abstracto, copia)
+        sintactico.errores_semanticos.clear()
+        assert sys.getrecursionlimit() == limite
+
+        return True
+    except:
+        return False
+
 def test_tabla_ll1():
     """Test para verificar que la tabla LL(1) existe y es válida"""
     try:
@@ -325,6 +1246,163 @@ def test_tabla_ll1():
     except:
         return False
 
+def test_tabla_ll1_compilada():
+    """Test de que la matriz densa de TablaLL1 tiene las mismas producciones que el CSV leído con pandas"""
+    try:
+        import pandas as pd
+        sys.path.insert(0, os.path.abspath('compilador'))
+        import sintactico
+        from lexico import Lexer, Token, codigos_tipos_token
+
+        tabla_ll1 = sintactico.cargar_tabla_ll1(sintactico.ruta_archivo_ll1, usar_compilada=False)
+        df = pd.read_csv(sintactico.ruta_archivo_ll1, index_col=0).fillna('')
+        for no_terminal in df.index:
+            for terminal in df.columns:
+                produccion = tabla_ll1.produccion(codigos_tipos_token[no_terminal], codigos_tipos_token[terminal])
+                assert tuple(codigo for codigo, _ in produccion) == \
+                       tuple(codigos_tipos_token[simbolo] for simbolo in df.at[no_terminal, terminal].split())
+            # Un tipo de token que no es columna de la tabla no tiene celda.
+            assert tabla_ll1.produccion(codigos_tipos_token[no_terminal], codigos_tipos_token['corcheteabi']) is None
+
+        # Una celda vacía informa 'e' y una columna inexistente nada, como con el DataFrame.
+        for codigo, error in (('fn main() int {\n    x int = ;\n}', 'se esperaba expresion, pero se encontró e'),
+                              ('fn main() int {\n    x int = a[1];\n}', 'se esperaba opciones, pero se encontró ')):
+            tokens = Lexer().lex(codigo)
+            tokens.append(Token("$", "$", None, None))
+            exito, _, errores = sintactico.analizador_sintactico(tokens, tabla_ll1)
+            assert not exito and [e.mensaje for e in errores] == [error]
+
+        return True
+    except:
+        return False
+
+def test_clasificacion_simbolos():
+    """Test de que los símbolos de las producciones se clasifican con la tabla LL(1) y no con los tokens"""
+    try:
+        sys.path.insert(0, os.path.abspath('compilador'))
+        import sintactico
+        from lexico import Lexer, Token
+
+        tabla_ll1 = sintactico.cargar_tabla_ll1(sintactico.ruta_archivo_ll1)
+        no_terminales = set(tabla_ll1.no_terminales)
+        for no_terminal in tabla_ll1.no_terminales:
+            for terminal in tabla_ll1.terminales:
+                for posicion, (simbolo, es_terminal) in enumerate(tabla_ll1.produccion(no_terminal, terminal)):
+                    assert es_terminal == (simbolo not in no_terminales or (posicion == 0 and simbolo == no_terminal))
+
+        # 'condicional' es a la vez no terminal y el tipo de 'if': estos programas no se analizaban.
+        for nombre in ('if-else-test.txt', 'recursion-test.txt'):
+            tokens = Lexer().lex(Path('codigos-bocetos', nombre).read_text(encoding='utf-8'))
+            tokens.append(Token("$", "$", None, None))
+            exito, arbol, _ = sintactico.analizador_sintactico(tokens, tabla_ll1)
+            assert exito
+            condicionales = 0
+            pendientes = [arbol]
+            while pendientes:
+                nodo = pendientes.pop()
+                assert nodo.terminal == (not nodo.hijos)
+                if nodo.tipo == 'condicional' and not nodo.terminal:
+                    assert (nodo.hijos[0].tipo, nodo.hijos[0].terminal, nodo.hijos[0].valor) == ('condicional', True, 'if')
+                    condicionales += 1
+                pendientes.extend(nodo.hijos)
+            assert condicionales > 0
+
+        return True
+    except:
+        return False
+
+def test_cache_tabla_ll1():
+    """Test de que la tabla LL(1) compilada se reutiliza y se vuelve a compilar cuando cambia el CSV"""
+    try:
+        import csv
+        import shutil
+        import tempfile
+        sys.path.insert(0, os.path.abspath('compilador'))
+        import sintactico
+        from lexico import codigos_tipos_token
+
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta_csv = os.path.join(directorio, 'tabla.csv')
+            ruta_bin = sintactico.ruta_tabla_compilada(ruta_csv)
+            shutil.copyfile(sintactico.ruta_archivo_ll1, ruta_csv)
+
+            # Sin usar_compilada no se escribe la tabla compilada.
+            referencia = sintactico.cargar_tabla_ll1(ruta_csv, usar_compilada=False).matriz
+            assert not os.path.exists(ruta_bin)
+            assert sintactico.cargar_tabla_ll1(ruta_csv).matriz == referencia
+            modificacion = os.stat(ruta_bin).st_mtime_ns
+            assert sintactico.cargar_tabla_ll1(ruta_csv).matriz == referencia
+            assert os.stat(ruta_bin).st_mtime_ns == modificacion
+
+            # Al vaciar una celda del CSV la tabla compilada deja de valer.
+            with open(ruta_csv, 'r', encoding='utf-8', newline='') as f:
+                filas = list(csv.reader(f))
+            columna = next(i for i, celda in enumerate(filas[1]) if i and celda)
+            filas[1][columna] = ''
+            with open(ruta_csv, 'w', encoding='utf-8', newline='') as f:
+                csv.writer(f).writerows(filas)
+            tabla = sintactico.cargar_tabla_ll1(ruta_csv)
+            assert tabla.produccion(codigos_tipos_token[filas[1][0]], codigos_tipos_token[filas[0][columna]]) == ()
+            assert tabla.matriz == sintactico.cargar_tabla_ll1(ruta_csv, usar_compilada=False).matriz
+            assert sintactico.cargar_tabla_ll1(ruta_csv).matriz == tabla.matriz
+
+            # Un archivo dañado se ignora y se reescribe.
+            with open(ruta_bin, 'wb') as f:
+                f.write(b'no es marshal')
+            assert sintactico.cargar_tabla_ll1(ruta_csv).matriz == tabla.matriz
+            assert sintactico.TablaLL1.cargar(ruta_bin, sintactico.huella_tabla_ll1(ruta_csv)).matriz == tabla.matriz
+
+        return True
+    except:
+        return False
+
+def test_linea_comandos():
+    """Test de que sintactico.py compila el archivo que recibe como argumento y sus opciones dan las mismas salidas"""
+    try:
+        from compilador.lexico import analizar_lexico, leer_tokens
+
+        codigo = 'fn suma(a int, b int) int {\n    return a + b;\n}\nfn main() int {\n    x int = suma(1, 2);\n    return x;\n}\n'
+        fuente = Path('codigos-bocetos/test_temp_cli.txt')
+        # La tabla de símbolos en .dot usa id() de los ámbitos y cambia en cada ejecución.
+        salidas = [Path('salida-tokens/test_temp_cli-tokens.jsonl'),
+                   Path('salida-arboles/arbol-test_temp_cli.dot'),
+                   Path('salida-arboles/arbol-test_temp_cli-tabla-simbolos.csv'),
+                   Path('salida-arboles/arbol-test_temp_cli.arbol'),
+                   Path('salida-arboles/arbol-test_temp_cli-ast.arbol')]
+        binario = Path('salida-tokens/test_temp_cli-tokens.tokbin')
+        simbolos = Path('salida-arboles/arbol-test_temp_cli-symbol-table.dot')
+        lexico = Path('compilador/lexico.py').read_bytes()
+
+        def compilar(archivo, *opciones):
+            return subprocess.run([sys.executable, 'compilador/sintactico.py', archivo, '--sin-cache', *opciones],
+                                  capture_output=True).returncode
+
+        tokens, _ = analizar_lexico(codigo)
+        referencia_tokens = [(t.tipo, t.valor, t.linea, t.columna) for t in tokens] + [('$', '$', None, None)]
+        fuente.write_text(codigo, encoding='utf-8')
+        try:
+            assert compilar(fuente.name) == 0
+            referencia = [ruta.read_bytes() for ruta in salidas]
+            assert [(t.tipo, t.valor, t.linea, t.columna) for t in leer_tokens(str(salidas[0]))] == referencia_tokens
+            for opciones in (['--mmap'], ['--parser-tabla'], ['--arbol-arena'], ['--paralelo'], ['--arbol-guardado']):
+                assert compilar(fuente.name, *opciones) == 0
+                assert [ruta.read_bytes() for ruta in salidas] == referencia
+
+            assert compilar(fuente.name, '--formato-tokens', 'binario') == 0
+            assert [(t.tipo, t.valor, t.linea, t.columna) for t in leer_tokens(str(binario))] == referencia_tokens
+
+            # El archivo se elige por argumento, sin reescribir lexico.py.
+            assert compilar('test_temp_no_existe.txt') != 0
+            assert Path('compilador/lexico.py').read_bytes() == lexico
+        finally:
+            for ruta in [fuente, binario, simbolos] + salidas:
+                if ruta.exists():
+                    ruta.unlink()
+
+        return True
+    except:
+        return False
+
 def test_compilacion_simple():
     """Test de compilación de un programa simple"""
     try:
@@ -341,12 +1419,9 @@ def test_compilacion_simple():
         dest_path = Path('codigos-bocetos/test_temp.txt')
         shutil.move(test_file, dest_path)
         
-        # Modificar archivo objetivo
-        modificar_archivo_objetivo('test_temp.txt')
-        
         # Ejecutar compilador
         resultado = subprocess.run([
-            sys.executable, 'compilador/sintactico.py', '--no-assembly', '--quiet'
+            sys.executable, 'compilador/sintactico.py', 'test_temp.txt', '--no-assembly', '--quiet', '--sin-cache'
         ], capture_output=True)
         
         # Limpiar
@@ -387,7 +1462,8 @@ def generar_documentacion():
         with open(tokens_path, 'w', encoding='utf-8') as f:
             f.write("# Tokens Generados\n\n")
             
-            for archivo in sorted(Path('salida-tokens').glob('*.txt')):
+            volcados = list(Path('salida-tokens').glob('*.txt')) + list(Path('salida-tokens').glob('*.jsonl'))
+            for archivo in sorted(volcados):
                 f.write(f"## {archivo.name}\n\n")
                 f.write("```\n")
                 f.write(archivo.read_text(encoding='utf-8')[:1000])  # Primeros 1000 chars
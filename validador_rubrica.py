@@ -87,36 +87,12 @@ class ValidadorRubrica:
             }
         }
     
-    def modificar_archivo_objetivo(self, nombre_archivo):
-        """Modifica el archivo objetivo en lexico.py"""
-        lexico_path = Path('compilador/lexico.py')
-        
-        if not lexico_path.exists():
-            return False
-        
-        with open(lexico_path, 'r', encoding='utf-8') as f:
-            contenido = f.read()
-        
-        lineas = contenido.split('\n')
-        for i, linea in enumerate(lineas):
-            if linea.strip().startswith("archivo = "):
-                lineas[i] = f"archivo = '{nombre_archivo}'"
-                break
-        
-        with open(lexico_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lineas))
-        
-        return True
-    
     def ejecutar_compilador(self, archivo):
         """Ejecuta el compilador con un archivo específico"""
         try:
-            if not self.modificar_archivo_objetivo(archivo):
-                return None, "No se pudo modificar archivo objetivo"
-            
             inicio = time.time()
             resultado = subprocess.run([
-                sys.executable, 'compilador/sintactico.py'
+                sys.executable, 'compilador/sintactico.py', archivo
             ], capture_output=True, text=True, cwd='.')
             tiempo = time.time() - inicio
             